@@ -4,7 +4,7 @@ AggregateRoot base class for Uno's DDD/event sourcing model.
 
 from __future__ import annotations
 
-from typing import TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import ConfigDict, PrivateAttr
 
@@ -15,6 +15,11 @@ from uno.events.deleted_event import DeletedEvent
 from uno.events.restored_event import RestoredEvent
 from uno.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from uno.logging.protocols import LoggerProtocol
+
 T_ID = TypeVar("T_ID")
 
 
@@ -25,6 +30,9 @@ class AggregateRoot(Entity[T_ID]):
     Aggregates are intentionally mutable to support event sourcing and transactional workflows.
     All state changes must be made via domain events and explicit mutation methods.
 
+    Events are applied by ``apply_<event_type>`` methods. Each subclass builds
+    a dispatch table of its handlers once, when the class is defined.
+
     Example:
         class MyAggregate(AggregateRoot[int]):
             ...
@@ -37,10 +45,30 @@ class AggregateRoot(Entity[T_ID]):
             ...
     """
 
-    _logger = get_logger(__name__)
+    _logger: ClassVar[LoggerProtocol] = get_logger(__name__)
+    # event_type -> apply_<event_type> handler, built per class
+    _event_handlers: ClassVar[dict[str, Callable[[Any, DomainEvent], None]]] = {}
     _events: list[DomainEvent] = PrivateAttr(default_factory=list)
     version: int = 0
     _is_deleted: bool = PrivateAttr(default=False)
+    # Version of the snapshot the aggregate was last loaded from or saved as
+    _snapshot_version: int = PrivateAttr(default=0)
+    # Private attributes that snapshots carry along with the model fields
+    _snapshot_private_attrs: ClassVar[tuple[str, ...]] = ("_is_deleted",)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._event_handlers = cls._build_event_handlers()
+
+    @classmethod
+    def _build_event_handlers(cls) -> dict[str, Callable[[Any, DomainEvent], None]]:
+        handlers = {}
+        for name in dir(cls):
+            if name.startswith("apply_") and name != "apply_event":
+                handler = getattr(cls, name, None)
+                if callable(handler):
+                    handlers[name.removeprefix("apply_")] = handler
+        return handlers
 
     @property
     def is_deleted(self) -> bool:
@@ -91,13 +119,18 @@ class AggregateRoot(Entity[T_ID]):
         self.version += 1
         self._logger.info(f"Event {event.event_type} added to aggregate {self.id}.")
 
-    def clear_events(self) -> None:
+    def clear_events(self) -> list[DomainEvent]:
+        """
+        Clears and returns the uncommitted domain events, in the order they were added.
+        """
+        events = list(self._events)
         self._events.clear()
+        return events
 
     def apply_event(self, event: DomainEvent) -> None:
-        handler_name = f"apply_{event.event_type}"
-        if hasattr(self, handler_name):
-            getattr(self, handler_name)(event)
+        handler = self._event_handlers.get(event.event_type)
+        if handler is not None:
+            handler(self, event)
         # Defensive: fallback if event_type string doesn't match
         elif isinstance(event, DeletedEvent):
             self.apply_deleted(event)
@@ -105,15 +138,27 @@ class AggregateRoot(Entity[T_ID]):
             self.apply_restored(event)
 
     def apply_deleted(self, event: DeletedEvent) -> None:
-        self._is_deleted = True
+        self.__pydantic_private__["_is_deleted"] = True
 
     def apply_restored(self, event: RestoredEvent) -> None:
-        self._is_deleted = False
+        self.__pydantic_private__["_is_deleted"] = False
 
     @classmethod
-    def from_events(cls, events: list[DomainEvent]) -> AggregateRoot:
+    def from_events(
+        cls, events: Sequence[DomainEvent], trusted: bool = False
+    ) -> AggregateRoot:
         """
         Rehydrates an aggregate from a list of events.
+
+        By default the aggregate is validated on construction. With
+        ``trusted=True`` (for events read back from an event store, which were
+        validated when written) it is built without validation and events go
+        straight through the dispatch table. Either way invariants are enforced
+        once, after the last event, so intermediate states may be inconsistent.
+
+        Args:
+            events: The aggregate's events, in stream order
+            trusted: Skip per-event validation
         Returns:
             The rehydrated aggregate instance.
         Raises:
@@ -122,16 +167,67 @@ class AggregateRoot(Entity[T_ID]):
         if not events:
             raise Exception(f"No events to rehydrate aggregate for {cls.__name__}.")
         try:
-            instance = cls(id=getattr(events[0], "aggregate_id", None))
-            for event in events:
-                instance.apply_event(event)
-                instance.version += 1
+            aggregate_id = getattr(events[0], "aggregate_id", None)
+            if trusted:
+                instance = cls.model_construct(id=aggregate_id)
+                cls._replay(instance, events)
+            else:
+                instance = cls(id=aggregate_id)
+                for event in events:
+                    instance.apply_event(event)
+                    instance.version += 1
+                instance.enforce_invariants()
             return instance
         except Exception as exc:
             raise Exception(
                 f"Error rehydrating aggregate {cls.__name__} from events: {exc}"
             )
 
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: AggregateRoot, events: Sequence[DomainEvent]
+    ) -> AggregateRoot:
+        """
+        Brings a snapshot up to date with the events stored after it.
+
+        The events are trusted (see ``from_events``) and applied to the
+        snapshot in place; the snapshot's version is kept as
+        ``_snapshot_version``.
+
+        Args:
+            snapshot: The aggregate as of its snapshot version
+            events: The events after the snapshot version, in stream order
+        Returns:
+            The rehydrated aggregate instance.
+        Raises:
+            Exception: If rehydration fails.
+        """
+        snapshot.__pydantic_private__["_snapshot_version"] = snapshot.version
+        if not events:
+            return snapshot
+        try:
+            cls._replay(snapshot, events)
+            return snapshot
+        except Exception as exc:
+            raise Exception(
+                f"Error rehydrating aggregate {cls.__name__} from snapshot: {exc}"
+            ) from exc
+
+    @classmethod
+    def _replay(cls, instance: AggregateRoot, events: Sequence[DomainEvent]) -> None:
+        """Apply trusted events to ``instance`` and bump its version once."""
+        handlers = cls._event_handlers
+        apply_event = instance.apply_event
+        for event in events:
+            handler = handlers.get(event.event_type)
+            if handler is not None:
+                handler(instance, event)
+            else:
+                apply_event(event)
+        instance.__dict__["version"] += len(events)
+        instance.__pydantic_fields_set__.add("version")
+        instance.enforce_invariants()
+
     def assert_not_deleted(self) -> None:
         """
         Ensures the aggregate is not deleted.
@@ -145,3 +241,6 @@ class AggregateRoot(Entity[T_ID]):
             )
 
     model_config = ConfigDict(frozen=False, extra="forbid")
+
+
+AggregateRoot._event_handlers = AggregateRoot._build_event_handlers()
@@ -39,4 +39,10 @@ class DomainConfig(UnoSettings):
         env="UNO_DOMAIN_OPTIMISTIC_CONCURRENCY",
     )
 
+    max_concurrency_retries: int = Field(
+        3,
+        description="Attempts made by execute_with_retry before a concurrency conflict is raised",
+        env="UNO_DOMAIN_MAX_CONCURRENCY_RETRIES",
+    )
+
     model_config = {"env_prefix": "UNO_DOMAIN_"}
@@ -3,13 +3,16 @@ Entity base class for Uno's DDD model.
 """
 
 from __future__ import annotations
-from typing import Any, Generic, TypeVar, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, Self
 from uno.base_model import FrameworkBaseModel
 from pydantic import Field, ConfigDict, model_validator
 import time
 from uno.errors import DomainValidationError
 from uno.logging import get_logger
 
+if TYPE_CHECKING:
+    from uno.logging.protocols import LoggerProtocol
+
 T_ID = TypeVar("T_ID")
 
 
@@ -49,7 +52,7 @@ class Entity(FrameworkBaseModel, Generic[T_ID]):
 
     model_config = ConfigDict(frozen=True, extra="forbid")
 
-    _logger = get_logger(__name__)
+    _logger: ClassVar[LoggerProtocol] = get_logger(__name__)
 
     def __eq__(self, other: Any) -> bool:
         """
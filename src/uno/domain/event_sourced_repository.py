@@ -5,15 +5,25 @@ This module provides a generic, DI-ready repository that persists and rehydrates
 using the event sourcing pattern. Integrates with Uno's DI, logging, error, and config systems.
 """
 
-from typing import Generic, TypeVar
+import inspect
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Generic, TypeVar
 
 from uno.domain.aggregate import AggregateRoot
 from uno.domain.config import DomainConfig
 from uno.domain.repository import Repository
 from uno.errors.base import UnoError
 from uno.events.deleted_event import DeletedEvent
+from uno.events.errors import ConcurrencyConflictError
 from uno.events.event_store import EventStoreProtocol
 from uno.events.publisher import EventPublisherProtocol
+from uno.events.snapshots import (
+    EventCountSnapshotStrategy,
+    SnapshotStore,
+    SnapshotStrategy,
+    SnapshotWorker,
+)
 from uno.logging.protocols import LoggerProtocol
 
 T = TypeVar("T", bound=AggregateRoot)
@@ -25,15 +35,28 @@ class EventSourcedRepository(Generic[T], Repository[T]):
 
     Loads aggregates by replaying events from the event store, and saves aggregates
     by persisting new events and publishing them via the event bus/publisher.
+
+    With a snapshot store, ``get_by_id`` starts from the latest snapshot and
+    replays only the events after it, and ``add`` writes a new snapshot when
+    the snapshot strategy asks for one (by default, every
+    ``config.snapshot_frequency`` events), so load time is bounded by the
+    snapshot interval rather than the stream length. With a snapshot worker,
+    ``add`` only hands the worker a hint and the snapshot is written in the
+    background.
     """
 
-    def __init__(
+    # The snapshot collaborators are optional and keyword-only
+    def __init__(  # noqa: PLR0913
         self,
         aggregate_type: type[T],
         event_store: EventStoreProtocol,
         event_publisher: EventPublisherProtocol,
         logger: LoggerProtocol,
         config: DomainConfig,
+        *,
+        snapshot_store: SnapshotStore | None = None,
+        snapshot_strategy: SnapshotStrategy | None = None,
+        snapshot_worker: SnapshotWorker | None = None,
     ):
         """
         Initialize the repository.
@@ -44,12 +67,24 @@ class EventSourcedRepository(Generic[T], Repository[T]):
             event_publisher: The event publisher/bus
             logger: LoggerProtocol for structured logging
             config: Domain configuration settings
+            snapshot_store: Snapshot store used to shorten replays (optional)
+            snapshot_strategy: Decides when ``add`` writes a snapshot (defaults
+                to one every ``config.snapshot_frequency`` events)
+            snapshot_worker: Background writer for snapshots (optional; its
+                snapshot store is used for loads if none is given)
         """
         self.aggregate_type = aggregate_type
         self.event_store = event_store
         self.event_publisher = event_publisher
         self.logger = logger
         self.config = config
+        self.snapshot_store = snapshot_store or (
+            snapshot_worker.snapshot_store if snapshot_worker is not None else None
+        )
+        self.snapshot_worker = snapshot_worker
+        self.snapshot_strategy = snapshot_strategy or EventCountSnapshotStrategy(
+            config.snapshot_frequency
+        )
 
     async def get_by_id(self, id: str) -> T | None:
         """
@@ -71,9 +106,18 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                 aggregate_type=self.aggregate_type.__name__,
             )
 
-            events = await self.event_store.get_events_by_aggregate_id(id)
+            snapshot = await self._load_snapshot(id)
+            if snapshot is None:
+                result = await self.event_store.get_events_by_aggregate_id(id)
+            else:
+                result = await self.event_store.get_stream_range(
+                    id, after_version=snapshot.version
+                )
+            if result.is_failure:
+                raise result.error
+            events = result.value
 
-            if not events:
+            if snapshot is None and not events:
                 self.logger.info(
                     "Aggregate not found",
                     aggregate_id=id,
@@ -81,7 +125,7 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                 )
                 return None
 
-            # Check against max events limit from config
+            # Check the replay length against max events limit from config
             if len(events) > self.config.max_events_per_aggregate:
                 self.logger.warning(
                     "Aggregate has exceeded maximum event count",
@@ -91,12 +135,13 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                     max_events=self.config.max_events_per_aggregate,
                 )
 
-            aggregate = self.aggregate_type.from_events(events)
+            aggregate = self._rehydrate(id, snapshot, events)
 
             self.logger.debug(
                 "Aggregate loaded successfully",
                 aggregate_id=id,
                 aggregate_type=self.aggregate_type.__name__,
+                snapshot_version=snapshot.version if snapshot is not None else 0,
                 event_count=len(events),
             )
 
@@ -119,6 +164,180 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                 aggregate_type=self.aggregate_type.__name__,
             ) from exc
 
+    async def _load_snapshot(
+        self,
+        id: str,
+        max_version: int | None = None,
+        max_timestamp: float | None = None,
+    ) -> T | None:
+        """Fetch the latest snapshot within the bounds, or None (also on failure)."""
+        if self.snapshot_store is None:
+            return None
+        result = await self.snapshot_store.get_snapshot(
+            id,
+            self.aggregate_type,
+            max_version=max_version,
+            max_timestamp=max_timestamp,
+        )
+        if result.is_failure:
+            # Snapshots only shorten the replay; fall back to the full stream
+            self.logger.warning(
+                "Failed to load snapshot, replaying from the start",
+                aggregate_id=id,
+                aggregate_type=self.aggregate_type.__name__,
+                error=str(result.error),
+            )
+            return None
+        return result.value
+
+    def _rehydrate(self, id: str, snapshot: T | None, events: Sequence[Any]) -> T:
+        """
+        Rebuild an aggregate from a snapshot (if any) and the events after it.
+
+        The replay time is reported to snapshot strategies that measure it
+        (``record_replay``, see AdaptiveSnapshotStrategy).
+        """
+        start = time.perf_counter()
+        if snapshot is not None:
+            aggregate = self.aggregate_type.from_snapshot(snapshot, events)
+        else:
+            aggregate = self.aggregate_type.from_events(events, trusted=True)
+        record_replay = getattr(self.snapshot_strategy, "record_replay", None)
+        if record_replay is not None:
+            record_replay(
+                id,
+                self.aggregate_type.__name__,
+                len(events),
+                time.perf_counter() - start,
+            )
+        return aggregate
+
+    async def get_as_of(
+        self, id: str, version: int | None = None, timestamp: float | None = None
+    ) -> T | None:
+        """
+        Reconstruct an aggregate as it was at a past version or point in time.
+
+        Starts from the closest snapshot at or before the target (if a snapshot
+        store is configured) and replays only the events between the snapshot
+        and the target, read in one bounded query.
+
+        Args:
+            id: The ID of the aggregate to load
+            version: Stream version to stop at (inclusive)
+            timestamp: Point in time to stop at (epoch seconds; events stored
+                at or before it are applied)
+
+        Returns:
+            The aggregate as of the target, or None if it had no events by then.
+
+        Raises:
+            UnoError: If an error occurs while loading events.
+        """
+        if version is None and timestamp is None:
+            return await self.get_by_id(id)
+
+        try:
+            snapshot = await self._load_snapshot(id, version, timestamp)
+            snapshot_version = snapshot.version if snapshot is not None else 0
+            result = await self.event_store.get_stream_range(
+                id,
+                after_version=snapshot_version,
+                to_version=version,
+                to_timestamp=timestamp,
+            )
+            if result.is_failure:
+                raise result.error
+            events = result.value
+
+            if snapshot is None and not events:
+                return None
+            aggregate = self._rehydrate(id, snapshot, events)
+
+            self.logger.debug(
+                "Aggregate reconstructed",
+                aggregate_id=id,
+                aggregate_type=self.aggregate_type.__name__,
+                target_version=version,
+                target_timestamp=timestamp,
+                snapshot_version=snapshot_version,
+                event_count=len(events),
+            )
+
+            return aggregate
+        except Exception as exc:
+            self.logger.error(
+                "Failed to reconstruct aggregate",
+                aggregate_id=id,
+                aggregate_type=self.aggregate_type.__name__,
+                error=str(exc),
+                exc_info=exc,
+            )
+            if isinstance(exc, UnoError):
+                raise
+            raise UnoError(
+                message=f"Failed to load aggregate {id} as of "
+                f"version={version}, timestamp={timestamp}: {exc}",
+                error_code="DOMAIN_REPOSITORY_LOAD_ERROR",
+                category="DOMAIN",
+                aggregate_id=id,
+                aggregate_type=self.aggregate_type.__name__,
+            ) from exc
+
+    async def get_many(self, ids: Sequence[str]) -> dict[str, T]:
+        """
+        Load several aggregates by ID, fetching all their event streams at once.
+
+        Args:
+            ids: The IDs of the aggregates to load
+
+        Returns:
+            A dict mapping each found ID to its aggregate; IDs with no events
+            are left out.
+
+        Raises:
+            UnoError: If an error occurs while loading events.
+        """
+        try:
+            self.logger.info(
+                "Loading aggregates",
+                aggregate_type=self.aggregate_type.__name__,
+                count=len(ids),
+            )
+
+            result = await self.event_store.get_events_for_aggregates(ids)
+            if result.is_failure:
+                raise result.error
+
+            aggregates = {
+                aggregate_id: self._rehydrate(aggregate_id, None, events)
+                for aggregate_id, events in result.value.items()
+            }
+
+            self.logger.debug(
+                "Aggregates loaded successfully",
+                aggregate_type=self.aggregate_type.__name__,
+                requested=len(ids),
+                found=len(aggregates),
+            )
+
+            return aggregates
+        except Exception as exc:
+            self.logger.error(
+                "Failed to load aggregates",
+                aggregate_type=self.aggregate_type.__name__,
+                error=str(exc),
+                exc_info=exc,
+            )
+            if isinstance(exc, UnoError):
+                raise
+            raise UnoError(
+                message=f"Failed to load {len(ids)} aggregates: {exc}",
+                error_code="DOMAIN_REPOSITORY_LOAD_ERROR",
+                category="DOMAIN",
+                aggregate_type=self.aggregate_type.__name__,
+            ) from exc
+
     async def list(self) -> list[T]:
         """
         List all aggregates of this type (inefficient; for demo/testing only).
@@ -143,7 +362,8 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                 aggregates.setdefault(event.aggregate_id, []).append(event)
 
             result = [
-                self.aggregate_type.from_events(evts) for evts in aggregates.values()
+                self.aggregate_type.from_events(evts, trusted=True)
+                for evts in aggregates.values()
             ]
 
             self.logger.info(
@@ -173,10 +393,15 @@ class EventSourcedRepository(Generic[T], Repository[T]):
         """
         Persist new events from the aggregate and publish them.
 
+        With optimistic concurrency enabled, the append only succeeds if the
+        stored stream is still at the version the aggregate was loaded at.
+
         Args:
             entity: The aggregate to persist
 
         Raises:
+            ConcurrencyConflictError: If another writer appended to the stream
+                first.
             UnoError: If an error occurs while saving or publishing events.
         """
         try:
@@ -199,9 +424,25 @@ class EventSourcedRepository(Generic[T], Repository[T]):
 
             for event in new_events:
                 event.set_event_hash()
-                await self.event_store.save_event(event)
+
+            expected_version = (
+                entity.version - len(new_events)
+                if self.config.optimistic_concurrency
+                else None
+            )
+
+            # One batched append per aggregate commit
+            result = await self.event_store.save_events(
+                new_events, expected_version=expected_version
+            )
+            if result.is_failure:
+                raise result.error
+
+            for event in new_events:
                 await self.event_publisher.publish(event)
 
+            await self._maybe_snapshot(entity)
+
             self.logger.info(
                 "Aggregate persisted successfully",
                 aggregate_id=entity.id,
@@ -226,6 +467,105 @@ class EventSourcedRepository(Generic[T], Repository[T]):
                 aggregate_type=self.aggregate_type.__name__,
             ) from exc
 
+    async def _maybe_snapshot(self, entity: T) -> None:
+        """
+        Write a snapshot of a just-persisted aggregate if the strategy asks for
+        one, or hint the snapshot worker to write it.
+
+        A failed snapshot write is logged and otherwise ignored: the events
+        are already stored, and the next save will try again.
+        """
+        if self.snapshot_store is None:
+            return
+        events_since_snapshot = entity.version - entity._snapshot_version
+        if not await self.snapshot_strategy.should_snapshot(
+            str(entity.id), events_since_snapshot
+        ):
+            return
+        if self.snapshot_worker is not None:
+            if self.snapshot_worker.offer(
+                self.aggregate_type, str(entity.id), entity.version
+            ):
+                entity._snapshot_version = entity.version
+            return
+        result = await self.snapshot_store.save_snapshot(entity)
+        if result.is_failure:
+            self.logger.warning(
+                "Failed to save snapshot",
+                aggregate_id=entity.id,
+                aggregate_type=self.aggregate_type.__name__,
+                version=entity.version,
+                error=str(result.error),
+            )
+            return
+        entity._snapshot_version = entity.version
+        self.logger.debug(
+            "Snapshot saved",
+            aggregate_id=entity.id,
+            aggregate_type=self.aggregate_type.__name__,
+            version=entity.version,
+        )
+
+    async def execute_with_retry(
+        self,
+        id: str,
+        command: Callable[[T], Awaitable[Any] | Any],
+        max_attempts: int | None = None,
+    ) -> T:
+        """
+        Load an aggregate, apply a command to it and persist the result,
+        retrying on concurrency conflicts.
+
+        On a ConcurrencyConflictError the aggregate is reloaded from the store
+        and the command is applied again to the fresh state, so the command must
+        only act on the aggregate it is given.
+
+        Args:
+            id: The ID of the aggregate to load
+            command: Callable (sync or async) that records events on the aggregate
+            max_attempts: Attempts before giving up (defaults to
+                ``config.max_concurrency_retries``)
+
+        Returns:
+            The persisted aggregate.
+
+        Raises:
+            ConcurrencyConflictError: If every attempt conflicted with another
+                writer.
+            UnoError: If the aggregate does not exist or cannot be loaded or saved.
+        """
+        attempts = max_attempts or self.config.max_concurrency_retries
+        attempt = 1
+        while True:
+            aggregate = await self.get_by_id(id)
+            if aggregate is None:
+                raise UnoError(
+                    message=f"Aggregate {id} not found",
+                    error_code="DOMAIN_REPOSITORY_NOT_FOUND",
+                    category="DOMAIN",
+                    aggregate_id=id,
+                    aggregate_type=self.aggregate_type.__name__,
+                )
+
+            outcome = command(aggregate)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+            try:
+                await self.add(aggregate)
+                return aggregate
+            except ConcurrencyConflictError:
+                if attempt >= attempts:
+                    raise
+                self.logger.info(
+                    "Concurrency conflict, retrying command",
+                    aggregate_id=id,
+                    aggregate_type=self.aggregate_type.__name__,
+                    attempt=attempt,
+                    max_attempts=attempts,
+                )
+                attempt += 1
+
     async def remove(self, id: str) -> None:
         """
         Remove an aggregate by ID (soft delete pattern: emit a Deleted event).
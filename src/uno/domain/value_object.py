@@ -4,12 +4,15 @@ Value object base class for Uno's DDD model.
 
 from __future__ import annotations
 
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from uno.base_model import FrameworkBaseModel
 from uno.errors import DomainValidationError
 from uno.logging import get_logger
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import Field, ConfigDict, PrivateAttr, model_validator
+
+if TYPE_CHECKING:
+    from uno.logging.protocols import LoggerProtocol
 
 
 class ValueObject(FrameworkBaseModel):
@@ -38,7 +41,11 @@ class ValueObject(FrameworkBaseModel):
     """
 
     model_config = ConfigDict(frozen=True, extra="forbid")
-    _logger = get_logger(__name__)
+    _logger: ClassVar[LoggerProtocol] = get_logger(__name__)
+    # Canonical key (and its hash), computed on first comparison or hash;
+    # value objects are frozen, so they never go stale
+    _canonical_key: tuple[tuple[str, Any], ...] | None = PrivateAttr(default=None)
+    _canonical_hash: int | None = PrivateAttr(default=None)
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -61,24 +68,69 @@ class ValueObject(FrameworkBaseModel):
             cls._logger.error(f"Failed to create {cls.__name__} from dict: {exc}")
             raise DomainValidationError(f"Validation failed for {cls.__name__}: {exc}")
 
+    def canonical_key(self) -> tuple[tuple[str, Any], ...]:
+        """
+        The canonical serialization as a sorted tuple of (field, value) pairs,
+        with nested dicts and lists frozen so the key is hashable.
+        Computed once per instance.
+        """
+        # Read the private slot directly; BaseModel.__getattr__ is slower than
+        # the comparison the cache is meant to speed up
+        private = self.__pydantic_private__
+        key = private["_canonical_key"]
+        if key is None:
+            key = tuple(
+                sorted(
+                    (name, _freeze(value))
+                    for name, value in self.model_dump(
+                        exclude_none=True, exclude_unset=True, by_alias=True
+                    ).items()
+                )
+            )
+            private["_canonical_key"] = key
+        return key
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.__pydantic_private__["_canonical_key"] = None
+            copied.__pydantic_private__["_canonical_hash"] = None
+        return copied
+
     def __eq__(self, other: Any) -> bool:
         """
         Value objects are equal if their canonical serialization is equal and type matches.
         """
-        return isinstance(other, ValueObject) and self.model_dump(
-            exclude_none=True, exclude_unset=True, by_alias=True
-        ) == other.model_dump(exclude_none=True, exclude_unset=True, by_alias=True)
+        if self is other:
+            return True
+        if not isinstance(other, ValueObject):
+            return False
+        self_hash = self.__pydantic_private__["_canonical_hash"]
+        other_hash = other.__pydantic_private__["_canonical_hash"]
+        if self_hash is not None and other_hash is not None and self_hash != other_hash:
+            return False
+        return self.canonical_key() == other.canonical_key()
 
     def __hash__(self) -> int:
         """
         Hash is based on the canonical serialization contract (Uno standard).
         """
-        return hash(
-            tuple(
-                sorted(
-                    self.model_dump(
-                        exclude_none=True, exclude_unset=True, by_alias=True
-                    ).items()
-                )
-            )
-        )
+        private = self.__pydantic_private__
+        value = private["_canonical_hash"]
+        if value is None:
+            value = hash(self.canonical_key())
+            private["_canonical_hash"] = value
+        return value
+
+
+def _freeze(value: Any) -> Any:
+    """Convert dumped dicts and lists into hashable equivalents."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
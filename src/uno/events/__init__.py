@@ -5,6 +5,7 @@
 # Event sourcing core
 from .base_event import DomainEvent
 from .bus import EventBus, EventBusProtocol
+from .envelope import EventEnvelope
 from .event_store import EventStore, InMemoryEventStore
 from .factory import get_event_bus, get_event_publisher, get_event_store
 
@@ -50,6 +51,7 @@ __all__ = [
     "DomainEvent",
     "EventBus",
     "EventBusProtocol",
+    "EventEnvelope",
     "EventHandler",
     "EventHandlerContext",
     "EventHandlerDecorator",
@@ -0,0 +1,272 @@
+"""
+Cold-stream archival for the PostgreSQL event store.
+
+Streams that have not been appended to for a while are moved out of the hot
+``events`` table into ``events_archive``: one row per aggregate holding the whole
+stream as a compressed msgpack segment, plus a few header columns. The archive
+primary key doubles as the tombstone index the store checks on reads and
+appends, so the hot table (and its indexes) only holds live streams.
+
+Archived streams stay readable through the store's per-aggregate reads, and are
+promoted back into the hot table, with their original global positions, as
+soon as they receive a new append. Global scans (``get_events``,
+``stream_events``) cover the hot table only.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import msgspec
+from sqlalchemy import (
+    ARRAY,
+    Column,
+    DateTime,
+    Integer,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    Text,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+
+from uno.events.codecs import Compression, PayloadCodec, compress, decompress
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Rows per INSERT when promoting a stream back into the hot table
+RESTORE_BATCH_SIZE = 1000
+
+_segment_encoder = msgspec.msgpack.Encoder()
+_json_decoder = msgspec.json.Decoder()
+
+
+class ArchivedRow(NamedTuple):
+    """A stored event row, as kept in an archive segment."""
+
+    id: str
+    global_position: int
+    aggregate_id: str
+    event_type: str
+    version: int
+    event_version: int
+    codec: int
+    payload: str | None
+    payload_bin: bytes | None
+    created_at: datetime
+    event_hash: str
+    event_type_id: int | None = None
+
+
+_segment_decoder = msgspec.msgpack.Decoder(list[ArchivedRow])
+
+
+class PostgresEventArchive:
+    """
+    Archive tier for PostgresEventStore.
+
+    Usage:
+        store = PostgresEventStore(
+            config, connection_manager, logger, archive=PostgresEventArchive()
+        )
+        await store.archive_cold_streams(inactive_for=timedelta(days=30))
+
+    Args:
+        compression: Compression used for new segments
+        table_name: Name of the archive table
+    """
+
+    def __init__(
+        self, compression: Compression = "zlib", table_name: str = "events_archive"
+    ) -> None:
+        self.compression = compression
+        self.metadata = MetaData()
+        self.table = Table(
+            table_name,
+            self.metadata,
+            Column("aggregate_id", String, primary_key=True),
+            Column("last_version", Integer, nullable=False),
+            Column("event_count", Integer, nullable=False),
+            Column("last_appended_at", DateTime(timezone=True), nullable=False),
+            Column("archived_at", DateTime(timezone=True), nullable=False),
+            Column("compression", String(8), nullable=False),
+            Column("segment", LargeBinary, nullable=False),
+        )
+
+    def pack(self, rows: list[ArchivedRow]) -> bytes:
+        """Encode and compress a stream's rows into a segment."""
+        return compress(self.compression, _segment_encoder.encode(rows))
+
+    @staticmethod
+    def unpack(compression: Compression, segment: bytes) -> list[ArchivedRow]:
+        """Decode a segment back into its rows, in stream order."""
+        return _segment_decoder.decode(decompress(compression, segment))
+
+    @staticmethod
+    def _select_rows(events: Table) -> Any:
+        c = events.c
+        return select(
+            c.id,
+            c.global_position,
+            c.aggregate_id,
+            c.event_type,
+            c.version,
+            c.event_version,
+            c.codec,
+            cast(c.payload, Text).label("payload"),
+            c.payload_bin,
+            c.created_at,
+            c.event_hash,
+            c.event_type_id,
+        )
+
+    async def load(
+        self, session: AsyncSession, aggregate_ids: Collection[str]
+    ) -> dict[str, list[ArchivedRow]]:
+        """Return the archived rows of any of the given aggregates that are archived."""
+        if not aggregate_ids:
+            return {}
+        result = await session.execute(
+            select(
+                self.table.c.aggregate_id,
+                self.table.c.compression,
+                self.table.c.segment,
+            ).where(self.table.c.aggregate_id == any_(_ids_param(aggregate_ids)))
+        )
+        return {
+            row.aggregate_id: self.unpack(row.compression, row.segment)
+            for row in result
+        }
+
+    async def archive(
+        self,
+        session: AsyncSession,
+        events: Table,
+        inactive_for: timedelta,
+        limit: int,
+    ) -> int:
+        """
+        Move up to ``limit`` streams with no appends in ``inactive_for`` out of
+        the hot table. Returns the number of streams archived.
+        """
+        cutoff = datetime.now(UTC) - inactive_for
+        result = await session.execute(
+            select(events.c.aggregate_id)
+            .group_by(events.c.aggregate_id)
+            .having(func.max(events.c.created_at) < cutoff)
+            .limit(limit)
+        )
+        aggregate_ids = list(result.scalars())
+        if not aggregate_ids:
+            return 0
+
+        # Lock the rows being moved; appends that race with us land in the hot
+        # table and are merged with the segment on read
+        result = await session.execute(
+            self._select_rows(events)
+            .where(events.c.aggregate_id == any_(_ids_param(aggregate_ids)))
+            .order_by(events.c.aggregate_id, events.c.version)
+            .with_for_update()
+        )
+        streams: dict[str, list[ArchivedRow]] = {}
+        for row in result:
+            streams.setdefault(row.aggregate_id, []).append(ArchivedRow(*row))
+
+        # A stream archived before may have been appended to without promotion
+        for aggregate_id, archived in (await self.load(session, streams)).items():
+            streams[aggregate_id] = archived + streams[aggregate_id]
+
+        archived_at = datetime.now(UTC)
+        values = [
+            {
+                "aggregate_id": aggregate_id,
+                "last_version": rows[-1].version,
+                "event_count": len(rows),
+                "last_appended_at": rows[-1].created_at,
+                "archived_at": archived_at,
+                "compression": self.compression,
+                "segment": self.pack(rows),
+            }
+            for aggregate_id, rows in streams.items()
+        ]
+        stmt = insert(self.table).values(values)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["aggregate_id"],
+                set_={
+                    name: stmt.excluded[name]
+                    for name in (
+                        "last_version",
+                        "event_count",
+                        "last_appended_at",
+                        "archived_at",
+                        "compression",
+                        "segment",
+                    )
+                },
+            )
+        )
+        await session.execute(
+            delete(events).where(
+                events.c.id
+                == any_(
+                    _ids_param(
+                        [row.id for rows in streams.values() for row in rows],
+                        "event_ids",
+                    )
+                )
+            )
+        )
+        return len(streams)
+
+    async def promote(
+        self, session: AsyncSession, events: Table, aggregate_ids: Collection[str]
+    ) -> int:
+        """
+        Move any archived streams among ``aggregate_ids`` back into the hot table,
+        keeping their global positions. Returns the number of streams promoted.
+        """
+        if not aggregate_ids:
+            return 0
+        result = await session.execute(
+            delete(self.table)
+            .where(self.table.c.aggregate_id == any_(_ids_param(aggregate_ids)))
+            .returning(self.table.c.compression, self.table.c.segment)
+        )
+        segments = result.all()
+        if not segments:
+            return 0
+
+        rows = [
+            {
+                **row._asdict(),
+                "payload": _json_decoder.decode(row.payload)
+                if row.codec == PayloadCodec.JSON
+                else None,
+            }
+            for compression, segment in segments
+            for row in self.unpack(compression, segment)
+        ]
+        for offset in range(0, len(rows), RESTORE_BATCH_SIZE):
+            await session.execute(
+                insert(events)
+                .values(rows[offset : offset + RESTORE_BATCH_SIZE])
+                .on_conflict_do_nothing()
+            )
+        return len(segments)
+
+
+def _ids_param(ids: Iterable[str], name: str = "aggregate_ids") -> Any:
+    """Bind a list of IDs as a single array parameter."""
+    return bindparam(name, list(ids), type_=ARRAY(String))
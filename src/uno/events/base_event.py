@@ -5,19 +5,20 @@ All domain/integration events should inherit from this class.
 
 from __future__ import annotations
 
-import logging
-import uuid
-import time
+import hashlib
 import json
+import time
 import decimal
 import enum
 from enum import Enum
 from typing import TYPE_CHECKING, Any, ClassVar, Self
 
+import msgspec
 from uno.base_model import FrameworkBaseModel
-from pydantic import Field, ConfigDict, model_validator
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 
 from uno.errors.result import Failure, Success
+from uno.events.ids import EventIdKind, new_event_id, new_event_ids
 from uno.logging import get_logger
 
 # NOTE: Strict DI mode: All dependencies must be passed explicitly. Do not use service locator patterns.
@@ -25,8 +26,9 @@ from uno.services.hash_service_protocol import HashServiceProtocol
 
 if TYPE_CHECKING:
     import collections.abc
-    from uno.errors.result import Failure as FailureType, Success as SuccessType
-    from uno.services.default_hash_service import DefaultHashService
+    from collections.abc import Iterable, Mapping
+
+    from uno.logging.protocols import LoggerProtocol
 
 
 def uno_json_encoder(obj: Any) -> Any:
@@ -49,10 +51,48 @@ def uno_json_encoder(obj: Any) -> Any:
     )
 
 
+# Encoder for canonical event bytes: compact, key-sorted JSON. Types msgspec
+# does not handle natively fall back to uno_json_encoder.
+_canonical_encoder = msgspec.json.Encoder(
+    enc_hook=uno_json_encoder, order="sorted", decimal_format="number"
+)
+
+
+# Format of the event hash input, recorded on every event hashed since it was
+# versioned. Events without a hash_version were hashed over json.dumps() of
+# their dict in field order (event_hash excluded) and are verified that way.
+HASH_VERSION = 2
+
+
+def event_hash_input(data: dict[str, Any]) -> bytes:
+    """
+    The bytes an event hash covers, for a canonical event dict, in the format
+    named by its ``hash_version`` (the legacy format if it has none).
+    Any event_hash the dict holds is ignored.
+    """
+    if "event_hash" in data:
+        data = {key: value for key, value in data.items() if key != "event_hash"}
+    if data.get("hash_version") is None:
+        return json.dumps(data, default=uno_json_encoder).encode()
+    return _canonical_encoder.encode(data)
+
+
+def compute_canonical_hash(data: dict[str, Any]) -> str:
+    """
+    SHA-256 event hash of a canonical event dict, ignoring any event_hash it holds.
+
+    This is the hash set_event_hash() assigns when no hash service is given.
+    """
+    return hashlib.sha256(event_hash_input(data)).hexdigest()
+
+
 class DomainEvent(FrameworkBaseModel):
     # --- Event class registry for dynamic resolution ---
     _event_class_registry: ClassVar[dict[str, type["DomainEvent"]]] = {}
-    _logger = get_logger(__name__)
+    # ClassVar so pydantic does not treat the logger as a per-instance private attribute
+    _logger: ClassVar[LoggerProtocol] = get_logger(__name__)
+    # Per-class field layout used by build_many(), computed on first use
+    _build_layouts: ClassVar[dict[type[DomainEvent], _BuildLayout]] = {}
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -97,7 +137,8 @@ class DomainEvent(FrameworkBaseModel):
 
     version: int = 1
     __version__: ClassVar[int] = 1
-    event_id: str = Field(default_factory=lambda: "evt_" + uuid.uuid4().hex)
+    # Strategy (uuid4, ulid or uuid7) set with uno.events.ids.set_event_id_strategy
+    event_id: str = Field(default_factory=new_event_id)
     event_type: ClassVar[str] = "domain_event"
     timestamp: float = Field(default_factory=lambda: time.time())
     correlation_id: str | None = None
@@ -105,6 +146,13 @@ class DomainEvent(FrameworkBaseModel):
     metadata: dict[str, Any] = {}
     previous_hash: str | None = None
     event_hash: str = Field(default_factory=lambda: "")
+    # Hash input format (HASH_VERSION); None for events hashed before it was recorded
+    hash_version: int | None = None
+    _global_position: int | None = PrivateAttr(default=None)
+    # Memoized canonical serialization; the event is frozen, so these only
+    # change when set_event_hash() sets the hash
+    _canonical_dict: dict[str, Any] | None = PrivateAttr(default=None)
+    _canonical_bytes: bytes | None = PrivateAttr(default=None)
 
     model_config = ConfigDict(
         frozen=True,
@@ -112,26 +160,177 @@ class DomainEvent(FrameworkBaseModel):
         validate_assignment=True,
     )
 
+    @property
+    def global_position(self) -> int | None:
+        """
+        Store-assigned position of this event across all streams.
+        None until the event has been appended to, or read back from, an event store.
+        Not part of the canonical serialization or the event hash.
+        """
+        return self._global_position
+
+    def __eq__(self, other: Any) -> bool:
+        # Compare fields only: private state (caches, store position) is not
+        # part of an event's identity
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __hash__(self) -> int:
+        # Equal events share an event_id; payload fields may be unhashable
+        return hash((type(self), self.event_id))
+
+    def canonical_dict(self) -> dict[str, Any]:
+        """
+        Canonical dict for storage, logging and transport, computed once per event.
+        Same as to_dict(); the returned dict is shared and must not be mutated.
+        """
+        # Read the private slot directly: attribute access to private attributes
+        # goes through BaseModel.__getattr__ and costs more than the cache saves
+        private = self.__pydantic_private__
+        if private["_canonical_dict"] is None:
+            private["_canonical_dict"] = self.to_dict()
+        return private["_canonical_dict"]
+
+    def canonical_bytes(self) -> bytes:
+        """
+        Canonical JSON encoding (compact, keys sorted) of canonical_dict(),
+        computed once per event. This is the input to the event hash.
+        """
+        private = self.__pydantic_private__
+        if private["_canonical_bytes"] is None:
+            private["_canonical_bytes"] = _canonical_encoder.encode(
+                self.canonical_dict()
+            )
+        return private["_canonical_bytes"]
+
+    def _reset_canonical_cache(self) -> None:
+        self._canonical_dict = None
+        self._canonical_bytes = None
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._reset_canonical_cache()
+        return copied
+
+    def compute_event_hash(self, hash_service: HashServiceProtocol | None = None) -> str:
+        """
+        Compute the event hash over the canonical encoding, excluding event_hash
+        itself, so the result is the same before and after the hash is set.
+
+        Events hashed in an earlier format (see ``hash_version``) are hashed in
+        that format, so their stored hashes still verify; events not hashed yet
+        are hashed in the current one, as set_event_hash() will.
+        If no hash_service is given, falls back to sha256.
+        """
+        data = self.canonical_dict()
+        if self.hash_version is not None and "event_hash" not in data:
+            payload_json = self.canonical_bytes()
+        else:
+            if self.hash_version is None and not self.event_hash:
+                data = {**data, "hash_version": HASH_VERSION}
+            payload_json = event_hash_input(data)
+        if hash_service is None:
+            return hashlib.sha256(payload_json).hexdigest()
+        return hash_service.compute_hash(payload_json.decode())
+
     def set_event_hash(self, hash_service: HashServiceProtocol | None = None) -> None:
         """
         Compute and set the event_hash field using the provided hash_service.
         If no hash_service is given, falls back to sha256.
         This method must be called explicitly after event creation.
         """
-        payload = self.model_dump(exclude_none=True, exclude_unset=True, by_alias=True)
-        payload_json = json.dumps(payload, default=uno_json_encoder)
+        # Events are frozen; the hash (and its format) are the fields set after creation
+        object.__setattr__(self, "hash_version", HASH_VERSION)
+        self.__pydantic_fields_set__.add("hash_version")
+        self._reset_canonical_cache()
         try:
-            if hash_service is not None:
-                self.event_hash = hash_service.compute_hash(payload_json)
-            else:
-                import hashlib
-
-                self.event_hash = hashlib.sha256(payload_json.encode()).hexdigest()
+            event_hash = self.compute_event_hash(hash_service)
         except Exception as exc:
             self._logger.error(
                 f"Failed to compute event hash for {self.event_id}: {exc}"
             )
             raise
+        object.__setattr__(self, "event_hash", event_hash)
+        self.__pydantic_fields_set__.add("event_hash")
+        self._reset_canonical_cache()
+
+    @classmethod
+    def _build_layout(cls) -> _BuildLayout:
+        layout = DomainEvent._build_layouts.get(cls)
+        if layout is None:
+            layout = _BuildLayout(cls)
+            DomainEvent._build_layouts[cls] = layout
+        return layout
+
+    @classmethod
+    def build_many(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        id_kind: EventIdKind | None = None,
+        set_hash: bool = True,
+        timestamp: float | None = None,
+    ) -> list[Self]:
+        """
+        Construct events in bulk from trusted field values, without per-instance validation.
+
+        The class's field layout is resolved once; each row is only checked for
+        unknown or missing required fields, and values are not validated or
+        coerced, so rows must already hold values of the declared types.
+        Event ids are generated for the whole batch at once, events without a
+        timestamp share one, and (if ``set_hash``) each event's hash is
+        computed in the same pass.
+
+        Args:
+            rows: Field values per event (by field name)
+            id_kind: "uuid4", "ulid" or "uuid7" ids for rows without an event_id
+                (the configured event id strategy if None)
+            set_hash: Compute and set event_hash on every event
+            timestamp: Timestamp for rows without one (now if None)
+
+        Returns:
+            The events, in row order.
+
+        Raises:
+            ValueError: If a row has unknown fields or lacks a required field.
+        """
+        rows = list(rows)
+        layout = cls._build_layout()
+        ids = iter(new_event_ids(len(rows), id_kind))
+        now = time.time() if timestamp is None else timestamp
+
+        events = []
+        for row in rows:
+            keys = row.keys()
+            if not (layout.required <= keys <= layout.fields):
+                layout.raise_for(row)
+            values = layout.defaults()
+            values["event_id"] = next(ids)
+            values["timestamp"] = now
+            values.update(row)
+            # What model_construct() does, minus its per-field default handling
+            event = cls.__new__(cls)
+            _object_setattr(event, "__dict__", values)
+            _object_setattr(event, "__pydantic_fields_set__", set(keys))
+            _object_setattr(event, "__pydantic_extra__", None)
+            _object_setattr(event, "__pydantic_private__", dict(layout.private))
+
+            if set_hash:
+                values["hash_version"] = HASH_VERSION
+                event.__pydantic_fields_set__.add("hash_version")
+                data = event.canonical_dict()
+                event_hash = compute_canonical_hash(data)
+                event.__dict__["event_hash"] = event_hash
+                event.__pydantic_fields_set__.add("event_hash")
+                event.__pydantic_private__["_canonical_dict"] = {
+                    **data,
+                    "event_hash": event_hash,
+                }
+            events.append(event)
+        return events
 
     def to_dict(self) -> dict[str, Any]:
         """
@@ -173,6 +372,63 @@ class DomainEvent(FrameworkBaseModel):
             return Failure(exc)
 
 
+class _BuildLayout:
+    """Field names, required fields and defaults of an event class, for build_many()."""
+
+    __slots__ = (
+        "event_class",
+        "factories",
+        "fields",
+        "mutable",
+        "private",
+        "required",
+        "static",
+    )
+
+    def __init__(self, event_class: type[DomainEvent]) -> None:
+        self.event_class = event_class
+        self.fields = frozenset(event_class.model_fields)
+        self.required = frozenset(
+            name for name, field in event_class.model_fields.items() if field.is_required()
+        )
+        # event_id and timestamp are filled in by build_many itself
+        self.static: dict[str, Any] = {}
+        self.mutable: dict[str, Any] = {}
+        self.factories: dict[str, Any] = {}
+        for name, field in event_class.model_fields.items():
+            if name in self.required or name in ("event_id", "timestamp"):
+                continue
+            if field.default_factory is not None:
+                self.factories[name] = field.default_factory
+            elif isinstance(field.default, dict | list | set):
+                self.mutable[name] = field.default
+            else:
+                self.static[name] = field.default
+        self.private = {
+            name: attr.get_default()
+            for name, attr in event_class.__private_attributes__.items()
+        }
+
+    def defaults(self) -> dict[str, Any]:
+        values = self.static.copy()
+        for name, value in self.mutable.items():
+            values[name] = value.copy()
+        for name, factory in self.factories.items():
+            values[name] = factory()
+        return values
+
+    def raise_for(self, row: Mapping[str, Any]) -> None:
+        unknown = sorted(row.keys() - self.fields)
+        missing = sorted(self.required - row.keys())
+        raise ValueError(
+            f"Cannot build {self.event_class.__name__}: "
+            f"unknown fields {unknown}, missing fields {missing}"
+        )
+
+
+_object_setattr = object.__setattr__
+
+
 def verify_event_stream_integrity(events: list[DomainEvent]) -> bool:
     """
     Verify the integrity of a sequence of events using hash chaining.
@@ -199,6 +455,11 @@ def verify_event_stream_integrity(events: list[DomainEvent]) -> bool:
 class EventUpcasterRegistry:
     """
     Registry for event upcasters, supporting versioned event migration.
+
+    Each (event type, from_version -> to_version) path is compiled once into a
+    single composed function and cached; registering an upcaster invalidates
+    the compiled paths.
+
     Usage:
         @EventUpcasterRegistry.register(MyEvent, 1)
         def upcast_v1_to_v2(data: dict[str, Any]) -> dict[str, Any]:
@@ -214,6 +475,15 @@ class EventUpcasterRegistry:
             collections.abc.Callable[[dict[str, Any]], dict[str, Any]],
         ]
     ] = {}
+    _compiled: ClassVar[
+        dict[
+            tuple[type, int, int],
+            collections.abc.Callable[[dict[str, Any]], dict[str, Any]],
+        ]
+    ] = {}
+    # Bumped on every registration so external caches of compiled paths
+    # (e.g. EventDecoder) can tell they are stale
+    generation: ClassVar[int] = 0
 
     @classmethod
     def register(cls, event_type: type, from_version: int) -> collections.abc.Callable[
@@ -223,7 +493,7 @@ class EventUpcasterRegistry:
         def decorator(
             func: collections.abc.Callable[[dict[str, Any]], dict[str, Any]],
         ) -> collections.abc.Callable[[dict[str, Any]], dict[str, Any]]:
-            cls._registry[(event_type, from_version)] = func
+            cls.register_upcaster(event_type, from_version, func)
             return func
 
         return decorator
@@ -236,18 +506,59 @@ class EventUpcasterRegistry:
         upcaster_fn: collections.abc.Callable[[dict[str, Any]], dict[str, Any]],
     ) -> None:
         cls._registry[(event_type, from_version)] = upcaster_fn
+        cls._compiled.clear()
+        cls.generation += 1
 
     @classmethod
-    def apply(
-        cls, event_type: type, data: dict[str, Any], from_version: int, to_version: int
-    ) -> dict[str, Any]:
-        v = from_version
-        while v < to_version:
+    def compile(
+        cls, event_type: type, from_version: int, to_version: int
+    ) -> collections.abc.Callable[[dict[str, Any]], dict[str, Any]]:
+        """
+        Return the composed upcaster for ``from_version`` -> ``to_version``.
+
+        Raises:
+            ValueError: If an upcaster in the chain is missing.
+        """
+        key = (event_type, from_version, to_version)
+        compiled = cls._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        hops = []
+        for v in range(from_version, to_version):
             upcaster = cls._registry.get((event_type, v))
             if not upcaster:
                 raise ValueError(
                     f"No upcaster for {event_type.__name__} v{v} -> v{v + 1}"
                 )
-            data = upcaster(data)
-            v += 1
+            hops.append(upcaster)
+
+        if not hops:
+            compiled = _identity
+        elif len(hops) == 1:
+            compiled = hops[0]
+        else:
+            compiled = _compose_upcasters(tuple(hops))
+        cls._compiled[key] = compiled
+        return compiled
+
+    @classmethod
+    def apply(
+        cls, event_type: type, data: dict[str, Any], from_version: int, to_version: int
+    ) -> dict[str, Any]:
+        return cls.compile(event_type, from_version, to_version)(data)
+
+
+def _identity(data: dict[str, Any]) -> dict[str, Any]:
+    return data
+
+
+def _compose_upcasters(
+    hops: tuple[collections.abc.Callable[[dict[str, Any]], dict[str, Any]], ...],
+) -> collections.abc.Callable[[dict[str, Any]], dict[str, Any]]:
+    def upcast(data: dict[str, Any]) -> dict[str, Any]:
+        for hop in hops:
+            data = hop(data)
         return data
+
+    return upcast
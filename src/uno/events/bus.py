@@ -5,6 +5,7 @@ EventBusProtocol and EventPublisherProtocol for Uno event sourcing.
 from __future__ import annotations
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uno.events.base_event import DomainEvent
+from uno.events.envelope import EventEnvelope
 from uno.events.interfaces import EventBusProtocol
 from uno.events.errors import EventPublishError, EventHandlerError
 from uno.events.config import EventsConfig
@@ -44,21 +45,27 @@ class InMemoryEventBus(EventBusProtocol):
     def _canonical_event_dict(self, event: E) -> dict[str, object]:
         """
         Canonical event serialization for storage, logging, and transport.
-        Always uses to_dict() for serialization.
+        Returns the event's cached canonical_dict(), so debug logging does not
+        serialize the event again.
 
         Args:
             event (E): The event to serialize.
         Returns:
             dict[str, object]: Canonical dict suitable for logging/storage.
         """
-        return event.to_dict()
+        return event.canonical_dict()
 
-    async def publish(self, event: E, metadata: dict[str, Any] | None = None) -> None:
+    async def publish(
+        self, event: E | EventEnvelope, metadata: dict[str, Any] | None = None
+    ) -> None:
         """
         Publish a single event to all subscribers.
 
+        EventEnvelopes are routed on their header and only materialized when
+        some handler is subscribed to their event type.
+
         Args:
-            event: The event to publish
+            event: The event (or envelope) to publish
             metadata: Optional metadata for the event
 
         Raises:
@@ -68,6 +75,16 @@ class InMemoryEventBus(EventBusProtocol):
         metadata = metadata or {}
 
         try:
+            if isinstance(event, EventEnvelope):
+                if not self._subscribers.get(event.event_type):
+                    self.logger.debug(
+                        "No handlers registered for event",
+                        event_type=event.event_type,
+                        position=event.position,
+                    )
+                    return
+                event = event.materialize()
+
             # Log canonical dict for audit/debug
             self.logger.debug(
                 "Publishing event",
@@ -211,7 +228,7 @@ class InMemoryEventBus(EventBusProtocol):
                 reason=f"Failed after {retry_count} retry attempts: {last_error}",
             ) from last_error
 
-    async def publish_many(self, events: list[E]) -> None:
+    async def publish_many(self, events: list[E | EventEnvelope]) -> None:
         """
         Publish a list of events to all subscribers.
 
@@ -0,0 +1,176 @@
+"""
+Storage codecs for event payloads.
+
+An EventStorageCodec decides how a store writes an event payload: as JSON in the
+``payload`` column (the default), or as compact bytes in the ``payload_bin``
+column, either msgpack-encoded or compressed with zlib/zstd once it grows past
+a size threshold. The codec used is recorded per row as a ``PayloadCodec`` id,
+so rows written under different settings can always be read back.
+
+``PayloadCodec.COMPACT`` payloads are msgpack arrays laid out by an event
+schema (see ``uno.events.schema_registry``); decoding them needs the row's
+type id and event version.
+
+zstd support uses the ``zstandard`` package when it is installed.
+"""
+
+from __future__ import annotations
+
+import zlib
+from enum import IntEnum
+from typing import Any, Literal, NamedTuple
+
+import msgspec
+
+from uno.events.schema_registry import EventSchemaRegistry
+
+try:  # pragma: no cover - depends on the environment
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+PayloadFormat = Literal["json", "msgpack"]
+Compression = Literal["zlib", "zstd"]
+
+_json_encoder = msgspec.json.Encoder()
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder(dict[str, Any])
+
+
+class PayloadCodec(IntEnum):
+    """Per-row id of the encoding a payload was stored with."""
+
+    JSON = 0
+    JSON_ZLIB = 1
+    JSON_ZSTD = 2
+    MSGPACK = 3
+    MSGPACK_ZLIB = 4
+    MSGPACK_ZSTD = 5
+    COMPACT = 6
+
+
+_CODECS: dict[tuple[PayloadFormat, Compression | None], PayloadCodec] = {
+    ("json", None): PayloadCodec.JSON,
+    ("json", "zlib"): PayloadCodec.JSON_ZLIB,
+    ("json", "zstd"): PayloadCodec.JSON_ZSTD,
+    ("msgpack", None): PayloadCodec.MSGPACK,
+    ("msgpack", "zlib"): PayloadCodec.MSGPACK_ZLIB,
+    ("msgpack", "zstd"): PayloadCodec.MSGPACK_ZSTD,
+}
+
+_MSGPACK_CODECS = frozenset(
+    (PayloadCodec.MSGPACK, PayloadCodec.MSGPACK_ZLIB, PayloadCodec.MSGPACK_ZSTD)
+)
+
+
+class EncodedPayload(NamedTuple):
+    """A payload ready to be written: exactly one of ``json``/``binary`` is set."""
+
+    codec: PayloadCodec
+    json: dict[str, Any] | None
+    binary: bytes | None
+
+
+class EventStorageCodec:
+    """
+    Encodes event payloads for storage and decodes them on read.
+
+    Usage:
+        codec = EventStorageCodec(format="msgpack", compression="zstd")
+        encoded = codec.encode(event.to_dict())
+        raw = codec.decode(encoded.codec, None, encoded.binary)
+
+    Args:
+        format: ``"json"`` keeps payloads in the JSON column (unless compressed);
+            ``"msgpack"`` stores them as msgpack bytes
+        compression: ``"zlib"``, ``"zstd"`` or None
+        compress_threshold: Encoded size in bytes above which payloads are compressed
+        level: Compression level (codec default if None)
+
+    Raises:
+        ValueError: If zstd is requested but ``zstandard`` is not installed.
+    """
+
+    def __init__(
+        self,
+        format: PayloadFormat = "json",
+        compression: Compression | None = None,
+        compress_threshold: int = 1024,
+        level: int | None = None,
+    ) -> None:
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        self.format = format
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self._plain = _CODECS[(format, None)]
+        self._compressed = _CODECS[(format, compression)]
+
+    def encode(self, payload: dict[str, Any]) -> EncodedPayload:
+        """Encode a payload dict for storage."""
+        if self.format == "json" and self.compression is None:
+            return EncodedPayload(PayloadCodec.JSON, payload, None)
+
+        encoded = (
+            _msgpack_encoder.encode(payload)
+            if self.format == "msgpack"
+            else _json_encoder.encode(payload)
+        )
+        if self.compression is not None and len(encoded) > self.compress_threshold:
+            return EncodedPayload(
+                self._compressed, None, compress(self.compression, encoded, self.level)
+            )
+        if self.format == "json":
+            return EncodedPayload(PayloadCodec.JSON, payload, None)
+        return EncodedPayload(self._plain, None, encoded)
+
+    @staticmethod
+    def decode(
+        codec: int,
+        text: str | None,
+        binary: bytes | None,
+        type_id: int | None = None,
+        event_version: int = 1,
+    ) -> str | bytes | dict[str, Any]:
+        """
+        Decode a stored payload into raw JSON or a dict, whatever the codec that wrote it.
+
+        JSON payloads are returned as raw JSON (so decoders can validate them
+        straight from JSON); msgpack and compact payloads are returned as dicts.
+        ``type_id`` and ``event_version`` are only used for compact payloads.
+        """
+        match codec:
+            case PayloadCodec.JSON:
+                return text
+            case PayloadCodec.COMPACT:
+                return EventSchemaRegistry.decode(type_id, event_version, binary)
+            case PayloadCodec.JSON_ZLIB | PayloadCodec.MSGPACK_ZLIB:
+                binary = zlib.decompress(binary)
+            case PayloadCodec.JSON_ZSTD | PayloadCodec.MSGPACK_ZSTD:
+                binary = decompress("zstd", binary)
+            case PayloadCodec.MSGPACK:
+                pass
+            case _:
+                raise ValueError(f"Unknown payload codec {codec}")
+        if codec in _MSGPACK_CODECS:
+            return _msgpack_decoder.decode(binary)
+        return binary
+
+
+def compress(compression: Compression, data: bytes, level: int | None = None) -> bytes:
+    """Compress bytes with zlib or zstd."""
+    if compression == "zlib":
+        return zlib.compress(data, -1 if level is None else level)
+    if zstandard is None:
+        raise ValueError("zstd compression requires the 'zstandard' package")
+    return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+
+def decompress(compression: Compression, data: bytes) -> bytes:
+    """Decompress bytes written by ``compress``."""
+    if compression == "zlib":
+        return zlib.decompress(data)
+    if zstandard is None:
+        raise ValueError("Reading zstd data requires the 'zstandard' package")
+    return zstandard.ZstdDecompressor().decompress(data)
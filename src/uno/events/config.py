@@ -51,6 +51,12 @@ class EventsConfig(UnoSettings):
         env="UNO_EVENTS_DB_CONNECTION",
     )
 
+    event_id_strategy: Literal["uuid4", "ulid", "uuid7"] = Field(
+        "uuid4",
+        description="Default event id format; ulid and uuid7 ids are time-ordered",
+        env="UNO_EVENTS_EVENT_ID_STRATEGY",
+    )
+
     # Handler settings
     parallel_handlers: bool = Field(
         False,
@@ -0,0 +1,266 @@
+"""
+Compiled event decoders for rehydrating stored events.
+
+Event stores hand raw JSON payloads to an EventDecoder instead of resolving the
+event class, upcasting and validating every row by hand. Decoders are compiled
+once per (event_type, stored version) pair and cached: the event class lookup,
+the composed upcaster chain and a Pydantic ``TypeAdapter`` for bulk validation
+are all resolved on first use. Upcaster chains come precompiled from
+``EventUpcasterRegistry.compile``, and the cache is dropped whenever a new
+upcaster is registered.
+
+Payloads that are already at the current event version are validated straight
+from JSON by pydantic-core (one call per batch, no intermediate dicts). Older
+payloads are decoded with ``msgspec`` and passed through the upcaster chain
+before validation. Payloads stored in a binary codec (see ``uno.events.codecs``)
+arrive already decoded as dicts and skip the JSON step.
+
+``LazyEvent`` defers all of this: it keeps a row's raw payload and only
+upcasts and validates it the first time the event body is touched, so
+consumers that filter on ``event_type`` or ``aggregate_id`` never pay for the
+events they skip.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import msgspec
+from pydantic import TypeAdapter
+
+from uno.events.base_event import DomainEvent, EventUpcasterRegistry
+
+RawPayload = bytes | str | dict[str, Any]
+Upcaster = Callable[[dict[str, Any]], dict[str, Any]]
+
+_json_decoder = msgspec.json.Decoder(dict[str, Any])
+
+
+def _as_bytes(payload: bytes | str) -> bytes:
+    return payload.encode() if isinstance(payload, str) else payload
+
+
+class CompiledEventDecoder:
+    """
+    Decode function for a single (event class, stored version) pair.
+
+    Attributes:
+        event_class: The event class payloads are validated into
+        from_version: The stored payload version this decoder accepts
+        upcast: Composed upcaster chain, or None if no upcasting is needed
+    """
+
+    __slots__ = ("_list_adapter", "event_class", "from_version", "upcast")
+
+    def __init__(
+        self,
+        event_class: type[DomainEvent],
+        from_version: int,
+        upcast: Upcaster | None,
+    ) -> None:
+        self.event_class = event_class
+        self.from_version = from_version
+        self.upcast = upcast
+        self._list_adapter: TypeAdapter[list[DomainEvent]] | None = (
+            TypeAdapter(list[event_class]) if upcast is None else None
+        )
+
+    def decode(self, payload: RawPayload) -> DomainEvent:
+        """Decode a single raw JSON (or already decoded) payload into an event."""
+        if isinstance(payload, dict):
+            data = payload
+        elif self.upcast is None:
+            return self.event_class.model_validate_json(payload)
+        else:
+            data = _json_decoder.decode(_as_bytes(payload))
+        if self.upcast is not None:
+            data = self.upcast(data)
+        return self.event_class.model_validate(data)
+
+    def decode_many(self, payloads: Sequence[RawPayload]) -> list[DomainEvent]:
+        """Decode a batch of payloads that share this decoder."""
+        if self._list_adapter is not None and not any(
+            isinstance(p, dict) for p in payloads
+        ):
+            document = b"[" + b",".join(_as_bytes(p) for p in payloads) + b"]"
+            return self._list_adapter.validate_json(document)
+        return [self.decode(payload) for payload in payloads]
+
+
+class EventDecoder:
+    """
+    Cache of compiled decoders keyed by (event_type, stored version).
+
+    Usage:
+        decoder = EventDecoder()
+        events = decoder.decode_rows(
+            [(row.event_type, row.event_version, row.payload) for row in rows]
+        )
+    """
+
+    def __init__(self) -> None:
+        self._compiled: dict[tuple[str, int], CompiledEventDecoder] = {}
+        self._generation = EventUpcasterRegistry.generation
+
+    def get(self, event_type: str, version: int) -> CompiledEventDecoder:
+        """
+        Return the compiled decoder for an event type and stored version.
+
+        Raises:
+            RuntimeError: If the event type is not registered.
+            ValueError: If an upcaster in the chain is missing.
+        """
+        if self._generation != EventUpcasterRegistry.generation:
+            self.clear()
+        key = (event_type, version)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compile(event_type, version)
+            self._compiled[key] = compiled
+        return compiled
+
+    def _compile(self, event_type: str, version: int) -> CompiledEventDecoder:
+        event_class = DomainEvent.get_event_class(event_type)
+        target_version = event_class.__version__
+        if version >= target_version:
+            return CompiledEventDecoder(event_class, version, None)
+
+        return CompiledEventDecoder(
+            event_class,
+            version,
+            EventUpcasterRegistry.compile(event_class, version, target_version),
+        )
+
+    def clear(self) -> None:
+        """Drop all compiled decoders (done automatically when upcasters change)."""
+        self._compiled.clear()
+        self._generation = EventUpcasterRegistry.generation
+
+    def decode(self, event_type: str, version: int, payload: RawPayload) -> DomainEvent:
+        """Decode a single stored payload."""
+        return self.get(event_type, version).decode(payload)
+
+    def decode_rows(
+        self, rows: Sequence[tuple[str, int, RawPayload]]
+    ) -> list[DomainEvent]:
+        """
+        Decode a batch of (event_type, stored version, raw payload) rows in order.
+
+        Consecutive rows that share a decoder are validated together in one call.
+        """
+        events: list[DomainEvent] = []
+        start = 0
+        while start < len(rows):
+            key = rows[start][:2]
+            end = start + 1
+            while end < len(rows) and rows[end][:2] == key:
+                end += 1
+            compiled = self.get(*key)
+            if end - start == 1:
+                events.append(compiled.decode(rows[start][2]))
+            else:
+                events.extend(compiled.decode_many([row[2] for row in rows[start:end]]))
+            start = end
+        return events
+
+
+class LazyEvent:
+    """
+    Stand-in for a stored event that is only decoded when its body is accessed.
+
+    The row's header (``event_type``, ``aggregate_id``, ``stream_version``,
+    ``event_version`` and ``global_position``) and ``event_class`` are
+    available without decoding. Any other attribute access decodes, upcasts
+    and validates the payload once and delegates to the resulting event.
+
+    A LazyEvent is not a DomainEvent: filter on ``event_type`` (or
+    ``event_class``) and pass ``materialize()`` to code that needs the event
+    itself (``isinstance``, ``model_dump``, ``type()``).
+
+    Usage:
+        async for event in store.stream_events(lazy=True):
+            if event.event_type != "order_placed":
+                continue  # never decoded
+            handle(event.materialize())
+    """
+
+    __slots__ = (
+        "_compiled",
+        "_decode_payload",
+        "_event",
+        "aggregate_id",
+        "event_type",
+        "event_version",
+        "global_position",
+        "stream_version",
+    )
+
+    # Built once per row: the header fields stay plain arguments rather than
+    # a per-row options object
+    def __init__(  # noqa: PLR0913
+        self,
+        compiled: CompiledEventDecoder,
+        decode_payload: Callable[[], RawPayload],
+        *,
+        event_type: str,
+        aggregate_id: str,
+        stream_version: int,
+        global_position: int | None = None,
+    ) -> None:
+        """
+        Args:
+            compiled: Decoder for the row's event type and stored version
+            decode_payload: Returns the row's raw payload (JSON or dict)
+            event_type: The stored event type
+            aggregate_id: The stream's aggregate ID
+            stream_version: The event's version within its stream
+            global_position: The event's store-wide position
+        """
+        self._compiled = compiled
+        self._decode_payload = decode_payload
+        self._event: DomainEvent | None = None
+        self.event_type = event_type
+        self.event_version = compiled.from_version
+        self.aggregate_id = aggregate_id
+        self.stream_version = stream_version
+        self.global_position = global_position
+
+    @property
+    def event_class(self) -> type[DomainEvent]:
+        """The class the payload decodes to."""
+        return self._compiled.event_class
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the payload has been decoded."""
+        return self._event is not None
+
+    def materialize(self) -> DomainEvent:
+        """Decode, upcast and validate the event (once), and return it."""
+        event = self._event
+        if event is None:
+            event = self._compiled.decode(self._decode_payload())
+            event._global_position = self.global_position
+            self._event = event
+            self._decode_payload = None  # type: ignore[assignment]
+        return event
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.materialize(), name)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is LazyEvent:
+            other = other.materialize()
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        if self._event is not None:
+            return repr(self._event)
+        return (
+            f"LazyEvent(event_type={self.event_type!r}, "
+            f"aggregate_id={self.aggregate_id!r}, stream_version={self.stream_version})"
+        )
@@ -12,6 +12,7 @@ from uno.events.bus import InMemoryEventBus
 from uno.events.config import EventsConfig
 from uno.events.event_bus import EventBusProtocol
 from uno.events.event_store import EventStoreProtocol
+from uno.events.ids import set_event_id_strategy
 from uno.events.postgres_event_store import PostgresEventStore
 from uno.logging.protocols import LoggerProtocol
 
@@ -26,6 +27,7 @@ async def register_event_services(container: DIContainer) -> None:
     # Register configuration
     config = EventsConfig.from_env()
     await container.register_singleton(EventsConfig, lambda _: config)
+    set_event_id_strategy(config.event_id_strategy)
 
     # Register event bus based on configuration
     await _register_event_bus(container, config)
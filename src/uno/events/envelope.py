@@ -0,0 +1,104 @@
+"""
+Compact event envelopes for high-volume pipelines.
+
+An ``EventEnvelope`` carries a stored event's header (global position,
+aggregate ID, event type, stream version) and its raw payload bytes, without
+building a ``DomainEvent``. Routing, filtering, counting and forwarding only
+need the header, so pipelines can move envelopes around and call
+``materialize()`` on the few that a handler actually needs.
+
+Envelopes are ``msgspec.Struct`` instances (slotted, untracked by the GC), a
+small fraction of the memory of a validated Pydantic event.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from uno.events.codecs import EventStorageCodec, PayloadCodec
+from uno.events.decoding import EventDecoder
+
+if TYPE_CHECKING:
+    from uno.events.base_event import DomainEvent
+
+# Shared decoder cache for envelopes materialized without an explicit decoder
+_default_decoder = EventDecoder()
+
+
+class EventEnvelope(msgspec.Struct, frozen=True, gc=False):
+    """
+    A stored event's header plus its undecoded payload.
+
+    Attributes:
+        position: Global position of the event in the store (0 if unknown)
+        aggregate_id: The stream's aggregate ID
+        event_type: The stored event type
+        version: The event's version within its stream
+        payload: Raw payload bytes (JSON unless ``codec`` says otherwise)
+        event_version: Schema version the payload was stored with
+        codec: ``PayloadCodec`` id of ``payload``
+        type_id: Schema registry id of the event type (compact payloads only)
+    """
+
+    position: int
+    aggregate_id: str
+    event_type: str
+    version: int
+    payload: bytes
+    event_version: int = 1
+    codec: int = PayloadCodec.JSON.value
+    type_id: int | None = None
+
+    @classmethod
+    def from_event(
+        cls,
+        event: DomainEvent,
+        aggregate_id: str,
+        version: int,
+        position: int | None = None,
+    ) -> EventEnvelope:
+        """
+        Wrap an already decoded event (e.g. one held by an in-memory store).
+        The payload is the event's canonical encoding, so a materialized copy
+        still verifies against its ``event_hash``.
+
+        Args:
+            event: The event to wrap
+            aggregate_id: The stream's aggregate ID
+            version: The event's version within its stream
+            position: Global position (defaults to the event's own)
+        """
+        if position is None:
+            position = event.global_position or 0
+        return cls(
+            position=position,
+            aggregate_id=aggregate_id,
+            event_type=event.event_type,
+            version=version,
+            payload=event.canonical_bytes(),
+            event_version=event.version,
+        )
+
+    def raw_payload(self) -> bytes | dict[str, Any]:
+        """The payload as JSON bytes or, for binary codecs, a decoded dict."""
+        if self.codec == PayloadCodec.JSON:
+            return self.payload
+        return EventStorageCodec.decode(
+            self.codec, None, self.payload, self.type_id, self.event_version
+        )
+
+    def materialize(self, decoder: EventDecoder | None = None) -> DomainEvent:
+        """
+        Decode, upcast and validate the payload into its DomainEvent.
+
+        Args:
+            decoder: Compiled decoder cache to use (a shared one by default)
+        """
+        event = (decoder or _default_decoder).decode(
+            self.event_type, self.event_version, self.raw_payload()
+        )
+        if self.position:
+            event._global_position = self.position
+        return event
@@ -4,6 +4,10 @@ Event-related error classes for the Uno framework.
 This module contains error classes that represent event-related exceptions.
 """
 
-from .event_errors import EventUpcastError
+from .event_errors import (
+    ConcurrencyConflictError,
+    EventIntegrityError,
+    EventUpcastError,
+)
 
-__all__ = ["EventUpcastError"]
+__all__ = ["ConcurrencyConflictError", "EventIntegrityError", "EventUpcastError"]
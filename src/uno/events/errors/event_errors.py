@@ -33,3 +33,57 @@ class EventUpcastError(UnoError):
             to_version=to_version,
             **context,
         )
+
+
+class ConcurrencyConflictError(UnoError):
+    """
+    Raised when an append finds the aggregate's stream at a different version
+    than the writer expected, i.e. another writer appended to it first.
+    Callers can reload the aggregate, reapply the command and retry.
+    """
+
+    def __init__(
+        self,
+        aggregate_id: str,
+        expected_version: int | None,
+        actual_version: int | None = None,
+        message: str | None = None,
+        **context: Any,
+    ):
+        if message is None:
+            found = "a newer version" if actual_version is None else actual_version
+            message = (
+                f"Concurrency conflict on aggregate {aggregate_id}: "
+                f"expected version {expected_version}, found {found}"
+            )
+        super().__init__(
+            message=message,
+            error_code="CORE-1002",
+            aggregate_id=aggregate_id,
+            expected_version=expected_version,
+            actual_version=actual_version,
+            **context,
+        )
+
+
+class EventIntegrityError(UnoError):
+    """
+    Raised when a stored event stream fails integrity verification: an event's
+    hash does not match its content, or the hash chain is broken.
+    """
+
+    def __init__(
+        self,
+        aggregate_id: str,
+        version: int,
+        reason: str,
+        **context: Any,
+    ):
+        super().__init__(
+            message=f"Integrity check failed for aggregate {aggregate_id} at version {version}: {reason}",
+            error_code="CORE-1003",
+            aggregate_id=aggregate_id,
+            version=version,
+            reason=reason,
+            **context,
+        )
@@ -5,10 +5,15 @@ This module provides the event store implementation for persisting and retrievin
 domain events, supporting event-driven architectures and event sourcing.
 """
 
-import copy
+import asyncio
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Iterator, Sequence
+from itertools import islice
 from typing import Any, Protocol, TypeVar, TYPE_CHECKING
 
 from uno.events.base_event import DomainEvent
+from uno.events.envelope import EventEnvelope
+from uno.events.errors import ConcurrencyConflictError
 from uno.events.interfaces import EventStoreProtocol
 from uno.errors.result import Failure, Result, Success
 
@@ -43,9 +48,9 @@ class EventStore(EventStoreProtocol[E], Generic[E]):
     def _canonical_event_dict(self, event: E) -> dict[str, object]:
         """
         Canonical event serialization for storage, hashing, and transport.
-        Always uses to_dict() for serialization.
+        Uses the event's memoized canonical_dict().
         """
-        return event.to_dict()
+        return event.canonical_dict()
 
     async def save_event(self, event: E) -> Result[None, Exception]:
         """
@@ -59,6 +64,42 @@ class EventStore(EventStoreProtocol[E], Generic[E]):
         """
         raise NotImplementedError
 
+    async def save_events(
+        self, events: list[E], expected_version: int | None = None
+    ) -> Result[None, Exception]:
+        """
+        Save a batch of domain events (one aggregate commit) to the store.
+
+        The default implementation falls back to one save_event call per event;
+        concrete stores should override it to write the whole batch at once and
+        enforce ``expected_version`` atomically.
+
+        Args:
+            events: The domain events to save, in stream order
+            expected_version: The stream version the caller expects the aggregate
+                to be at before the append, or None to skip the check
+
+        Returns:
+            Result with None on success, or an error (ConcurrencyConflictError
+            if the stream is not at ``expected_version``)
+        """
+        if events and expected_version is not None:
+            aggregate_id = events[0].aggregate_id
+            current = await self.get_events_by_aggregate_id(aggregate_id)
+            if current.is_failure:
+                return current
+            if len(current.value) != expected_version:
+                return Failure(
+                    ConcurrencyConflictError(
+                        aggregate_id, expected_version, len(current.value)
+                    )
+                )
+        for event in events:
+            result = await self.save_event(event)
+            if result.is_failure:
+                return result
+        return Success(None)
+
     async def get_events(
         self,
         aggregate_id: str | None = None,
@@ -73,7 +114,9 @@ class EventStore(EventStoreProtocol[E], Generic[E]):
             aggregate_id: The aggregate ID to filter by
             event_type: The event type to filter by
             limit: Maximum number of events to return
-            since_version: Return only events since this version
+            since_version: Return only events at or after this stream version
+                (the event's 1-based position in its aggregate's stream, not
+                its schema ``version``)
 
         Returns:
             Result with a list of events or an error
@@ -95,11 +138,125 @@ class EventStore(EventStoreProtocol[E], Generic[E]):
         """
         raise NotImplementedError
 
+    async def get_events_for_aggregates(
+        self, aggregate_ids: Sequence[str]
+    ) -> Result[dict[str, list[E]], Exception]:
+        """
+        Get the event streams of several aggregates at once.
+
+        The default implementation falls back to one get_events_by_aggregate_id
+        call per aggregate; concrete stores should override it to fetch all
+        streams in a single query.
+
+        Args:
+            aggregate_ids: The IDs of the aggregates to get events for
+
+        Returns:
+            Result with a dict mapping each aggregate ID that has events to its
+            events in stream order, or an error
+        """
+        streams: dict[str, list[E]] = {}
+        for aggregate_id in dict.fromkeys(aggregate_ids):
+            result = await self.get_events_by_aggregate_id(aggregate_id)
+            if result.is_failure:
+                return result
+            if result.value:
+                streams[aggregate_id] = result.value
+        return Success(streams)
+
+    async def get_stream_range(
+        self,
+        aggregate_id: str,
+        after_version: int = 0,
+        to_version: int | None = None,
+        to_timestamp: float | None = None,
+    ) -> Result[list[E], Exception]:
+        """
+        Get a bounded slice of an aggregate's stream, for replaying on top of a
+        snapshot.
+
+        The default implementation filters the full stream; concrete stores
+        should override it to read only the requested range.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            after_version: Only events with a stream version greater than this
+            to_version: Only events up to and including this stream version
+            to_timestamp: Only events stored at or before this time (epoch seconds)
+
+        Returns:
+            Result with the events in stream order, or an error
+        """
+        result = await self.get_events_by_aggregate_id(aggregate_id)
+        if result.is_failure:
+            return result
+        events = result.value[after_version:to_version]
+        if to_timestamp is not None:
+            events = [event for event in events if event.timestamp <= to_timestamp]
+        return Success(events)
+
+    def stream_events(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[E]:
+        """
+        Stream events in store order without loading the whole store into memory.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Maximum number of events read from the backend at a time
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+            lazy: Allow the store to yield events whose payload is only
+                decoded when first accessed (see ``LazyEvent``)
+
+        Returns:
+            An async iterator over the matching events
+        """
+        raise NotImplementedError
+
+    def stream_envelopes(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+    ) -> AsyncIterator[EventEnvelope]:
+        """
+        Stream EventEnvelopes (header plus raw payload) in store order, for
+        pipelines that route or count events without decoding them.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Maximum number of events read from the backend at a time
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+
+        Returns:
+            An async iterator over the matching envelopes
+        """
+        raise NotImplementedError
+
 
 class InMemoryEventStore(EventStore[E]):
     """
     Simple in-memory event store for development and testing.
-    Stores events in a Python list grouped by aggregate_id.
+
+    Events are kept in an append-only global log; an event's global position is
+    its index in the log plus one. Secondary indexes map each aggregate_id and
+    event type to the (ascending) log indexes of its events, so aggregate,
+    type, version and position queries never scan the whole log.
+
+    Frozen events are stored as the caller's objects, so saving one sets the
+    caller's ``global_position``; mutable events are deep-copied first and
+    the caller's objects are left untouched. Stream versions are positions
+    within the aggregate's stream, assigned in append order.
     """
 
     def __init__(self, logger: "LoggerService"):
@@ -110,13 +267,35 @@ class InMemoryEventStore(EventStore[E]):
             logger (LoggerService): Logger instance for structured and debug logging.
         """
         self.logger = logger
-        self._events: dict[str, list[E]] = {}
+        self._log: list[E] = []
+        self._stream_versions: list[int] = []
+        self._by_aggregate: dict[str, list[int]] = {}
+        self._by_type: dict[str, list[int]] = {}
+
+    def _append(self, aggregate_id: str, event: E) -> None:
+        """
+        Append an event to the global log and update the indexes.
+
+        Sets the stored event's global position, which for a frozen event is
+        the caller's object.
+        """
+        if not event.model_config.get("frozen", False):
+            event = event.model_copy(deep=True)
+        index = len(self._log)
+        stream = self._by_aggregate.setdefault(aggregate_id, [])
+        stream.append(index)
+        self._log.append(event)
+        self._stream_versions.append(len(stream))
+        event._global_position = index + 1
+
+        type_keys = {event.event_type, type(event).__name__}
+        for type_key in type_keys:
+            self._by_type.setdefault(type_key, []).append(index)
 
     async def save_event(self, event: E) -> Result[None, Exception]:
         """Save a domain event to the in-memory store.
 
-        All persisted events are first serialized using the canonical pattern via self._canonical_event_dict(event).
-        This guarantees deterministic, tamper-evident storage and transport.
+        Frozen events are stored as-is; the store assigns their global position.
 
         Args:
             event: The domain event to save
@@ -136,10 +315,7 @@ class InMemoryEventStore(EventStore[E]):
             return Failure(error)
 
         try:
-            if aggregate_id not in self._events:
-                self._events[aggregate_id] = []
-            # Canonical serialization enforced here
-            self._events[aggregate_id].append(copy.deepcopy(event))
+            self._append(aggregate_id, event)
 
             self.logger.structured_log(
                 "INFO",
@@ -156,6 +332,105 @@ class InMemoryEventStore(EventStore[E]):
             )
             return Failure(e)
 
+    async def save_events(
+        self, events: list[E], expected_version: int | None = None
+    ) -> Result[None, Exception]:
+        """Save a batch of domain events to the in-memory store.
+
+        The batch is validated up front and appended as a whole, so either every
+        event is stored or none is.
+
+        Args:
+            events: The domain events to save, in stream order
+            expected_version: The stream version the caller expects the aggregate
+                to be at before the append, or None to skip the check
+
+        Returns:
+            Result with None on success, or an error (ConcurrencyConflictError
+            if the stream is not at ``expected_version``)
+        """
+        if not events:
+            return Success(None)
+
+        aggregate_ids = [getattr(event, "aggregate_id", None) for event in events]
+        if not all(aggregate_ids):
+            error = ValueError("Event must have an aggregate_id")
+            self.logger.structured_log(
+                "ERROR",
+                f"Failed to save {len(events)} events: {error}",
+                name="uno.events.inmem",
+                error=error,
+            )
+            return Failure(error)
+
+        if expected_version is not None:
+            if len(set(aggregate_ids)) > 1:
+                return Failure(
+                    ValueError(
+                        "expected_version requires all events to belong to one aggregate"
+                    )
+                )
+            current_version = len(self._by_aggregate.get(aggregate_ids[0], []))
+            if current_version != expected_version:
+                error = ConcurrencyConflictError(
+                    aggregate_ids[0], expected_version, current_version
+                )
+                self.logger.structured_log(
+                    "ERROR",
+                    f"Failed to save {len(events)} events: {error}",
+                    name="uno.events.inmem",
+                    error=error,
+                )
+                return Failure(error)
+
+        for aggregate_id, event in zip(aggregate_ids, events, strict=True):
+            self._append(aggregate_id, event)
+
+        self.logger.structured_log(
+            "INFO",
+            f"Saved {len(events)} events",
+            name="uno.events.inmem",
+        )
+        return Success(None)
+
+    def _matching_indexes(
+        self,
+        aggregate_id: str | None,
+        event_type: str | None,
+        since_version: int | None,
+    ) -> Iterator[int]:
+        """Yield ascending log indexes matching the filters, driven by the narrowest index."""
+        if aggregate_id:
+            indexes: Sequence[int] = self._by_aggregate.get(aggregate_id, [])
+            # Stream versions are 1-based positions in the aggregate's index list
+            if since_version is not None and since_version > 1:
+                indexes = indexes[since_version - 1 :]
+            if not event_type:
+                yield from indexes
+                return
+            type_indexes = self._by_type.get(event_type, [])
+            if len(type_indexes) < len(indexes):
+                for index in type_indexes:
+                    if self._log[index].aggregate_id == aggregate_id and (
+                        since_version is None
+                        or self._stream_versions[index] >= since_version
+                    ):
+                        yield index
+                return
+            type_set = set(type_indexes)
+            yield from (index for index in indexes if index in type_set)
+            return
+
+        indexes = (
+            self._by_type.get(event_type, []) if event_type else range(len(self._log))
+        )
+        if since_version is None:
+            yield from indexes
+            return
+        yield from (
+            index for index in indexes if self._stream_versions[index] >= since_version
+        )
+
     async def get_events(
         self,
         aggregate_id: str | None = None,
@@ -163,67 +438,25 @@ class InMemoryEventStore(EventStore[E]):
         limit: int | None = None,
         since_version: int | None = None,
     ) -> Result[list[DomainEvent], Exception]:
-        """Get events by aggregate ID and/or event type.
+        """Get events by aggregate ID and/or event type, in global order.
 
         Args:
             aggregate_id: The aggregate ID to filter by
             event_type: The event type to filter by
             limit: Maximum number of events to return
-            since_version: Return only events since this version
+            since_version: Return only events at or after this stream version
+                (the event's 1-based position in its aggregate's stream, not
+                its schema ``version``)
 
         Returns:
             Result with a list of events or an error
         """
         try:
-            # Build a flat list of all events
-            all_events: list[DomainEvent] = []
-            for events in self._events.values():
-                all_events.extend(events)
-
-            # Apply filters
-            filtered_events = all_events
-
-            # Filter by aggregate_id if provided
-            if aggregate_id:
-                filtered_events = [
-                    e
-                    for e in filtered_events
-                    if getattr(e, "aggregate_id", None) == aggregate_id
-                ]
-                self.logger.structured_log(
-                    "DEBUG",
-                    f"After aggregate_id filter '{aggregate_id}': {[getattr(e, 'event_type', None) for e in filtered_events]}",
-                    name="uno.events.inmem",
-                )
-
-            # Filter by event_type if provided (ensure string match, event_type may be class property)
-            if event_type:
-                filtered_events = [
-                    e
-                    for e in filtered_events
-                    if (
-                        getattr(e, "event_type", None) == event_type
-                        or type(e).__name__ == event_type
-                    )
-                ]
-                self.logger.structured_log(
-                    "DEBUG",
-                    f"After event_type filter '{event_type}': {[type(e).__name__ for e in filtered_events]}",
-                    name="uno.events.inmem",
-                )
-
-            if since_version is not None:
-                filtered_events = [
-                    e
-                    for e in filtered_events
-                    if getattr(e, "version", 0) >= since_version
-                ]
-
-            # Apply limit
+            indexes = self._matching_indexes(aggregate_id, event_type, since_version)
             if limit:
-                filtered_events = filtered_events[:limit]
+                indexes = islice(indexes, limit)
+            filtered_events = [self._log[index] for index in indexes]
 
-            # Log the result
             self.logger.structured_log(
                 "INFO",
                 f"Retrieved {len(filtered_events)} events from store",
@@ -255,10 +488,9 @@ class InMemoryEventStore(EventStore[E]):
             Result with a list of events or an error
         """
         try:
-            if aggregate_id not in self._events:
-                return Success([])
-
-            events = self._events[aggregate_id]
+            events = [
+                self._log[index] for index in self._by_aggregate.get(aggregate_id, [])
+            ]
 
             # Filter by event types if provided
             if event_types:
@@ -275,6 +507,142 @@ class InMemoryEventStore(EventStore[E]):
             )
             return Failure(e)
 
+    async def get_events_for_aggregates(
+        self, aggregate_ids: Sequence[str]
+    ) -> Result[dict[str, list[E]], Exception]:
+        """
+        Get the event streams of several aggregates at once.
+
+        Args:
+            aggregate_ids: The IDs of the aggregates to get events for
+
+        Returns:
+            Result with a dict mapping each aggregate ID that has events to its
+            events in stream order
+        """
+        log = self._log
+        return Success(
+            {
+                aggregate_id: [log[index] for index in indexes]
+                for aggregate_id in aggregate_ids
+                if (indexes := self._by_aggregate.get(aggregate_id))
+            }
+        )
+
+    async def get_stream_range(
+        self,
+        aggregate_id: str,
+        after_version: int = 0,
+        to_version: int | None = None,
+        to_timestamp: float | None = None,
+    ) -> Result[list[E], Exception]:
+        """
+        Get a bounded slice of an aggregate's stream.
+
+        In memory, an event's stored time is its ``timestamp``.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            after_version: Only events with a stream version greater than this
+            to_version: Only events up to and including this stream version
+            to_timestamp: Only events with a timestamp at or before this time
+
+        Returns:
+            Result with the events in stream order
+        """
+        log = self._log
+        indexes = self._by_aggregate.get(aggregate_id, [])[after_version:to_version]
+        events = [log[index] for index in indexes]
+        if to_timestamp is not None:
+            events = [event for event in events if event.timestamp <= to_timestamp]
+        return Success(events)
+
+    async def stream_events(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[E]:
+        """
+        Stream events in global position order.
+
+        The starting point is found by bisecting the narrowest index, and control
+        is yielded back to the event loop after every ``batch_size`` events so
+        long replays do not starve other tasks.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Number of events yielded between event loop checkpoints
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+            lazy: Ignored; events are kept decoded in memory
+
+        Yields:
+            Events in global position order
+        """
+        # Position p lives at log index p - 1, so index from_position is the first
+        # event after it.
+        if aggregate_id:
+            indexes: Sequence[int] = self._by_aggregate.get(aggregate_id, [])
+        elif event_type:
+            indexes = self._by_type.get(event_type, [])
+        else:
+            indexes = range(len(self._log))
+        start = bisect_left(indexes, from_position)
+
+        yielded = 0
+        for index in islice(indexes, start, None):
+            event = self._log[index]
+            if (
+                event_type
+                and aggregate_id
+                and not (
+                    event.event_type == event_type or type(event).__name__ == event_type
+                )
+            ):
+                continue
+            yield event
+            yielded += 1
+            if yielded % batch_size == 0:
+                await asyncio.sleep(0)
+
+    async def stream_envelopes(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+    ) -> AsyncIterator[EventEnvelope]:
+        """
+        Stream envelopes in global position order.
+
+        Events are held decoded, so each envelope is built by encoding the
+        event; this exists for API parity with persistent stores.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Number of events yielded between event loop checkpoints
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+
+        Yields:
+            Envelopes in global position order
+        """
+        async for event in self.stream_events(
+            from_position, batch_size, aggregate_id, event_type
+        ):
+            position = event.global_position
+            yield EventEnvelope.from_event(
+                event,
+                event.aggregate_id,
+                self._stream_versions[position - 1],
+                position,
+            )
+
 
 # The EventSourcedRepository should be imported directly from its module
 # We don't need to re-export it here
@@ -0,0 +1,154 @@
+"""
+Event id strategies.
+
+Event ids are the primary key of the events tables. Random ids (the
+historical ``uuid4`` default) land on a random B-tree page on every insert;
+time-ordered ids land on the rightmost page, so inserts stay append-mostly.
+All strategies use the ``evt_`` prefix of ``DomainEvent`` ids:
+
+- ``uuid4``: ``evt_`` + 32 hex chars (random)
+- ``ulid``: ``evt_`` + a 26-char ULID (the format of ``CreatePGULID``)
+- ``uuid7``: ``evt_`` + 32 hex chars of a UUIDv7, so ids keep the length of
+  uuid4 ids
+
+ULIDs and UUIDv7s generated in a process are strictly increasing: ids minted
+in the same millisecond (or after the clock steps back) increment the random
+part of the previous id instead of drawing a new one.
+
+The strategy for ``DomainEvent``'s default ids is process-wide; set it with
+``set_event_id_strategy`` (``EventsConfig.event_id_strategy`` is applied
+when event services are registered). Batches draw their randomness in a
+single call.
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+import threading
+import time
+from typing import Literal
+
+EVENT_ID_PREFIX = "evt_"
+
+EventIdKind = Literal["uuid4", "ulid", "uuid7"]
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# RFC 4648 base32 alphabet -> Crockford alphabet (same 5-bit values)
+_TO_CROCKFORD = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", _CROCKFORD)
+_VARIANT = "89ab"
+
+_ULID_RANDOM_BITS = 80
+_UUID7_RANDOM_BITS = 74
+
+
+class _MonotonicClock:
+    """Hands out increasing (millisecond, random) pairs for time-ordered ids."""
+
+    def __init__(self, random_bits: int) -> None:
+        self._lock = threading.Lock()
+        self._random_bits = random_bits
+        self._last_ms = 0
+        self._last_random = 0
+
+    def reserve(self, count: int) -> tuple[int, int]:
+        """Reserve ``count`` consecutive random values; returns (ms, first value)."""
+        limit = 1 << self._random_bits
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms > self._last_ms:
+                ms, start = now_ms, self._fresh()
+            else:
+                ms, start = self._last_ms, self._last_random + 1
+            if start + count > limit:
+                # Random space for this millisecond exhausted: borrow the next one
+                ms, start = ms + 1, self._fresh()
+            self._last_ms = ms
+            self._last_random = start + count - 1
+            return ms, start
+
+    def _fresh(self) -> int:
+        # Top bit clear, leaving half the space for increments
+        return int.from_bytes(os.urandom(16), "big") >> (129 - self._random_bits)
+
+
+_ulid_clock = _MonotonicClock(_ULID_RANDOM_BITS)
+_uuid7_clock = _MonotonicClock(_UUID7_RANDOM_BITS)
+
+
+def uuid4_batch(count: int) -> list[str]:
+    """Generate ``count`` prefixed uuid4 hex ids from a single urandom call."""
+    digits = os.urandom(16 * count).hex()
+    ids = []
+    for offset in range(0, 32 * count, 32):
+        h = digits[offset : offset + 32]
+        ids.append(
+            f"{EVENT_ID_PREFIX}{h[:12]}4{h[13:16]}{_VARIANT[int(h[16], 16) & 3]}{h[17:]}"
+        )
+    return ids
+
+
+def _encode_time(timestamp_ms: int) -> str:
+    chars = []
+    for _ in range(10):
+        chars.append(_CROCKFORD[timestamp_ms & 31])
+        timestamp_ms >>= 5
+    return "".join(reversed(chars))
+
+
+def ulid_batch(count: int) -> list[str]:
+    """Generate ``count`` prefixed ULIDs, increasing within the process."""
+    ms, start = _ulid_clock.reserve(count)
+    prefix = EVENT_ID_PREFIX + _encode_time(ms)
+    randomness = b"".join((start + i).to_bytes(10, "big") for i in range(count))
+    encoded = base64.b32encode(randomness).decode().translate(_TO_CROCKFORD)
+    return [
+        prefix + encoded[offset : offset + 16] for offset in range(0, 16 * count, 16)
+    ]
+
+
+def uuid7_batch(count: int) -> list[str]:
+    """Generate ``count`` prefixed UUIDv7 hex ids, increasing within the process."""
+    ms, start = _uuid7_clock.reserve(count)
+    high = (ms << 80) | (0x7 << 76)
+    ids = []
+    for value in range(start, start + count):
+        # 12 bits of rand_a, then the variant, then 62 bits of rand_b
+        uuid = high | ((value >> 62) << 64) | (0b10 << 62) | (value & ((1 << 62) - 1))
+        ids.append(f"{EVENT_ID_PREFIX}{uuid:032x}")
+    return ids
+
+
+_BATCHES = {"uuid4": uuid4_batch, "ulid": ulid_batch, "uuid7": uuid7_batch}
+
+
+class _StrategyHolder:
+    """Holds the process-wide strategy for default event ids."""
+
+    def __init__(self) -> None:
+        self.kind: EventIdKind = "uuid4"
+
+
+_strategy = _StrategyHolder()
+
+
+def set_event_id_strategy(kind: EventIdKind) -> None:
+    """Set the strategy used for default event ids in this process."""
+    if kind not in _BATCHES:
+        raise ValueError(f"Unknown event id strategy {kind!r}")
+    _strategy.kind = kind
+
+
+def get_event_id_strategy() -> EventIdKind:
+    """Return the strategy used for default event ids in this process."""
+    return _strategy.kind
+
+
+def new_event_id() -> str:
+    """Generate one event id with the configured strategy (DomainEvent's default)."""
+    return _BATCHES[_strategy.kind](1)[0]
+
+
+def new_event_ids(count: int, kind: EventIdKind | None = None) -> list[str]:
+    """Generate a batch of event ids (with the configured strategy by default)."""
+    return _BATCHES[kind or _strategy.kind](count)
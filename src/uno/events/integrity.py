@@ -0,0 +1,394 @@
+"""
+Checkpointed integrity verification for event streams.
+
+Each event's hash covers its canonical content, and ``previous_hash`` (when set)
+chains it to the event before it. Rehashing a whole stream on every audit is
+O(total events), so verification is anchored on ``StreamCheckpoint`` records:
+a trusted checkpoint covers a stream's first ``version`` events with a Merkle
+root over their hashes. Verifying a stream then only rehashes the events
+appended since its checkpoint, and yields the next checkpoint.
+
+The Merkle root is kept as a Merkle mountain range (the roots of the perfect
+subtrees covering the stream, stored as ``peaks``), so a checkpoint can be
+extended with new events without revisiting the old ones.
+
+``BulkStreamVerifier`` fans verification of many streams out over a process
+pool and reports throughput.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from pydantic import Field
+
+from uno.base_model import FrameworkBaseModel
+from uno.errors.result import Failure, Result, Success
+from uno.events.base_event import DomainEvent, compute_canonical_hash, event_hash_input
+from uno.events.errors import EventIntegrityError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from uno.events.interfaces import EventStoreProtocol
+    from uno.services.hash_service_protocol import HashServiceProtocol
+
+# (canonical dict, stored event_hash, previous_hash) of one event
+HashedEvent = tuple[dict[str, Any], str, str | None]
+
+
+class StreamCheckpoint(FrameworkBaseModel):
+    """
+    Trusted integrity checkpoint covering the first ``version`` events of a stream.
+
+    Attributes:
+        aggregate_id: The stream's aggregate ID
+        version: Number of events covered
+        merkle_root: Merkle root over the covered events' hashes
+        peaks: Merkle mountain range peaks, used to extend the checkpoint
+        last_event_hash: Hash of the last covered event (the chain head)
+        created_at: When the checkpoint was taken (epoch seconds)
+    """
+
+    aggregate_id: str
+    version: int = 0
+    merkle_root: str = ""
+    peaks: list[str] = Field(default_factory=list)
+    last_event_hash: str | None = None
+    created_at: float = Field(default_factory=time.time)
+
+
+def _node(left: str, right: str) -> str:
+    return hashlib.sha256(bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def _bag_peaks(peaks: Sequence[str]) -> str:
+    if not peaks:
+        return ""
+    root = peaks[-1]
+    for peak in reversed(peaks[:-1]):
+        root = _node(peak, root)
+    return root
+
+
+def _append_leaves(
+    count: int, peaks: list[str], leaves: Iterable[str]
+) -> tuple[int, list[str]]:
+    """Append leaf hashes to a Merkle mountain range of ``count`` leaves."""
+    peaks = list(peaks)
+    for leaf in leaves:
+        peaks.append(leaf)
+        count += 1
+        # Each trailing zero bit of the new count is a pair of equal-height
+        # peaks to merge
+        merges = (count & -count).bit_length() - 1
+        for _ in range(merges):
+            right = peaks.pop()
+            peaks.append(_node(peaks.pop(), right))
+    return count, peaks
+
+
+def merkle_root(event_hashes: Sequence[str]) -> str:
+    """Merkle root over a sequence of hex event hashes ("" for no events)."""
+    return _bag_peaks(_append_leaves(0, [], event_hashes)[1])
+
+
+def extend_checkpoint(
+    checkpoint: StreamCheckpoint, event_hashes: Sequence[str]
+) -> StreamCheckpoint:
+    """Return a checkpoint that also covers ``event_hashes``, appended in order."""
+    if not event_hashes:
+        return checkpoint
+    count, peaks = _append_leaves(checkpoint.version, checkpoint.peaks, event_hashes)
+    return StreamCheckpoint(
+        aggregate_id=checkpoint.aggregate_id,
+        version=count,
+        merkle_root=_bag_peaks(peaks),
+        peaks=peaks,
+        last_event_hash=event_hashes[-1],
+    )
+
+
+def create_checkpoint(
+    aggregate_id: str,
+    events: Sequence[DomainEvent],
+    previous: StreamCheckpoint | None = None,
+) -> StreamCheckpoint:
+    """
+    Checkpoint a stream from its stored hashes, without rehashing event content.
+
+    Args:
+        aggregate_id: The stream's aggregate ID
+        events: The events after ``previous`` (the whole stream if None)
+        previous: Checkpoint to extend
+    """
+    return extend_checkpoint(
+        previous or StreamCheckpoint(aggregate_id=aggregate_id),
+        [event.event_hash for event in events],
+    )
+
+
+def _verify_hashed_events(
+    aggregate_id: str,
+    checkpoint: StreamCheckpoint,
+    events: Sequence[HashedEvent],
+    hash_service: HashServiceProtocol | None = None,
+) -> StreamCheckpoint:
+    """Rehash events appended after ``checkpoint`` and check the hash chain."""
+    if hash_service is None:
+        compute_hash = compute_canonical_hash
+    else:
+
+        def compute_hash(data: dict[str, Any]) -> str:
+            return hash_service.compute_hash(event_hash_input(data).decode())
+
+    previous_hash = checkpoint.last_event_hash
+    version = checkpoint.version
+    hashes = []
+    for data, event_hash, chained_hash in events:
+        version += 1
+        if not event_hash:
+            raise EventIntegrityError(aggregate_id, version, "event has no hash")
+        if compute_hash(data) != event_hash:
+            raise EventIntegrityError(
+                aggregate_id, version, "event hash does not match its content"
+            )
+        if chained_hash is not None and chained_hash != previous_hash:
+            raise EventIntegrityError(
+                aggregate_id, version, "previous_hash does not match the chain"
+            )
+        previous_hash = event_hash
+        hashes.append(event_hash)
+    return extend_checkpoint(checkpoint, hashes)
+
+
+def _hashed(events: Iterable[DomainEvent]) -> list[HashedEvent]:
+    return [
+        (event.canonical_dict(), event.event_hash, event.previous_hash)
+        for event in events
+    ]
+
+
+def verify_since_checkpoint(
+    aggregate_id: str,
+    events: Sequence[DomainEvent],
+    checkpoint: StreamCheckpoint | None = None,
+    hash_service: HashServiceProtocol | None = None,
+) -> Result[StreamCheckpoint, Exception]:
+    """
+    Verify the events appended to a stream since its last trusted checkpoint.
+
+    Only ``events`` are rehashed; the checkpointed prefix is trusted.
+
+    Args:
+        aggregate_id: The stream's aggregate ID
+        events: The events after ``checkpoint`` in stream order (the whole
+            stream if there is no checkpoint)
+        checkpoint: The last trusted checkpoint, if any
+        hash_service: The hash service the events were hashed with (SHA-256
+            if None, as in set_event_hash)
+
+    Returns:
+        Result with the checkpoint extended over ``events``, or an
+        EventIntegrityError
+    """
+    try:
+        return Success(
+            _verify_hashed_events(
+                aggregate_id,
+                checkpoint or StreamCheckpoint(aggregate_id=aggregate_id),
+                _hashed(events),
+                hash_service,
+            )
+        )
+    except EventIntegrityError as exc:
+        return Failure(exc)
+
+
+def verify_checkpoint(
+    events: Sequence[DomainEvent], checkpoint: StreamCheckpoint
+) -> bool:
+    """
+    Check that the first ``checkpoint.version`` events still hash to the
+    checkpoint's Merkle root (a cheap audit of the stored hashes of a prefix).
+    """
+    if len(events) < checkpoint.version:
+        return False
+    hashes = [event.event_hash for event in events[: checkpoint.version]]
+    return merkle_root(hashes) == checkpoint.merkle_root
+
+
+def _verify_batch(
+    streams: list[tuple[str, dict[str, Any] | None, list[HashedEvent]]],
+    hash_service: HashServiceProtocol | None = None,
+) -> list[tuple[str, dict[str, Any] | None, str | None, int]]:
+    """Process pool worker: verify a batch of streams."""
+    results = []
+    for aggregate_id, checkpoint_data, events in streams:
+        checkpoint = (
+            StreamCheckpoint.model_validate(checkpoint_data)
+            if checkpoint_data is not None
+            else StreamCheckpoint(aggregate_id=aggregate_id)
+        )
+        try:
+            verified = _verify_hashed_events(
+                aggregate_id, checkpoint, events, hash_service
+            )
+            results.append((aggregate_id, verified.model_dump(), None, len(events)))
+        except EventIntegrityError as exc:
+            results.append((aggregate_id, None, str(exc), len(events)))
+    return results
+
+
+class VerificationReport(FrameworkBaseModel):
+    """
+    Outcome of a bulk verification run.
+
+    Attributes:
+        streams: Number of streams verified
+        events: Number of events rehashed
+        elapsed_seconds: Wall-clock duration of the run
+        checkpoints: New checkpoint for every stream that verified
+        failures: Error message for every stream that failed
+    """
+
+    streams: int = 0
+    events: int = 0
+    elapsed_seconds: float = 0.0
+    checkpoints: dict[str, StreamCheckpoint] = Field(default_factory=dict)
+    failures: dict[str, str] = Field(default_factory=dict)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def streams_per_second(self) -> float:
+        return self.streams / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BulkStreamVerifier:
+    """
+    Verify many streams in parallel over a process pool.
+
+    Streams are loaded from the event store in batches (only the events after
+    each stream's checkpoint, including any in the archive tier), and each
+    batch is rehashed in a worker process. Events are rehashed with SHA-256,
+    the default event hash, unless the hash service they were hashed with is
+    given; it is sent to the workers, so it must be picklable.
+
+    Usage:
+        verifier = BulkStreamVerifier(event_store, max_workers=8)
+        report = await verifier.verify(aggregate_ids, checkpoints)
+        for checkpoint in report.checkpoints.values():
+            await snapshot_store.save_checkpoint(checkpoint)
+    """
+
+    def __init__(
+        self,
+        event_store: EventStoreProtocol[Any],
+        max_workers: int | None = None,
+        batch_size: int = 100,
+        hash_service: HashServiceProtocol | None = None,
+    ) -> None:
+        """
+        Args:
+            event_store: Store to load streams from
+            max_workers: Worker processes (defaults to the CPU count)
+            batch_size: Streams loaded and sent to a worker at a time
+            hash_service: The hash service events were hashed with (SHA-256 if None)
+        """
+        self.event_store = event_store
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.hash_service = hash_service
+
+    async def _load_batch(
+        self,
+        aggregate_ids: Sequence[str],
+        checkpoints: Mapping[str, StreamCheckpoint],
+    ) -> list[tuple[str, dict[str, Any] | None, list[HashedEvent]]]:
+        fresh = [a for a in aggregate_ids if a not in checkpoints]
+        streams: dict[str, list[DomainEvent]] = {}
+        if fresh:
+            result = await self.event_store.get_events_for_aggregates(fresh)
+            if result.is_failure:
+                raise result.error
+            streams.update(result.value)
+        for aggregate_id in aggregate_ids:
+            checkpoint = checkpoints.get(aggregate_id)
+            if checkpoint is None:
+                continue
+            result = await self.event_store.get_stream_range(
+                aggregate_id, after_version=checkpoint.version
+            )
+            if result.is_failure:
+                raise result.error
+            streams[aggregate_id] = result.value
+
+        batch = []
+        for aggregate_id in aggregate_ids:
+            checkpoint = checkpoints.get(aggregate_id)
+            batch.append(
+                (
+                    aggregate_id,
+                    checkpoint.model_dump() if checkpoint is not None else None,
+                    _hashed(streams.get(aggregate_id, [])),
+                )
+            )
+        return batch
+
+    async def verify(
+        self,
+        aggregate_ids: Sequence[str],
+        checkpoints: Mapping[str, StreamCheckpoint] | None = None,
+    ) -> VerificationReport:
+        """
+        Verify the given streams, rehashing only events after their checkpoints.
+
+        Args:
+            aggregate_ids: Streams to verify
+            checkpoints: Last trusted checkpoint per stream, if any
+
+        Returns:
+            A report with throughput, failures and the new checkpoints.
+        """
+        checkpoints = checkpoints or {}
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        verified: dict[str, StreamCheckpoint] = {}
+        failures: dict[str, str] = {}
+        event_count = 0
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = []
+            for offset in range(0, len(aggregate_ids), self.batch_size):
+                batch = await self._load_batch(
+                    aggregate_ids[offset : offset + self.batch_size], checkpoints
+                )
+                # Load the next batch while workers hash this one
+                pending.append(
+                    loop.run_in_executor(pool, _verify_batch, batch, self.hash_service)
+                )
+
+            for results in await asyncio.gather(*pending):
+                for aggregate_id, checkpoint, error, count in results:
+                    event_count += count
+                    if error is not None:
+                        failures[aggregate_id] = error
+                    else:
+                        verified[aggregate_id] = StreamCheckpoint.model_validate(
+                            checkpoint
+                        )
+
+        return VerificationReport(
+            streams=len(verified) + len(failures),
+            events=event_count,
+            elapsed_seconds=time.perf_counter() - started,
+            checkpoints=verified,
+            failures=failures,
+        )
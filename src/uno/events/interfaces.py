@@ -5,9 +5,14 @@ Defines all core event, bus, handler, and store protocols/ABCs.
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, TypeVar, Generic
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, Generic
 from uno.errors.result import Result
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from uno.events.envelope import EventEnvelope
+
 E = TypeVar("E", bound="DomainEvent")
 C = TypeVar("C", bound="Command")
 T = TypeVar("T")
@@ -64,10 +69,38 @@ class EventStoreProtocol(Protocol, Generic[E]):
     """
 
     async def save_event(self, event: E) -> Result[None, Exception]: ...
+    async def save_events(
+        self, events: list[E], expected_version: int | None = None
+    ) -> Result[None, Exception]: ...
     async def get_events(self, *args, **kwargs) -> Result[list[E], Exception]: ...
     async def get_events_by_aggregate_id(
         self, aggregate_id: str, event_types: list[str] | None = None
     ) -> Result[list[E], Exception]: ...
+    async def get_events_for_aggregates(
+        self, aggregate_ids: Sequence[str]
+    ) -> Result[dict[str, list[E]], Exception]: ...
+    async def get_stream_range(
+        self,
+        aggregate_id: str,
+        after_version: int = 0,
+        to_version: int | None = None,
+        to_timestamp: float | None = None,
+    ) -> Result[list[E], Exception]: ...
+    def stream_events(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[E]: ...
+    def stream_envelopes(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+    ) -> AsyncIterator[EventEnvelope]: ...
 
 
 # --- Command Handler Protocol (CQRS) ---
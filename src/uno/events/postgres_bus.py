@@ -3,6 +3,12 @@ Postgres-backed EventBus and CommandBus for Uno using asyncpg.
 - Publishes events/commands by inserting into a table and issuing NOTIFY.
 - Listeners use LISTEN to get notified and then fetch new events/commands from the table.
 - Ensures durability and real-time delivery (best effort).
+- ``connect()`` creates the bus table if needed.
+- With ``compact=True``, events whose schema is in the EventSchemaRegistry are
+  written as their compact type id and a schema-laid-out msgpack payload
+  (columns ``type_id``, ``event_version`` and ``payload_bin``, added to existing
+  tables by ``connect()``). Listeners load the schemas they are missing from
+  the ``event_schemas`` table that PostgresEventSchemaStore maintains.
 """
 
 import asyncio
@@ -11,23 +17,65 @@ import json
 from collections.abc import Awaitable, Callable
 from typing import Any
 
+from uno.events.envelope import EventEnvelope
+from uno.events.schema_registry import EventSchema, EventSchemaRegistry
+
 
 class PostgresBus:
-    def __init__(self, dsn: str, channel: str, table: str) -> None:
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        table: str,
+        compact: bool = False,
+        schema_table: str = "event_schemas",
+    ) -> None:
         self._dsn = dsn
         self._channel = channel
         self._table = table
+        self._compact = compact
+        self._schema_table = schema_table
         self._listeners: list[Callable[[dict[str, Any]], Awaitable[None]]] = []
         self._conn: asyncpg.Connection | None = None
 
     async def connect(self) -> None:
         self._conn = await asyncpg.connect(self._dsn)
+        await self._ensure_table()
         await self._conn.execute(f"LISTEN {self._channel}")
         asyncio.create_task(self._listen_loop())
 
-    async def publish(self, payload: dict[str, Any]) -> None:
+    async def _ensure_table(self) -> None:
+        """Create the bus table, adding the compact columns in compact mode."""
         assert self._conn is not None
-        if hasattr(payload, "model_dump"):
+        await self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self._table} (
+                id BIGSERIAL PRIMARY KEY,
+                payload JSONB,
+                processed BOOLEAN NOT NULL DEFAULT FALSE
+            )
+        """
+        )
+        if self._compact:
+            await self._conn.execute(
+                f"""
+                ALTER TABLE {self._table}
+                    ADD COLUMN IF NOT EXISTS type_id SMALLINT,
+                    ADD COLUMN IF NOT EXISTS event_version INT,
+                    ADD COLUMN IF NOT EXISTS payload_bin BYTEA,
+                    ALTER COLUMN payload DROP NOT NULL
+            """
+            )
+
+    async def publish(self, payload: dict[str, Any] | EventEnvelope) -> None:
+        assert self._conn is not None
+        if self._compact and await self._publish_compact(payload):
+            return
+        if isinstance(payload, EventEnvelope):
+            # Forward the stored payload without validating it into an event
+            raw = payload.raw_payload()
+            data = raw.decode() if isinstance(raw, bytes) else json.dumps(raw)
+        elif hasattr(payload, "model_dump"):
             data = json.dumps(
                 payload.model_dump(
                     mode="json", by_alias=True, exclude_unset=True, exclude_none=True
@@ -43,6 +91,53 @@ class PostgresBus:
         )
         await self._conn.execute(f"NOTIFY {self._channel}")
 
+    async def _publish_compact(self, payload: Any) -> bool:
+        """Write an event as (type id, compact payload) if its schema is known."""
+        assert self._conn is not None
+        if not hasattr(payload, "canonical_dict"):
+            return False
+        schema = EventSchemaRegistry.lookup(payload.event_type, payload.version)
+        if schema is None:
+            return False
+        data = EventSchemaRegistry.encode(schema, payload.canonical_dict())
+        if data is None:
+            return False
+        await self._conn.execute(
+            f"""
+            INSERT INTO {self._table} (type_id, event_version, payload_bin)
+            VALUES ($1, $2, $3)
+        """,
+            schema.type_id,
+            schema.version,
+            data,
+        )
+        await self._conn.execute(f"NOTIFY {self._channel}")
+        return True
+
+    async def _load_schemas(self, rows: list[Any]) -> None:
+        """Reload the schema registry unless it can decode every compact row."""
+        assert self._conn is not None
+        if all(
+            EventSchemaRegistry.covers(
+                row["type_id"], row["event_version"], row["payload_bin"]
+            )
+            for row in rows
+            if row["type_id"] is not None
+        ):
+            return
+        stored = await self._conn.fetch(
+            f"SELECT type_id, version, event_type, fields FROM {self._schema_table}"
+        )
+        for row in stored:
+            EventSchemaRegistry.add(
+                EventSchema(
+                    type_id=row["type_id"],
+                    event_type=row["event_type"],
+                    version=row["version"],
+                    fields=tuple(json.loads(row["fields"])),
+                )
+            )
+
     def subscribe(self, handler: Callable[[dict[str, Any]], Awaitable[None]]) -> None:
         self._listeners.append(handler)
 
@@ -51,11 +146,23 @@ class PostgresBus:
         while True:
             msg = await self._conn.connection.notifies.get()
             # Fetch all new rows from table
+            columns = (
+                "id, payload, type_id, event_version, payload_bin"
+                if self._compact
+                else "id, payload"
+            )
             rows = await self._conn.fetch(
-                f"SELECT id, payload FROM {self._table} WHERE processed = FALSE ORDER BY id"
+                f"SELECT {columns} FROM {self._table} WHERE processed = FALSE ORDER BY id"
             )
+            if self._compact:
+                await self._load_schemas(rows)
             for row in rows:
-                payload = json.loads(row["payload"])
+                if self._compact and row["type_id"] is not None:
+                    payload = EventSchemaRegistry.decode(
+                        row["type_id"], row["event_version"], row["payload_bin"]
+                    )
+                else:
+                    payload = json.loads(row["payload"])
                 for handler in self._listeners:
                     await handler(payload)
                 await self._conn.execute(
@@ -65,8 +172,16 @@ class PostgresBus:
 
 
 class PostgresEventBus(PostgresBus):
-    def __init__(self, dsn: str) -> None:
-        super().__init__(dsn, channel="uno_events", table="uno_events")
+    def __init__(
+        self, dsn: str, compact: bool = False, schema_table: str = "event_schemas"
+    ) -> None:
+        super().__init__(
+            dsn,
+            channel="uno_events",
+            table="uno_events",
+            compact=compact,
+            schema_table=schema_table,
+        )
 
 
 class PostgresCommandBus(PostgresBus):
@@ -3,28 +3,152 @@ PostgreSQL event store implementation.
 """
 
 from __future__ import annotations
-from typing import Any, Generic, List, Optional, TypeVar
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from functools import partial
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 from datetime import datetime, UTC
-from sqlalchemy import Table, Column, String, Integer, JSON, DateTime, MetaData, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Identity,
+    Table,
+    Column,
+    String,
+    Integer,
+    JSON,
+    DateTime,
+    LargeBinary,
+    MetaData,
+    SmallInteger,
+    Text,
+    UniqueConstraint,
+    any_,
+    bindparam,
+    cast,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.exc import IntegrityError
 from uno.events.base_event import DomainEvent
+from uno.events.codecs import EncodedPayload, EventStorageCodec, PayloadCodec
+from uno.events.decoding import EventDecoder, LazyEvent
+from uno.events.envelope import EventEnvelope
+from uno.events.errors import ConcurrencyConflictError
+from uno.events.schema_registry import (
+    EventSchema,
+    EventSchemaRegistry,
+    PostgresEventSchemaStore,
+)
 from uno.events.event_store import EventStore
 from uno.errors.result import Result, Success, Failure
 from uno.persistence.sql.config import SQLConfig
 from uno.persistence.sql.connection import ConnectionManager
 from uno.logging.logger import LoggerService
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql import Select
+
+    from uno.events.archive import PostgresEventArchive
+
 E = TypeVar("E", bound=DomainEvent)
 
+# Rows per multi-row INSERT statement; keeps each statement well below the
+# driver's bind-parameter limit for large commits.
+INSERT_BATCH_SIZE = 1000
+
+# Unique (aggregate_id, version) constraint that serialises appends per stream
+STREAM_VERSION_CONSTRAINT = "uq_events_aggregate_version"
+# Version conflicts are also reported under the domain_events constraint (by its
+# unique index, or by check_event_version when the table is partitioned by month)
+STREAM_VERSION_CONSTRAINTS = (
+    STREAM_VERSION_CONSTRAINT,
+    "uq_domain_events_aggregate_version",
+)
+
+# Bring an events table created before the current layout up to date;
+# metadata.create_all() only creates missing tables. Every statement is
+# idempotent. The version column used to hold the event's schema version: the
+# run that adds event_version moves it there and renumbers version as the
+# position in the stream, before the stream version index is built.
+EVENTS_TABLE_MIGRATIONS = (
+    """
+    ALTER TABLE events
+        ADD COLUMN IF NOT EXISTS global_position BIGINT GENERATED BY DEFAULT AS IDENTITY
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS events_global_position_key
+        ON events (global_position)
+    """,
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+                AND table_name = 'events' AND column_name = 'event_version'
+        ) THEN
+            ALTER TABLE events ADD COLUMN event_version INTEGER;
+            UPDATE events SET event_version = version;
+            UPDATE events SET version = numbered.stream_version
+            FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY aggregate_id ORDER BY created_at, global_position
+                ) AS stream_version
+                FROM events
+            ) AS numbered
+            WHERE events.id = numbered.id;
+            ALTER TABLE events ALTER COLUMN event_version SET NOT NULL;
+        END IF;
+    END $$
+    """,
+    f"""
+    CREATE UNIQUE INDEX IF NOT EXISTS {STREAM_VERSION_CONSTRAINT}
+        ON events (aggregate_id, version)
+    """,
+    "ALTER TABLE events ADD COLUMN IF NOT EXISTS event_type_id SMALLINT",
+    "ALTER TABLE events ADD COLUMN IF NOT EXISTS payload_bin BYTEA",
+    f"""
+    ALTER TABLE events
+        ADD COLUMN IF NOT EXISTS codec SMALLINT NOT NULL DEFAULT {int(PayloadCodec.JSON)}
+    """,
+    "ALTER TABLE events ALTER COLUMN payload DROP NOT NULL",
+    """
+    DO $$
+    BEGIN
+        IF EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = current_schema()
+                AND table_name = 'events' AND column_name = 'created_at'
+                AND data_type = 'timestamp without time zone'
+        ) THEN
+            ALTER TABLE events
+                ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE 'UTC';
+        END IF;
+    END $$
+    """,
+)
+
 
 class PostgresEventStore(EventStore[E], Generic[E]):
     """PostgreSQL event store implementation."""
 
-    def __init__(
+    # The codec and storage collaborators are optional and keyword-only
+    def __init__(  # noqa: PLR0913
         self,
         config: SQLConfig,
         connection_manager: ConnectionManager,
         logger: LoggerService,
+        *,
+        decoder: EventDecoder | None = None,
+        codec: EventStorageCodec | None = None,
+        archive: PostgresEventArchive | None = None,
+        schema_store: PostgresEventSchemaStore | None = None,
     ) -> None:
         """Initialize PostgreSQL event store.
 
@@ -32,13 +156,25 @@ class PostgresEventStore(EventStore[E], Generic[E]):
             config: SQL configuration
             connection_manager: Connection manager
             logger: Logger service
+            decoder: Compiled event decoder cache (a private one is created if omitted)
+            codec: Storage codec for new payloads (plain JSON if omitted); rows
+                written with any codec remain readable
+            archive: Optional cold-stream archive tier; when set, aggregate reads
+                include archived streams and appends promote them back
+            schema_store: Optional event schema registry store; when set, rows
+                carry a compact ``event_type_id`` and payloads are written as
+                schema-laid-out msgpack arrays (``PayloadCodec.COMPACT``)
         """
         self._config = config
         self._connection_manager = connection_manager
         self.logger = logger
+        self._decoder = decoder or EventDecoder()
+        self._codec = codec or EventStorageCodec()
+        self._archive = archive
+        self._schema_store = schema_store
         self._metadata = MetaData()
         self._table = self._create_event_table()
-        self._ensure_table_exists()
+        self._tables_ready = False
 
     def _create_event_table(self) -> Table:
         """Create event table definition."""
@@ -46,19 +182,53 @@ class PostgresEventStore(EventStore[E], Generic[E]):
             "events",
             self._metadata,
             Column("id", String, primary_key=True),
+            Column(
+                "global_position",
+                BigInteger,
+                Identity(),
+                nullable=False,
+                unique=True,
+            ),
             Column("aggregate_id", String, nullable=False, index=True),
             Column("event_type", String, nullable=False),
+            # Compact id from the event schema registry (set with a schema store)
+            Column("event_type_id", SmallInteger, nullable=True),
             Column("version", Integer, nullable=False),
-            Column("payload", JSON, nullable=False),
-            Column("created_at", DateTime, nullable=False, default=datetime.now(UTC)),
+            Column("event_version", Integer, nullable=False, default=1),
+            # Exactly one of payload/payload_bin is set, according to codec
+            Column("payload", JSON(none_as_null=True), nullable=True),
+            Column("payload_bin", LargeBinary, nullable=True),
+            Column(
+                "codec",
+                SmallInteger,
+                nullable=False,
+                default=PayloadCodec.JSON,
+                server_default=str(int(PayloadCodec.JSON)),
+            ),
+            Column(
+                "created_at",
+                DateTime(timezone=True),
+                nullable=False,
+                default=lambda: datetime.now(UTC),
+            ),
             Column("event_hash", String, nullable=False),
+            UniqueConstraint("aggregate_id", "version", name=STREAM_VERSION_CONSTRAINT),
         )
 
     async def _ensure_table_exists(self) -> None:
-        """Ensure event table exists."""
+        """Ensure the event table exists and has the current layout (once per store)."""
+        if self._tables_ready:
+            return
         try:
             async with self._connection_manager.engine.begin() as conn:
                 await conn.run_sync(self._metadata.create_all)
+                for statement in EVENTS_TABLE_MIGRATIONS:
+                    await conn.execute(text(statement))
+                if self._archive is not None:
+                    await conn.run_sync(self._archive.metadata.create_all)
+                if self._schema_store is not None:
+                    await conn.run_sync(self._schema_store.metadata.create_all)
+            self._tables_ready = True
         except Exception as e:
             self.logger.structured_log(
                 "ERROR",
@@ -68,6 +238,13 @@ class PostgresEventStore(EventStore[E], Generic[E]):
             )
             raise
 
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[AsyncSession]:
+        """A connection from the manager, once the tables are set up."""
+        await self._ensure_table_exists()
+        async with self._connection_manager.get_connection() as conn:
+            yield conn
+
     async def save_event(self, event: E) -> Result[None, Exception]:
         """Save a domain event to the store.
 
@@ -77,36 +254,233 @@ class PostgresEventStore(EventStore[E], Generic[E]):
         Returns:
             Result indicating success or failure
         """
+        return await self.save_events([event])
+
+    async def save_events(
+        self,
+        events: list[E],
+        expected_version: int | None = None,
+        session: AsyncSession | None = None,
+    ) -> Result[None, Exception]:
+        """Save a batch of domain events in a single transaction.
+
+        The whole batch is written with multi-row INSERT statements and committed
+        once, instead of one round trip and commit per event. Each row's
+        ``version`` column is its position in the aggregate's stream.
+
+        Appends are optimistic: the unique (aggregate_id, version) constraint
+        rejects a second writer that numbered its events from the same stream
+        head, so writers for different aggregates never block each other and no
+        advisory locks are needed.
+
+        Args:
+            events: The domain events to save, in stream order
+            expected_version: The stream version the caller expects the aggregate
+                to be at before the append, or None to skip the check
+            session: Optional session of an enclosing unit of work; when given,
+                the rows are written in that transaction and not committed here
+
+        Returns:
+            Result indicating success or failure (ConcurrencyConflictError if
+            another writer appended to the stream first)
+        """
+        if not events:
+            return Success(None)
+
         try:
-            async with self._connection_manager.get_connection() as session:
-                stmt = self._table.insert().values(
-                    id=event.event_id,
-                    aggregate_id=event.aggregate_id,
-                    event_type=event.event_type,
-                    version=event.version,
-                    payload=self._canonical_event_dict(event),
-                    event_hash=event.event_hash,
-                )
-                await session.execute(stmt)
-                await session.commit()
+            try:
+                if session is not None:
+                    await self._ensure_table_exists()
+                    await self._append_events(session, events, expected_version)
+                else:
+                    async with self._connection() as conn:
+                        await self._append_events(conn, events, expected_version)
+                        await conn.commit()
+            except IntegrityError as e:
+                message = str(e.orig)
+                if not any(name in message for name in STREAM_VERSION_CONSTRAINTS):
+                    raise
+                raise ConcurrencyConflictError(
+                    events[0].aggregate_id, expected_version
+                ) from e
 
             self.logger.structured_log(
                 "INFO",
-                f"Saved event {event.event_type} for aggregate {event.aggregate_id}",
+                f"Saved {len(events)} events",
                 name="uno.events.pgstore",
-                event_id=event.event_id,
-                aggregate_id=event.aggregate_id,
+                event_ids=[event.event_id for event in events],
             )
             return Success(None)
+        except ConcurrencyConflictError as conflict:
+            self.logger.structured_log(
+                "WARNING",
+                f"Failed to save {len(events)} events: {conflict}",
+                name="uno.events.pgstore",
+                error=conflict,
+            )
+            return Failure(conflict)
         except Exception as e:
             self.logger.structured_log(
                 "ERROR",
-                f"Failed to save event {event.event_type}: {e}",
+                f"Failed to save {len(events)} events: {e}",
                 name="uno.events.pgstore",
                 error=e,
             )
             return Failure(e)
 
+    async def _append_events(
+        self,
+        session: AsyncSession,
+        events: list[E],
+        expected_version: int | None,
+    ) -> None:
+        """Insert a batch of events, numbering them after each stream's head."""
+        aggregate_ids = [event.aggregate_id for event in events]
+        if expected_version is not None and len(set(aggregate_ids)) > 1:
+            raise ValueError(
+                "expected_version requires all events to belong to one aggregate"
+            )
+
+        if self._archive is not None:
+            # Archived streams rejoin the hot table before they are appended to
+            await self._archive.promote(session, self._table, set(aggregate_ids))
+
+        stmt = (
+            select(self._table.c.aggregate_id, func.max(self._table.c.version))
+            .where(self._table.c.aggregate_id.in_(set(aggregate_ids)))
+            .group_by(self._table.c.aggregate_id)
+        )
+        result = await session.execute(stmt)
+        stream_versions: dict[str, int] = dict(result.all())
+
+        if expected_version is not None:
+            current_version = stream_versions.get(aggregate_ids[0], 0)
+            if current_version != expected_version:
+                raise ConcurrencyConflictError(
+                    aggregate_ids[0], expected_version, current_version
+                )
+
+        rows = []
+        schemas: dict[tuple[type[DomainEvent], int], EventSchema] = {}
+        for event in events:
+            version = stream_versions.get(event.aggregate_id, 0) + 1
+            stream_versions[event.aggregate_id] = version
+            payload = self._canonical_event_dict(event)
+            type_id = None
+            encoded = None
+            if self._schema_store is not None:
+                schema_key = (type(event), event.version)
+                schema = schemas.get(schema_key)
+                if schema is None:
+                    schema = await self._schema_store.ensure(
+                        session, type(event), event.version
+                    )
+                    schemas[schema_key] = schema
+                type_id = schema.type_id
+                compact = EventSchemaRegistry.encode(schema, payload)
+                if compact is not None:
+                    encoded = EncodedPayload(PayloadCodec.COMPACT, None, compact)
+            if encoded is None:
+                encoded = self._codec.encode(payload)
+            rows.append(
+                {
+                    "id": event.event_id,
+                    "aggregate_id": event.aggregate_id,
+                    "event_type": event.event_type,
+                    "event_type_id": type_id,
+                    "version": version,
+                    "event_version": event.version,
+                    "payload": encoded.json,
+                    "payload_bin": encoded.binary,
+                    "codec": int(encoded.codec),
+                    "created_at": datetime.fromtimestamp(event.timestamp, UTC),
+                    "event_hash": event.event_hash,
+                }
+            )
+
+        events_by_id = {event.event_id: event for event in events}
+        for offset in range(0, len(rows), INSERT_BATCH_SIZE):
+            chunk = rows[offset : offset + INSERT_BATCH_SIZE]
+            result = await session.execute(
+                self._table.insert()
+                .values(chunk)
+                .returning(self._table.c.id, self._table.c.global_position)
+            )
+            for event_id, global_position in result.all():
+                events_by_id[event_id]._global_position = global_position
+
+    def _select_events(self) -> Select[Any]:
+        """Select the columns needed to rehydrate events, with JSON payloads as raw text."""
+        return select(
+            self._table.c.global_position,
+            self._table.c.aggregate_id,
+            self._table.c.version,
+            self._table.c.event_type,
+            self._table.c.event_type_id,
+            self._table.c.event_version,
+            self._table.c.codec,
+            cast(self._table.c.payload, Text).label("payload"),
+            self._table.c.payload_bin,
+        )
+
+    def _rows_to_events(self, rows: Sequence[Any]) -> list[E]:
+        """Rehydrate (and upcast) a batch of stored rows with the compiled decoders."""
+        decode_payload = EventStorageCodec.decode
+        events = self._decoder.decode_rows(
+            [
+                (
+                    row.event_type,
+                    row.event_version,
+                    decode_payload(
+                        row.codec,
+                        row.payload,
+                        row.payload_bin,
+                        row.event_type_id,
+                        row.event_version,
+                    ),
+                )
+                for row in rows
+            ]
+        )
+        for event, row in zip(events, rows, strict=True):
+            event._global_position = row.global_position
+        return events
+
+    async def _load_schemas(self, session: AsyncSession, rows: Sequence[Any]) -> None:
+        """Make sure the registry can decode any compact rows, layouts included."""
+        if self._schema_store is None:
+            return
+        await self._schema_store.ensure_loaded(
+            session,
+            [
+                (row.event_type_id, row.event_version, row.payload_bin)
+                for row in rows
+                if row.codec == PayloadCodec.COMPACT
+            ],
+        )
+
+    def _rows_to_lazy_events(self, rows: Sequence[Any]) -> list[LazyEvent]:
+        """Wrap stored rows without decoding their payloads."""
+        decode_payload = EventStorageCodec.decode
+        return [
+            LazyEvent(
+                self._decoder.get(row.event_type, row.event_version),
+                partial(
+                    decode_payload,
+                    row.codec,
+                    row.payload,
+                    row.payload_bin,
+                    row.event_type_id,
+                    row.event_version,
+                ),
+                event_type=row.event_type,
+                aggregate_id=row.aggregate_id,
+                stream_version=row.version,
+                global_position=row.global_position,
+            )
+            for row in rows
+        ]
+
     async def get_events(
         self,
         aggregate_id: str | None = None,
@@ -120,33 +494,29 @@ class PostgresEventStore(EventStore[E], Generic[E]):
             aggregate_id: The aggregate ID to filter by
             event_type: The event type to filter by
             limit: Maximum number of events to return
-            since_version: Return only events since this version
+            since_version: Return only events at or after this stream version
+                (the ``version`` column, the event's position in its stream)
 
         Returns:
             Result containing list of events or error
         """
         try:
-            async with self._connection_manager.get_connection() as session:
-                stmt = select(self._table)
+            async with self._connection() as session:
+                stmt = self._select_events()
                 if aggregate_id:
                     stmt = stmt.where(self._table.c.aggregate_id == aggregate_id)
                 if event_type:
                     stmt = stmt.where(self._table.c.event_type == event_type)
                 if since_version is not None:
                     stmt = stmt.where(self._table.c.version >= since_version)
-                stmt = stmt.order_by(self._table.c.version)
+                stmt = stmt.order_by(self._table.c.global_position)
                 if limit:
                     stmt = stmt.limit(limit)
 
                 result = await session.execute(stmt)
                 rows = result.fetchall()
-
-                events = []
-                for row in rows:
-                    event_data = dict(row._mapping["payload"])
-                    event_cls = DomainEvent.get_event_class(event_data["event_type"])
-                    upcasted = event_cls.upcast(event_data)
-                    events.append(upcasted)
+                await self._load_schemas(session, rows)
+            events = self._rows_to_events(rows)
 
             self.logger.structured_log(
                 "INFO",
@@ -176,8 +546,8 @@ class PostgresEventStore(EventStore[E], Generic[E]):
             Result containing list of events or error
         """
         try:
-            async with self._connection_manager.get_connection() as session:
-                stmt = select(self._table).where(
+            async with self._connection() as session:
+                stmt = self._select_events().where(
                     self._table.c.aggregate_id == aggregate_id
                 )
                 if event_types:
@@ -187,12 +557,20 @@ class PostgresEventStore(EventStore[E], Generic[E]):
                 result = await session.execute(stmt)
                 rows = result.fetchall()
 
-                events = []
-                for row in rows:
-                    event_data = dict(row._mapping["payload"])
-                    event_cls = DomainEvent.get_event_class(event_data["event_type"])
-                    upcasted = event_cls.upcast(event_data)
-                    events.append(upcasted)
+                if self._archive is not None:
+                    archived = await self._archive.load(session, [aggregate_id])
+                    if aggregate_id in archived:
+                        rows = _merge_rows(
+                            [
+                                row
+                                for row in archived[aggregate_id]
+                                if not event_types or row.event_type in event_types
+                            ],
+                            rows,
+                        )
+                await self._load_schemas(session, rows)
+
+            events = self._rows_to_events(rows)
 
             self.logger.structured_log(
                 "INFO",
@@ -208,3 +586,320 @@ class PostgresEventStore(EventStore[E], Generic[E]):
                 error=e,
             )
             return Failure(e)
+
+    async def get_events_for_aggregates(
+        self, aggregate_ids: Sequence[str]
+    ) -> Result[dict[str, list[E]], Exception]:
+        """Get the event streams of several aggregates in one query.
+
+        The IDs are sent as a single array parameter (``aggregate_id = ANY(:ids)``),
+        so the statement is the same whatever the number of aggregates, and rows
+        come back ordered by (aggregate_id, version) off the stream index.
+
+        Args:
+            aggregate_ids: The IDs of the aggregates to get events for
+
+        Returns:
+            Result containing a dict mapping each aggregate ID that has events to
+            its events in stream order, or error
+        """
+        if not aggregate_ids:
+            return Success({})
+
+        try:
+            async with self._connection() as session:
+                stmt = (
+                    self._select_events()
+                    .where(
+                        self._table.c.aggregate_id
+                        == any_(
+                            bindparam(
+                                "aggregate_ids",
+                                list(dict.fromkeys(aggregate_ids)),
+                                type_=ARRAY(String),
+                            )
+                        )
+                    )
+                    .order_by(self._table.c.aggregate_id, self._table.c.version)
+                )
+                result = await session.execute(stmt)
+                grouped: dict[str, list[Any]] = {}
+                for row in result:
+                    grouped.setdefault(row.aggregate_id, []).append(row)
+
+                if self._archive is not None:
+                    archived = await self._archive.load(session, aggregate_ids)
+                    for aggregate_id, archived_rows in archived.items():
+                        grouped[aggregate_id] = _merge_rows(
+                            archived_rows, grouped.get(aggregate_id, [])
+                        )
+
+                rows = [row for group in grouped.values() for row in group]
+                await self._load_schemas(session, rows)
+
+            streams: dict[str, list[E]] = {}
+            for row, event in zip(rows, self._rows_to_events(rows), strict=True):
+                streams.setdefault(row.aggregate_id, []).append(event)
+
+            self.logger.structured_log(
+                "INFO",
+                f"Retrieved {len(rows)} events for {len(streams)} aggregates",
+                name="uno.events.pgstore",
+            )
+            return Success(streams)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error retrieving events for {len(aggregate_ids)} aggregates: {e}",
+                name="uno.events.pgstore",
+                error=e,
+            )
+            return Failure(e)
+
+    async def get_stream_range(
+        self,
+        aggregate_id: str,
+        after_version: int = 0,
+        to_version: int | None = None,
+        to_timestamp: float | None = None,
+    ) -> Result[list[E], Exception]:
+        """Get a bounded slice of an aggregate's stream in one query.
+
+        The version bounds are a range scan on the (aggregate_id, version)
+        index; the time bound applies to when events were stored (created_at).
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            after_version: Only events with a stream version greater than this
+            to_version: Only events up to and including this stream version
+            to_timestamp: Only events stored at or before this time (epoch seconds)
+
+        Returns:
+            Result containing the events in stream order, or error
+        """
+        cutoff = (
+            datetime.fromtimestamp(to_timestamp, UTC)
+            if to_timestamp is not None
+            else None
+        )
+        try:
+            async with self._connection() as session:
+                stmt = self._select_events().where(
+                    self._table.c.aggregate_id == aggregate_id,
+                    self._table.c.version > after_version,
+                )
+                if to_version is not None:
+                    stmt = stmt.where(self._table.c.version <= to_version)
+                if cutoff is not None:
+                    stmt = stmt.where(self._table.c.created_at <= cutoff)
+                stmt = stmt.order_by(self._table.c.version)
+
+                result = await session.execute(stmt)
+                rows = result.fetchall()
+
+                if self._archive is not None:
+                    archived = await self._archive.load(session, [aggregate_id])
+                    if aggregate_id in archived:
+                        rows = _merge_rows(
+                            [
+                                row
+                                for row in archived[aggregate_id]
+                                if row.version > after_version
+                                and (to_version is None or row.version <= to_version)
+                                and (cutoff is None or row.created_at <= cutoff)
+                            ],
+                            rows,
+                        )
+                await self._load_schemas(session, rows)
+
+            events = self._rows_to_events(rows)
+
+            self.logger.structured_log(
+                "INFO",
+                f"Retrieved {len(events)} events for aggregate {aggregate_id} "
+                f"after version {after_version}",
+                name="uno.events.pgstore",
+            )
+            return Success(events)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error retrieving event range for aggregate {aggregate_id}: {e}",
+                name="uno.events.pgstore",
+                error=e,
+            )
+            return Failure(e)
+
+    async def archive_cold_streams(
+        self, inactive_for: timedelta, limit: int = 1000
+    ) -> Result[int, Exception]:
+        """Move streams with no recent appends into the archive tier.
+
+        Args:
+            inactive_for: Streams whose last append is older than this are archived
+            limit: Maximum number of streams archived in this call
+
+        Returns:
+            Result containing the number of streams archived, or error
+        """
+        if self._archive is None:
+            return Failure(ValueError("This event store has no archive configured"))
+
+        try:
+            async with self._connection() as session:
+                count = await self._archive.archive(
+                    session, self._table, inactive_for, limit
+                )
+                await session.commit()
+
+            self.logger.structured_log(
+                "INFO",
+                f"Archived {count} cold streams",
+                name="uno.events.pgstore",
+            )
+            return Success(count)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Failed to archive cold streams: {e}",
+                name="uno.events.pgstore",
+                error=e,
+            )
+            return Failure(e)
+
+    async def stream_events(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[E]:
+        """Stream events through a server-side cursor, one batch at a time.
+
+        Rows are fetched ``batch_size`` at a time and rehydrated per batch, so
+        replaying or exporting the store never holds more than one batch. Reads
+        are a range scan over the unique ``global_position`` index.
+
+        Positions are handed out when rows are inserted, but transactions
+        commit in their own order: a transaction that took a lower position
+        can commit after a higher one is already visible. A reader that
+        resumes from the last position it saw can therefore skip an event.
+        Readers following the head of a busy store should resume from a
+        position some way behind the last one they handled and drop the
+        events they have already seen.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Number of rows fetched from the cursor per round trip
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+            lazy: Yield LazyEvent proxies that only decode (and upcast) a
+                payload when the event body is accessed (call materialize()
+                for the DomainEvent itself)
+
+        Yields:
+            Events in store order
+        """
+        to_events = self._rows_to_lazy_events if lazy else self._rows_to_events
+        async for event in self._stream_rows(
+            from_position, batch_size, aggregate_id, event_type, to_events
+        ):
+            yield event
+
+    async def stream_envelopes(
+        self,
+        from_position: int = 0,
+        batch_size: int = 500,
+        aggregate_id: str | None = None,
+        event_type: str | None = None,
+    ) -> AsyncIterator[EventEnvelope]:
+        """Stream EventEnvelopes through a server-side cursor, without decoding payloads.
+
+        Positions can become visible out of order, as for ``stream_events``.
+
+        Args:
+            from_position: Only events with a global position greater than
+                this are returned (0 streams from the beginning)
+            batch_size: Number of rows fetched from the cursor per round trip
+            aggregate_id: The aggregate ID to filter by
+            event_type: The event type to filter by
+
+        Yields:
+            Envelopes in store order
+        """
+        async for envelope in self._stream_rows(
+            from_position, batch_size, aggregate_id, event_type, _rows_to_envelopes
+        ):
+            yield envelope
+
+    async def _stream_rows(
+        self,
+        from_position: int,
+        batch_size: int,
+        aggregate_id: str | None,
+        event_type: str | None,
+        convert: Callable[[Sequence[Any]], Iterable[Any]],
+    ) -> AsyncIterator[Any]:
+        """Run a position-ordered cursor scan, converting each fetched partition."""
+        stmt = self._select_events().where(
+            self._table.c.global_position > from_position
+        )
+        if aggregate_id:
+            stmt = stmt.where(self._table.c.aggregate_id == aggregate_id)
+        if event_type:
+            stmt = stmt.where(self._table.c.event_type == event_type)
+        stmt = stmt.order_by(self._table.c.global_position).execution_options(
+            yield_per=batch_size
+        )
+
+        count = 0
+        try:
+            async with self._connection() as session:
+                result = await session.stream(stmt)
+                async for partition in result.partitions(batch_size):
+                    await self._load_schemas(session, partition)
+                    for item in convert(partition):
+                        yield item
+                    count += len(partition)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Failed to stream events after {count} rows: {e}",
+                name="uno.events.pgstore",
+                error=e,
+            )
+            raise
+
+        self.logger.structured_log(
+            "INFO",
+            f"Streamed {count} events from store",
+            name="uno.events.pgstore",
+        )
+
+
+def _merge_rows(archived: Sequence[Any], hot: Sequence[Any]) -> list[Any]:
+    """Merge a stream's archived and hot rows into stream order."""
+    if not hot:
+        return list(archived)
+    return sorted([*archived, *hot], key=attrgetter("version"))
+
+
+def _rows_to_envelopes(rows: Sequence[Any]) -> list[EventEnvelope]:
+    """Wrap stored rows as envelopes, keeping their payloads encoded."""
+    return [
+        EventEnvelope(
+            position=row.global_position,
+            aggregate_id=row.aggregate_id,
+            event_type=row.event_type,
+            version=row.version,
+            payload=row.payload.encode()
+            if row.codec == PayloadCodec.JSON
+            else row.payload_bin,
+            event_version=row.event_version,
+            codec=row.codec,
+            type_id=row.event_type_id,
+        )
+        for row in rows
+    ]
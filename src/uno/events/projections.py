@@ -2,8 +2,17 @@
 Projections and read model interfaces for Uno event sourcing.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from uno.events.decoding import EventDecoder
+    from uno.events.envelope import EventEnvelope
+    from uno.events.interfaces import EventStoreProtocol
 
 T = TypeVar("T")
 
@@ -11,8 +20,16 @@ T = TypeVar("T")
 class Projection(ABC):
     """
     Base class for projections (read models).
+
+    Class attributes:
+        event_types: Event types the projection handles (None for all events)
+        accepts_envelopes: If True, ``project`` receives EventEnvelopes as-is
+            instead of materialized events
     """
 
+    event_types: ClassVar[frozenset[str] | None] = None
+    accepts_envelopes: ClassVar[bool] = False
+
     @abstractmethod
     async def project(self, event: Any) -> None:
         """Apply an event to the projection/read model."""
@@ -27,3 +44,87 @@ class ProjectionStore(Protocol[T]):
     async def get(self, id: str) -> T | None: ...
     async def save(self, id: str, projection: T) -> None: ...
     async def delete(self, id: str) -> None: ...
+
+
+class ProjectionRunner:
+    """
+    Catch a set of projections up with an event store.
+
+    Events are read as EventEnvelopes, and an envelope is only materialized
+    (once, shared by every interested projection) when some projection that
+    does not accept envelopes handles its event type. Events no projection
+    cares about are skipped without being decoded.
+
+    Usage:
+        runner = ProjectionRunner(event_store, [OrderTotals(), AuditLog()])
+        await runner.run()  # from the start
+        await runner.run()  # later: only events appended since
+    """
+
+    def __init__(
+        self,
+        event_store: EventStoreProtocol[Any],
+        projections: Sequence[Projection],
+        batch_size: int = 500,
+        decoder: EventDecoder | None = None,
+        position: int = 0,
+    ) -> None:
+        """
+        Args:
+            event_store: Store to read events from
+            projections: Projections to feed
+            batch_size: Envelopes read from the store at a time
+            decoder: Compiled decoder cache used to materialize events
+            position: Global position the projections are already caught up to
+        """
+        self.event_store = event_store
+        self.projections = list(projections)
+        self.batch_size = batch_size
+        self.decoder = decoder
+        self.position = position
+        self._routes: dict[str, list[Projection]] = {}
+
+    def _route(self, event_type: str) -> list[Projection]:
+        projections = self._routes.get(event_type)
+        if projections is None:
+            projections = [
+                projection
+                for projection in self.projections
+                if projection.event_types is None
+                or event_type in projection.event_types
+            ]
+            self._routes[event_type] = projections
+        return projections
+
+    async def project(self, envelope: EventEnvelope) -> None:
+        """Apply one envelope to the projections that handle its type."""
+        event = None
+        for projection in self._route(envelope.event_type):
+            if projection.accepts_envelopes:
+                await projection.project(envelope)
+                continue
+            if event is None:
+                event = envelope.materialize(self.decoder)
+            await projection.project(event)
+        self.position = envelope.position
+
+    async def run(self, until_position: int | None = None) -> int:
+        """
+        Project every event after ``position``, advancing it as events are applied.
+
+        Args:
+            until_position: Stop after this global position (the end of the
+                store if None)
+
+        Returns:
+            The number of events read
+        """
+        count = 0
+        async for envelope in self.event_store.stream_envelopes(
+            from_position=self.position, batch_size=self.batch_size
+        ):
+            if until_position is not None and envelope.position > until_position:
+                break
+            await self.project(envelope)
+            count += 1
+        return count
@@ -52,14 +52,14 @@ class EventPublisher(EventPublisherProtocol, Generic[E]):
     def _canonical_event_dict(self, event: E) -> dict[str, object]:
         """
         Canonical event serialization for storage, logging, and transport.
-        Always uses to_dict() for serialization.
+        Delegates to the event's cached canonical_dict().
 
         Args:
             event (E): The event to serialize.
         Returns:
             dict[str, object]: Canonical dict suitable for logging/storage.
         """
-        return event.to_dict()
+        return event.canonical_dict()
 
     async def publish(self, event: E) -> Result[None, Exception]:
         """
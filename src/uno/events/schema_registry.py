@@ -0,0 +1,409 @@
+"""
+Event schema registry: compact integer type ids and field layouts.
+
+Every event type gets a small integer ``type_id``, shared by all its versions,
+and each (type, version) pair records its field layout: the ordered list of
+payload keys. With a layout, a payload can be stored as a msgpack array of
+values (``PayloadCodec.COMPACT``), without repeating the keys in every row.
+
+Like ``EventUpcasterRegistry``, the in-memory registry is process-wide, so
+payload decoding (``EventStorageCodec.decode``) can resolve layouts without
+extra dependencies. Ids and layouts must agree across processes, so they are
+persisted by ``PostgresEventSchemaStore`` in the ``event_schemas`` table and
+loaded into the registry on use. Ids and layouts that a transaction registers
+reach the registry only once that transaction commits.
+
+Layouts are append-only: fields added to a class without a version bump are
+appended, and removed fields keep their slot (written as None), so every row
+ever written under a (type, version) stays decodable.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, ClassVar
+
+import msgspec
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    SmallInteger,
+    String,
+    Table,
+    UniqueConstraint,
+    event,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert
+
+from uno.base_model import FrameworkBaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session, SessionTransaction
+
+    from uno.events.base_event import DomainEvent
+
+_compact_encoder = msgspec.msgpack.Encoder()
+_compact_decoder = msgspec.msgpack.Decoder(list[Any])
+
+# Attempts to claim a new type id before giving up on concurrent registrations
+MAX_REGISTER_ATTEMPTS = 5
+
+# Session.info key of the schemas a transaction registered but has not committed
+PENDING_SCHEMAS_KEY = "uno.events.pending_schemas"
+
+# msgpack array headers: fixarray (0x90-0x9f), array 16 and array 32
+_FIXARRAY, _ARRAY16, _ARRAY32 = 0x90, 0xDC, 0xDD
+
+
+class EventSchema(FrameworkBaseModel):
+    """
+    Field layout of one version of an event type.
+
+    Attributes:
+        type_id: Compact id of the event type (shared by all its versions)
+        event_type: The event type string
+        version: The event schema version
+        fields: Payload keys, in the order compact payloads store their values
+    """
+
+    type_id: int
+    event_type: str
+    version: int
+    fields: tuple[str, ...]
+
+
+def layout_of(event_class: type[DomainEvent]) -> tuple[str, ...]:
+    """Payload keys of an event class, as they appear in its canonical dict."""
+    return tuple(
+        field.alias or name for name, field in event_class.model_fields.items()
+    )
+
+
+class EventSchemaRegistry:
+    """
+    Process-wide cache of event schemas.
+
+    Usage:
+        schema = EventSchemaRegistry.register(OrderPlaced)
+        data = EventSchemaRegistry.encode(schema, event.to_dict())
+        payload = EventSchemaRegistry.decode(schema.type_id, schema.version, data)
+    """
+
+    _schemas: ClassVar[dict[tuple[int, int], EventSchema]] = {}
+    _by_type: ClassVar[dict[tuple[str, int], EventSchema]] = {}
+    _type_ids: ClassVar[dict[str, int]] = {}
+    _type_names: ClassVar[dict[int, str]] = {}
+
+    @classmethod
+    def add(cls, schema: EventSchema) -> EventSchema:
+        """Cache a schema (e.g. one loaded from the database)."""
+        cls._schemas[(schema.type_id, schema.version)] = schema
+        cls._by_type[(schema.event_type, schema.version)] = schema
+        cls._type_ids[schema.event_type] = schema.type_id
+        cls._type_names[schema.type_id] = schema.event_type
+        return schema
+
+    @classmethod
+    def register(
+        cls, event_class: type[DomainEvent], version: int | None = None
+    ) -> EventSchema:
+        """
+        Return the schema for an event class, assigning a type id and layout if needed.
+
+        Ids assigned here are local to the process; use PostgresEventSchemaStore
+        to share them.
+
+        Args:
+            event_class: The event class
+            version: Schema version (the class's ``__version__`` by default)
+        """
+        version = event_class.__version__ if version is None else version
+        fields = layout_of(event_class)
+        schema = cls._by_type.get((event_class.event_type, version))
+        if schema is not None:
+            merged = merge_layout(schema.fields, fields)
+            if merged == schema.fields:
+                return schema
+            return cls.add(schema.model_copy(update={"fields": merged}))
+
+        type_id = cls._type_ids.get(event_class.event_type)
+        if type_id is None:
+            type_id = max(cls._type_names, default=0) + 1
+        return cls.add(
+            EventSchema(
+                type_id=type_id,
+                event_type=event_class.event_type,
+                version=version,
+                fields=fields,
+            )
+        )
+
+    @classmethod
+    def lookup(cls, event_type: str, version: int) -> EventSchema | None:
+        """Return the cached schema for an event type and version, if any."""
+        return cls._by_type.get((event_type, version))
+
+    @classmethod
+    def get(cls, type_id: int, version: int) -> EventSchema:
+        """
+        Return the cached schema for a type id and version.
+
+        Raises:
+            KeyError: If the schema is not cached.
+        """
+        try:
+            return cls._schemas[(type_id, version)]
+        except KeyError:
+            raise KeyError(
+                f"No event schema for type id {type_id} v{version}"
+            ) from None
+
+    @classmethod
+    def has(cls, type_id: int, version: int) -> bool:
+        """Whether the schema for a type id and version is cached."""
+        return (type_id, version) in cls._schemas
+
+    @classmethod
+    def covers(cls, type_id: int, version: int, data: bytes) -> bool:
+        """
+        Whether a compact payload can be decoded with the cached layout: the
+        schema is cached and has a slot for every stored value. A payload with
+        more values was written after another process extended the layout.
+        """
+        schema = cls._schemas.get((type_id, version))
+        return schema is not None and compact_length(data) <= len(schema.fields)
+
+    @classmethod
+    def type_id(cls, event_type: str) -> int | None:
+        """Return the compact id of an event type, if it has one."""
+        return cls._type_ids.get(event_type)
+
+    @classmethod
+    def event_type(cls, type_id: int) -> str:
+        """Return the event type string for a compact id."""
+        return cls._type_names[type_id]
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop all cached schemas."""
+        cls._schemas.clear()
+        cls._by_type.clear()
+        cls._type_ids.clear()
+        cls._type_names.clear()
+
+    @staticmethod
+    def encode(schema: EventSchema, payload: dict[str, Any]) -> bytes | None:
+        """
+        Encode a payload as a msgpack array in the schema's field order.
+
+        Returns None if the payload has keys outside the layout, so the caller
+        can fall back to a self-describing codec.
+        """
+        if not payload.keys() <= set(schema.fields):
+            return None
+        values = [payload.get(field) for field in schema.fields]
+        while values and values[-1] is None:
+            values.pop()
+        return _compact_encoder.encode(values)
+
+    @classmethod
+    def decode(cls, type_id: int, version: int, data: bytes) -> dict[str, Any]:
+        """
+        Decode a compact payload back into a payload dict (None values omitted).
+
+        Raises:
+            KeyError: If the schema is not cached.
+            ValueError: If the payload has more values than the cached layout.
+        """
+        fields = cls.get(type_id, version).fields
+        values = _compact_decoder.decode(data)
+        if len(values) > len(fields):
+            raise ValueError(
+                f"Compact payload has {len(values)} values but the layout of "
+                f"type id {type_id} v{version} has {len(fields)} fields"
+            )
+        # Rows written before fields were appended to the layout are shorter
+        return {
+            field: value
+            for field, value in zip(fields[: len(values)], values, strict=True)
+            if value is not None
+        }
+
+
+def compact_length(data: bytes) -> int:
+    """Number of values in a compact payload, read from its msgpack array header."""
+    head = data[0]
+    if head & 0xF0 == _FIXARRAY:
+        return head & 0x0F
+    if head == _ARRAY16:
+        return int.from_bytes(data[1:3], "big")
+    if head == _ARRAY32:
+        return int.from_bytes(data[1:5], "big")
+    raise ValueError("Compact payload is not a msgpack array")
+
+
+def merge_layout(current: Iterable[str], fields: Iterable[str]) -> tuple[str, ...]:
+    """Append any new fields to an existing layout, keeping existing slots."""
+    merged = list(current)
+    merged.extend(field for field in fields if field not in merged)
+    return tuple(merged)
+
+
+def _publish_pending(session: Session) -> None:
+    """after_commit hook: the committed schemas are now safe to cache."""
+    for schema in session.info.pop(PENDING_SCHEMAS_KEY, {}).values():
+        EventSchemaRegistry.add(schema)
+
+
+def _discard_pending(session: Session, transaction: SessionTransaction) -> None:
+    """after_transaction_end hook: drop what a rolled-back transaction registered."""
+    if transaction.parent is None:
+        session.info.pop(PENDING_SCHEMAS_KEY, None)
+
+
+class PostgresEventSchemaStore:
+    """
+    Persists event schemas in PostgreSQL and keeps EventSchemaRegistry in sync.
+
+    Type ids are claimed with ``max(type_id) + 1`` under the table's unique
+    constraints, retrying if another process claims the same id first.
+    Schemas registered or extended in a session are staged on it and added to
+    the registry after it commits, so a rolled-back append leaves no id or
+    layout behind that was never stored.
+
+    Args:
+        table_name: Name of the schema table
+    """
+
+    def __init__(self, table_name: str = "event_schemas") -> None:
+        self.metadata = MetaData()
+        self.table = Table(
+            table_name,
+            self.metadata,
+            Column("type_id", SmallInteger, primary_key=True),
+            Column("version", Integer, primary_key=True),
+            Column("event_type", String, nullable=False),
+            Column("fields", JSONB, nullable=False),
+            UniqueConstraint("event_type", "version"),
+        )
+
+    @staticmethod
+    def _pending(session: AsyncSession) -> dict[tuple[str, int], EventSchema]:
+        """Schemas registered in the session's open transaction."""
+        return session.info.get(PENDING_SCHEMAS_KEY, {})
+
+    @staticmethod
+    def _stage(session: AsyncSession, schema: EventSchema) -> EventSchema:
+        """Hold a schema on the session until its transaction commits."""
+        sync_session = session.sync_session
+        if not event.contains(sync_session, "after_commit", _publish_pending):
+            event.listen(sync_session, "after_commit", _publish_pending)
+            event.listen(sync_session, "after_transaction_end", _discard_pending)
+        pending = session.info.setdefault(PENDING_SCHEMAS_KEY, {})
+        pending[(schema.event_type, schema.version)] = schema
+        return schema
+
+    @staticmethod
+    def _schema(row: Any) -> EventSchema:
+        return EventSchema(
+            type_id=row.type_id,
+            event_type=row.event_type,
+            version=row.version,
+            fields=tuple(row.fields),
+        )
+
+    async def load(self, session: AsyncSession) -> int:
+        """
+        Load every stored schema into the registry. Returns the number loaded.
+        Schemas the session itself registered are left out until it commits.
+        """
+        pending = self._pending(session)
+        result = await session.execute(select(self.table))
+        count = 0
+        for row in result:
+            if (row.event_type, row.version) not in pending:
+                EventSchemaRegistry.add(self._schema(row))
+                count += 1
+        return count
+
+    async def ensure_loaded(
+        self, session: AsyncSession, payloads: Iterable[tuple[int, int, bytes]]
+    ) -> None:
+        """
+        Reload the registry unless every (type id, version, compact payload)
+        can be decoded with the cached layouts.
+        """
+        if not all(EventSchemaRegistry.covers(*payload) for payload in payloads):
+            await self.load(session)
+
+    async def ensure(
+        self, session: AsyncSession, event_class: type[DomainEvent], version: int
+    ) -> EventSchema:
+        """
+        Return the stored schema for an event class and version, registering
+        it (or extending its layout) in the session's transaction if needed.
+        """
+        event_type = event_class.event_type
+        fields = layout_of(event_class)
+        schema = self._pending(session).get(
+            (event_type, version)
+        ) or EventSchemaRegistry.lookup(event_type, version)
+        if schema is not None and set(fields) <= set(schema.fields):
+            return schema
+
+        for _ in range(MAX_REGISTER_ATTEMPTS):
+            # Lock the type's rows so concurrent layout extensions apply in turn
+            result = await session.execute(
+                select(self.table)
+                .where(self.table.c.event_type == event_type)
+                .with_for_update()
+            )
+            stored = {row.version: self._schema(row) for row in result}
+            schema = stored.get(version)
+            if schema is not None:
+                merged = merge_layout(schema.fields, fields)
+                if merged == schema.fields:
+                    return EventSchemaRegistry.add(schema)
+                await session.execute(
+                    self.table.update()
+                    .where(self.table.c.type_id == schema.type_id)
+                    .where(self.table.c.version == version)
+                    .values(fields=list(merged))
+                )
+                return self._stage(
+                    session, schema.model_copy(update={"fields": merged})
+                )
+
+            type_id = next((known.type_id for known in stored.values()), None)
+            if type_id is None:
+                result = await session.execute(
+                    select(func.coalesce(func.max(self.table.c.type_id), 0) + 1)
+                )
+                type_id = result.scalar_one()
+            result = await session.execute(
+                insert(self.table)
+                .values(
+                    type_id=type_id,
+                    version=version,
+                    event_type=event_type,
+                    fields=list(fields),
+                )
+                .on_conflict_do_nothing()
+                .returning(self.table.c.type_id)
+            )
+            if result.scalar_one_or_none() is not None:
+                return self._stage(
+                    session,
+                    EventSchema(
+                        type_id=type_id,
+                        event_type=event_type,
+                        version=version,
+                        fields=fields,
+                    ),
+                )
+        raise RuntimeError(f"Could not register a schema for {event_type} v{version}")
@@ -9,29 +9,87 @@ from __future__ import annotations
 
 # Standard library imports
 from abc import ABC, abstractmethod
-import json
+import asyncio
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+import contextlib
+import hashlib
+import mmap
 import os
-from datetime import datetime
+import tempfile
+import time
+from datetime import UTC, datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Protocol, TypeVar, cast, TYPE_CHECKING
 
 # Third-party imports
-from sqlalchemy import TIMESTAMP, Column, MetaData, String, Table, insert, select
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    delete,
+    func,
+    inspect,
+    select,
+    text,
+    tuple_,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pydantic import BaseModel, Field
+import msgspec
 
 # Import types only when type checking
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Connection
     from sqlalchemy.ext.asyncio import AsyncSession
     from uno.domain.core import AggregateRoot
+    from uno.events.interfaces import EventStoreProtocol
     from uno.logging.logger import LoggerService
 
 # Application imports
 from uno.errors.result import Failure, Result, Success
+from uno.events.codecs import Compression, compress, decompress
+from uno.events.integrity import StreamCheckpoint
 
 
 T = TypeVar("T")
 
 
+def snapshot_key_migration(table_name: str, primary_key: str) -> tuple[str, ...]:
+    """
+    Statements that move a snapshots table from the old one-row-per-aggregate
+    key to (aggregate_id, version). Existing rows take their version from the
+    snapshot data.
+
+    Args:
+        table_name: Name of the snapshots table
+        primary_key: Name of its current primary key constraint
+    """
+    return (
+        f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS version INTEGER",
+        f"""
+        UPDATE {table_name}
+            SET version = COALESCE((data->>'version')::integer, 0)
+            WHERE version IS NULL
+        """,  # noqa: S608 - the table name is configuration, not input
+        f"ALTER TABLE {table_name} ALTER COLUMN version SET NOT NULL",
+        f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {primary_key}",
+        f"ALTER TABLE {table_name} ADD PRIMARY KEY (aggregate_id, version)",
+        f"""
+        ALTER TABLE {table_name}
+            ALTER COLUMN created_at TYPE TIMESTAMPTZ USING created_at AT TIME ZONE 'UTC'
+        """,
+    )
+
+
 class SnapshotStrategy(Protocol):
     """Protocol for deciding when to create a snapshot.
 
@@ -84,15 +142,19 @@ class EventCountSnapshotStrategy:
 class TimeBasedSnapshotStrategy:
     """Create snapshots based on time elapsed since the last snapshot."""
 
-    def __init__(self, minutes_threshold: int = 60):
+    def __init__(self, minutes_threshold: int = 60, max_tracked: int = 10_000):
         """
         Initialize the strategy.
 
         Args:
             minutes_threshold: Minutes after which to create a new snapshot
+            max_tracked: Aggregates whose last snapshot time is remembered
+                (least recently used are forgotten first)
         """
         self.minutes_threshold = minutes_threshold
-        self._last_snapshot_time: dict[str, datetime] = {}
+        self.max_tracked = max_tracked
+        # aggregate_id -> monotonic time of the last snapshot, in LRU order
+        self._last_snapshot_time: OrderedDict[str, float] = OrderedDict()
 
     async def should_snapshot(self, aggregate_id: str, event_count: int) -> bool:
         """
@@ -105,20 +167,126 @@ class TimeBasedSnapshotStrategy:
         Returns:
             True if enough time has elapsed since the last snapshot
         """
-        # If we've never made a snapshot for this aggregate, do it now
-        if aggregate_id not in self._last_snapshot_time:
-            self._last_snapshot_time[aggregate_id] = datetime.now(datetime.UTC)
+        now = time.monotonic()
+        last_time = self._last_snapshot_time.get(aggregate_id)
+        # Snapshot aggregates we have never (or no longer) track, and stale ones
+        if last_time is None or (now - last_time) / 60 >= self.minutes_threshold:
+            self._last_snapshot_time[aggregate_id] = now
+            self._last_snapshot_time.move_to_end(aggregate_id)
+            if len(self._last_snapshot_time) > self.max_tracked:
+                self._last_snapshot_time.popitem(last=False)
             return True
 
-        # Check if enough time has elapsed
-        last_time = self._last_snapshot_time[aggregate_id]
-        elapsed_minutes = (datetime.now(datetime.UTC) - last_time).total_seconds() / 60
+        self._last_snapshot_time.move_to_end(aggregate_id)
+        return False
 
-        if elapsed_minutes >= self.minutes_threshold:
-            self._last_snapshot_time[aggregate_id] = datetime.now(datetime.UTC)
-            return True
 
-        return False
+class AdaptiveSnapshotStrategy:
+    """
+    Create snapshots when replaying an aggregate is expected to exceed a latency budget.
+
+    Repositories report every rehydration through ``record_replay``. The
+    strategy keeps an exponentially weighted moving average of the replay
+    cost per event for each aggregate type, and snapshots an aggregate once
+    the events since its last snapshot would take longer than
+    ``latency_budget`` to replay. Hot, expensive aggregates are therefore
+    snapshotted often and cheap ones never. Aggregates whose replay cost is
+    unknown (new ones, ones never loaded, or ones evicted from tracking) are
+    snapshotted every ``fallback_threshold`` events instead, as
+    EventCountSnapshotStrategy would.
+
+    Per-aggregate state (the aggregate's type) is bounded: the least recently
+    used entries are evicted beyond ``max_tracked``.
+    """
+
+    def __init__(
+        self,
+        latency_budget: float = 0.05,
+        smoothing: float = 0.2,
+        max_tracked: int = 10_000,
+        fallback_threshold: int | None = 100,
+    ):
+        """
+        Initialize the strategy.
+
+        Args:
+            latency_budget: Acceptable replay time per load, in seconds
+            smoothing: Weight of the newest measurement in the moving average
+            max_tracked: Aggregates whose type is remembered
+            fallback_threshold: Events after which to snapshot an aggregate
+                with no cost estimate (None to never snapshot those)
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.latency_budget = latency_budget
+        self.smoothing = smoothing
+        self.max_tracked = max_tracked
+        self.fallback_threshold = fallback_threshold
+        # aggregate type -> moving average of replay seconds per event
+        self._cost_per_event: dict[str, float] = {}
+        # aggregate_id -> aggregate type, in LRU order
+        self._aggregate_types: OrderedDict[str, str] = OrderedDict()
+
+    def record_replay(
+        self,
+        aggregate_id: str,
+        aggregate_type: str,
+        event_count: int,
+        duration: float,
+    ) -> None:
+        """
+        Record the measured time of one rehydration.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            aggregate_type: The aggregate's type name
+            event_count: Number of events replayed
+            duration: Time the replay took, in seconds
+        """
+        self._aggregate_types[aggregate_id] = aggregate_type
+        self._aggregate_types.move_to_end(aggregate_id)
+        if len(self._aggregate_types) > self.max_tracked:
+            self._aggregate_types.popitem(last=False)
+
+        if event_count <= 0:
+            return
+        cost = duration / event_count
+        average = self._cost_per_event.get(aggregate_type)
+        self._cost_per_event[aggregate_type] = (
+            cost
+            if average is None
+            else average + self.smoothing * (cost - average)
+        )
+
+    def expected_replay_time(self, aggregate_id: str, event_count: int) -> float | None:
+        """Estimated seconds to replay ``event_count`` events (None if unmeasured)."""
+        aggregate_type = self._aggregate_types.get(aggregate_id)
+        if aggregate_type is None:
+            return None
+        self._aggregate_types.move_to_end(aggregate_id)
+        cost = self._cost_per_event.get(aggregate_type)
+        return None if cost is None else cost * event_count
+
+    async def should_snapshot(self, aggregate_id: str, event_count: int) -> bool:
+        """
+        Create a snapshot if replaying the events since the last one would
+        exceed the latency budget.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+            event_count: Number of events processed since last snapshot
+
+        Returns:
+            True if the expected replay time exceeds the budget, or (without an
+            estimate) if the event count reaches ``fallback_threshold``
+        """
+        expected = self.expected_replay_time(aggregate_id, event_count)
+        if expected is None:
+            return (
+                self.fallback_threshold is not None
+                and event_count >= self.fallback_threshold
+            )
+        return expected > self.latency_budget
 
 
 class CompositeSnapshotStrategy:
@@ -133,6 +301,19 @@ class CompositeSnapshotStrategy:
         """
         self.strategies = strategies
 
+    def record_replay(
+        self,
+        aggregate_id: str,
+        aggregate_type: str,
+        event_count: int,
+        duration: float,
+    ) -> None:
+        """Pass a replay measurement on to the strategies that use them."""
+        for strategy in self.strategies:
+            record_replay = getattr(strategy, "record_replay", None)
+            if record_replay is not None:
+                record_replay(aggregate_id, aggregate_type, event_count, duration)
+
     async def should_snapshot(self, aggregate_id: str, event_count: int) -> bool:
         """
         Create a snapshot if any of the underlying strategies return True.
@@ -168,14 +349,24 @@ class SnapshotStore(ABC):
 
     @abstractmethod
     async def get_snapshot(
-        self, aggregate_id: str, aggregate_type: type[T]
+        self,
+        aggregate_id: str,
+        aggregate_type: type[T],
+        max_version: int | None = None,
+        max_timestamp: float | None = None,
     ) -> Result[T | None, Exception]:
         """
-        Get the latest snapshot for an aggregate.
+        Get the latest snapshot for an aggregate, optionally bounded.
+
+        With bounds, the newest snapshot at or below ``max_version`` and taken
+        at or before ``max_timestamp`` is returned. Stores that keep a single
+        snapshot per aggregate return it only if it is within the bounds.
 
         Args:
             aggregate_id: The ID of the aggregate
             aggregate_type: The type of the aggregate
+            max_version: Highest aggregate version to accept
+            max_timestamp: Latest snapshot time to accept (epoch seconds)
 
         Returns:
             Result with the snapshot if found, None if not found, or an error
@@ -195,9 +386,67 @@ class SnapshotStore(ABC):
         """
         ...
 
+    async def save_snapshots(
+        self, aggregates: Sequence[AggregateRoot]
+    ) -> Result[None, Exception]:
+        """
+        Save snapshots of several aggregates.
+
+        The default implementation saves them one at a time; stores that can
+        write a batch at once should override it.
+
+        Args:
+            aggregates: The aggregates to snapshot
+
+        Returns:
+            Result with None on success, or the first error
+        """
+        for aggregate in aggregates:
+            result = await self.save_snapshot(aggregate)
+            if result.is_failure:
+                return result
+        return Success(None)
+
+    async def save_checkpoint(
+        self, checkpoint: StreamCheckpoint
+    ) -> Result[None, Exception]:
+        """
+        Save an integrity checkpoint for a stream, replacing the previous one.
+
+        Args:
+            checkpoint: The checkpoint to save
+
+        Returns:
+            Result with None on success, or an error
+        """
+        return Failure(
+            NotImplementedError(f"{type(self).__name__} does not store checkpoints")
+        )
+
+    async def get_checkpoint(
+        self, aggregate_id: str
+    ) -> Result[StreamCheckpoint | None, Exception]:
+        """
+        Get the latest integrity checkpoint for a stream.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+
+        Returns:
+            Result with the checkpoint if found, None if not found, or an error
+        """
+        return Failure(
+            NotImplementedError(f"{type(self).__name__} does not store checkpoints")
+        )
+
 
 class InMemorySnapshotStore(SnapshotStore):
-    """In-memory implementation of SnapshotStore."""
+    """
+    In-memory implementation of SnapshotStore.
+
+    Every saved version is kept (as a copy, with the time it was taken), so
+    bounded lookups can return earlier snapshots.
+    """
 
     def __init__(self, logger: LoggerService):
         """
@@ -207,7 +456,9 @@ class InMemorySnapshotStore(SnapshotStore):
             logger: Logger service instance
         """
         self.logger = logger
-        self._snapshots: dict[str, AggregateRoot] = {}
+        # Per aggregate: (version, taken at, snapshot), ascending by version
+        self._snapshots: dict[str, list[tuple[int, float, AggregateRoot]]] = {}
+        self._checkpoints: dict[str, StreamCheckpoint] = {}
 
     async def save_snapshot(self, aggregate: AggregateRoot) -> Result[None, Exception]:
         """
@@ -226,7 +477,14 @@ class InMemorySnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            self._snapshots[str(aggregate.id)] = aggregate
+            version = getattr(aggregate, "version", 0)
+            history = self._snapshots.setdefault(str(aggregate.id), [])
+            index = bisect_left(history, version, key=itemgetter(0))
+            entry = (version, time.time(), aggregate.model_copy(deep=True))
+            if index < len(history) and history[index][0] == version:
+                history[index] = entry
+            else:
+                history.insert(index, entry)
             return Success(None)
 
         except Exception as e:
@@ -239,7 +497,11 @@ class InMemorySnapshotStore(SnapshotStore):
             return Failure(e)
 
     async def get_snapshot(
-        self, aggregate_id: str, aggregate_type: type[T]
+        self,
+        aggregate_id: str,
+        aggregate_type: type[T],
+        max_version: int | None = None,
+        max_timestamp: float | None = None,
     ) -> Result[T | None, Exception]:
         """
         Get a snapshot from memory.
@@ -247,9 +509,11 @@ class InMemorySnapshotStore(SnapshotStore):
         Args:
             aggregate_id: The ID of the aggregate
             aggregate_type: The type of the aggregate
+            max_version: Highest aggregate version to accept
+            max_timestamp: Latest snapshot time to accept (epoch seconds)
 
         Returns:
-            Result with the snapshot if found, None if not found, or an error
+            Result with a copy of the snapshot if found, None if not found, or an error
         """
         try:
             self.logger.structured_log(
@@ -258,15 +522,22 @@ class InMemorySnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            if aggregate_id in self._snapshots:
-                snapshot = self._snapshots[aggregate_id]
+            history = self._snapshots.get(aggregate_id, [])
+            if max_version is not None:
+                history = history[
+                    : bisect_right(history, max_version, key=itemgetter(0))
+                ]
+            if max_timestamp is not None:
+                history = [entry for entry in history if entry[1] <= max_timestamp]
+            if history:
+                snapshot = history[-1][2]
                 if isinstance(snapshot, aggregate_type):
                     self.logger.structured_log(
                         "DEBUG",
                         f"Found snapshot for aggregate {aggregate_id}",
                         name="uno.events.snapshots",
                     )
-                    return Success(cast("T", snapshot))
+                    return Success(cast("T", snapshot.model_copy(deep=True)))
                 else:
                     self.logger.structured_log(
                         "WARN",
@@ -326,24 +597,92 @@ class InMemorySnapshotStore(SnapshotStore):
             )
             return Failure(e)
 
+    async def save_checkpoint(
+        self, checkpoint: StreamCheckpoint
+    ) -> Result[None, Exception]:
+        """
+        Save an integrity checkpoint in memory.
+
+        Args:
+            checkpoint: The checkpoint to save
+
+        Returns:
+            Result with None on success
+        """
+        self._checkpoints[checkpoint.aggregate_id] = checkpoint
+        return Success(None)
+
+    async def get_checkpoint(
+        self, aggregate_id: str
+    ) -> Result[StreamCheckpoint | None, Exception]:
+        """
+        Get an integrity checkpoint from memory.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+
+        Returns:
+            Result with the checkpoint if found, None if not found
+        """
+        return Success(self._checkpoints.get(aggregate_id))
+
 
 class FileSystemSnapshotStore(SnapshotStore):
-    """File system implementation of SnapshotStore."""
+    """
+    File system implementation of SnapshotStore.
+
+    Each aggregate's latest snapshot is a JSON document (optionally zlib or
+    zstd compressed) under a sharded path derived from a hash of its ID,
+    ``<dir>/ab/cd/<sha256>.snapshot``, so no directory grows past a few
+    hundred entries. Files are written to a synced temporary file and moved
+    into place with ``os.replace``, and the directory is synced after the
+    rename, so readers and crashes never see a torn snapshot. Large files are read through ``mmap``. All file I/O runs in
+    worker threads (``asyncio.to_thread``) to keep the event loop free.
+
+    Snapshots written by earlier versions (``<dir>/<aggregate_id>.json``)
+    are still read, and are replaced on the next save.
+    """
 
-    def __init__(self, logger: LoggerService, snapshot_dir: str = "./snapshots"):
+    def __init__(
+        self,
+        logger: LoggerService,
+        snapshot_dir: str = "./snapshots",
+        compression: Compression | None = None,
+        shard_depth: int = 2,
+        mmap_threshold: int = 1 << 20,
+    ):
         """
         Initialize the store.
 
         Args:
             logger: Logger service instance
             snapshot_dir: Directory to store snapshots
+            compression: Compression for new snapshot files (None for plain JSON)
+            shard_depth: Levels of hashed subdirectories (two hex digits each)
+            mmap_threshold: Files of at least this many bytes are read via mmap
         """
         self.logger = logger
         self.snapshot_dir = Path(snapshot_dir)
+        self.compression = compression
+        self.shard_depth = shard_depth
+        self.mmap_threshold = mmap_threshold
+        # Mode of new files, as open() would create them under the current umask
+        umask = os.umask(0)
+        os.umask(umask)
+        self.file_mode = 0o666 & ~umask
         os.makedirs(self.snapshot_dir, exist_ok=True)
 
+    def _shard_path(self, aggregate_id: str, suffix: str) -> Path:
+        digest = hashlib.sha256(aggregate_id.encode("utf-8")).hexdigest()
+        shards = [digest[i : i + 2] for i in range(0, 2 * self.shard_depth, 2)]
+        return self.snapshot_dir.joinpath(*shards, digest + suffix)
+
     def _get_snapshot_path(self, aggregate_id: str) -> Path:
         """Get the path to a snapshot file."""
+        return self._shard_path(aggregate_id, ".snapshot")
+
+    def _get_legacy_snapshot_path(self, aggregate_id: str) -> Path:
+        """Get the path of a snapshot written to the flat directory layout."""
         return self.snapshot_dir / f"{aggregate_id}.json"
 
     def _canonical_snapshot_dict(self, aggregate: AggregateRoot) -> dict[str, object]:
@@ -355,6 +694,83 @@ class FileSystemSnapshotStore(SnapshotStore):
             exclude_none=True, exclude_unset=True, by_alias=True
         )
 
+    def _ensure_directory(self, directory: Path) -> None:
+        """Create a shard directory (and missing parents), syncing each new entry."""
+        if directory.is_dir():
+            return
+        self._ensure_directory(directory.parent)
+        with contextlib.suppress(FileExistsError):
+            directory.mkdir()
+            _fsync_directory(directory.parent)
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        """
+        Write a file via a temporary file in the same directory and os.replace.
+
+        The data is synced before the rename and the directory after it, so
+        after a crash the file holds either the old or the new content.
+        """
+        self._ensure_directory(path.parent)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates files readable by the owner only
+                os.fchmod(f.fileno(), self.file_mode)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        _fsync_directory(path.parent)
+
+    def _read_file(self, path: Path) -> dict[str, object] | None:
+        """Read and decode a snapshot file; None if it does not exist."""
+        try:
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size >= self.mmap_threshold:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        return _decode_snapshot(data)
+                return _decode_snapshot(f.read())
+        except FileNotFoundError:
+            return None
+
+    def _save(self, aggregate_id: str, data: bytes) -> None:
+        self._write_atomic(self._get_snapshot_path(aggregate_id), data)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._get_legacy_snapshot_path(aggregate_id))
+
+    def _load(
+        self, aggregate_id: str, max_timestamp: float | None
+    ) -> dict[str, object] | None:
+        for path in (
+            self._get_snapshot_path(aggregate_id),
+            self._get_legacy_snapshot_path(aggregate_id),
+        ):
+            try:
+                if max_timestamp is not None and path.stat().st_mtime > max_timestamp:
+                    return None
+            except FileNotFoundError:
+                continue
+            snapshot_dict = self._read_file(path)
+            if snapshot_dict is not None:
+                return snapshot_dict
+        return None
+
+    def _delete(self, aggregate_id: str) -> bool:
+        deleted = False
+        for path in (
+            self._get_snapshot_path(aggregate_id),
+            self._get_legacy_snapshot_path(aggregate_id),
+        ):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+                deleted = True
+        return deleted
+
     async def save_snapshot(self, aggregate: AggregateRoot) -> Result[None, Exception]:
         """
         Save a snapshot to the file system.
@@ -373,11 +789,14 @@ class FileSystemSnapshotStore(SnapshotStore):
             if not aggregate_id:
                 return Failure(ValueError("Aggregate must have an id field"))
 
-            path = self._get_snapshot_path(aggregate_id)
             # Canonical serialization enforced here
             canonical_snapshot = self._canonical_snapshot_dict(aggregate)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(canonical_snapshot, f, ensure_ascii=False, sort_keys=True)
+            canonical_snapshot["_type"] = type(aggregate).__name__
+            canonical_snapshot[_PRIVATE_STATE_KEY] = _private_state(aggregate)
+            data = _snapshot_encoder.encode(canonical_snapshot)
+            if self.compression is not None:
+                data = compress(self.compression, data)
+            await asyncio.to_thread(self._save, str(aggregate_id), data)
 
             self.logger.structured_log(
                 "DEBUG",
@@ -396,14 +815,23 @@ class FileSystemSnapshotStore(SnapshotStore):
             return Failure(e)
 
     async def get_snapshot(
-        self, aggregate_id: str, aggregate_type: type[T]
+        self,
+        aggregate_id: str,
+        aggregate_type: type[T],
+        max_version: int | None = None,
+        max_timestamp: float | None = None,
     ) -> Result[T | None, Exception]:
         """
         Get a snapshot from the file system.
 
+        Only the latest snapshot is kept, so it is returned only if it is
+        within the bounds.
+
         Args:
             aggregate_id: The ID of the aggregate
             aggregate_type: The type of the aggregate
+            max_version: Highest aggregate version to accept
+            max_timestamp: Latest snapshot time to accept (epoch seconds)
 
         Returns:
             Result with the snapshot if found, None if not found, or an error
@@ -415,8 +843,10 @@ class FileSystemSnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            snapshot_path = self._get_snapshot_path(aggregate_id)
-            if not snapshot_path.exists():
+            aggregate_dict = await asyncio.to_thread(
+                self._load, aggregate_id, max_timestamp
+            )
+            if aggregate_dict is None:
                 self.logger.structured_log(
                     "DEBUG",
                     f"No snapshot file found for aggregate {aggregate_id}",
@@ -424,13 +854,15 @@ class FileSystemSnapshotStore(SnapshotStore):
                 )
                 return Success(None)
 
-            # Read from file
-            with open(snapshot_path) as f:
-                aggregate_dict = json.load(f)
+            if (
+                max_version is not None
+                and aggregate_dict.get("version", 0) > max_version
+            ):
+                return Success(None)
 
-            # Check type
+            # Check type (snapshots in the legacy layout were written without one)
             stored_type = aggregate_dict.pop("_type", None)
-            if stored_type != aggregate_type.__name__:
+            if stored_type is not None and stored_type != aggregate_type.__name__:
                 self.logger.structured_log(
                     "WARN",
                     f"Snapshot type mismatch for {aggregate_id}: expected {aggregate_type.__name__}, got {stored_type}",
@@ -447,7 +879,9 @@ class FileSystemSnapshotStore(SnapshotStore):
                 )
 
             # Restore aggregate
+            private_state = aggregate_dict.pop(_PRIVATE_STATE_KEY, {})
             aggregate = aggregate_type.from_dict(aggregate_dict)
+            _restore_private_state(aggregate, private_state)
 
             self.logger.structured_log(
                 "DEBUG",
@@ -482,9 +916,7 @@ class FileSystemSnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            snapshot_path = self._get_snapshot_path(aggregate_id)
-            if snapshot_path.exists():
-                os.remove(snapshot_path)
+            if await asyncio.to_thread(self._delete, aggregate_id):
                 self.logger.structured_log(
                     "DEBUG",
                     f"Deleted snapshot file for aggregate {aggregate_id}",
@@ -502,60 +934,169 @@ class FileSystemSnapshotStore(SnapshotStore):
             )
             return Failure(e)
 
+    def _get_checkpoint_path(self, aggregate_id: str) -> Path:
+        """Get the path to a stream's integrity checkpoint file."""
+        return self._shard_path(aggregate_id, ".checkpoint.json")
+
+    def _read_checkpoint(self, aggregate_id: str) -> StreamCheckpoint | None:
+        for path in (
+            self._get_checkpoint_path(aggregate_id),
+            self.snapshot_dir / f"{aggregate_id}.checkpoint.json",
+        ):
+            try:
+                return StreamCheckpoint.model_validate_json(path.read_bytes())
+            except FileNotFoundError:
+                continue
+        return None
+
+    async def save_checkpoint(
+        self, checkpoint: StreamCheckpoint
+    ) -> Result[None, Exception]:
+        """
+        Save an integrity checkpoint next to the aggregate's snapshot.
+
+        Args:
+            checkpoint: The checkpoint to save
+
+        Returns:
+            Result with None on success, or an error
+        """
+        try:
+            await asyncio.to_thread(
+                self._write_atomic,
+                self._get_checkpoint_path(checkpoint.aggregate_id),
+                checkpoint.model_dump_json().encode("utf-8"),
+            )
+            return Success(None)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error saving checkpoint: {e}",
+                name="uno.events.snapshots",
+                error=e,
+            )
+            return Failure(e)
+
+    async def get_checkpoint(
+        self, aggregate_id: str
+    ) -> Result[StreamCheckpoint | None, Exception]:
+        """
+        Get an integrity checkpoint from the file system.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+
+        Returns:
+            Result with the checkpoint if found, None if not found, or an error
+        """
+        try:
+            return Success(
+                await asyncio.to_thread(self._read_checkpoint, aggregate_id)
+            )
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error getting checkpoint: {e}",
+                name="uno.events.snapshots",
+                error=e,
+            )
+            return Failure(e)
+
 
 class PostgresSnapshotStore(SnapshotStore):
-    """PostgreSQL implementation of SnapshotStore."""
+    """
+    PostgreSQL implementation of SnapshotStore.
+
+    Snapshots are keyed by (aggregate_id, version), so earlier versions stay
+    available for historical loads. After each save only the newest
+    ``keep_last`` snapshots of the aggregate are kept (all of them if
+    ``keep_last`` is None). The tables are created on first use, once per
+    store instance.
+    """
 
-    def __init__(self, logger: LoggerService, async_session_factory):
+    def __init__(
+        self,
+        logger: LoggerService,
+        async_session_factory,
+        keep_last: int | None = 3,
+        table_name: str = "snapshots",
+    ):
         """
         Initialize the store.
 
         Args:
             logger: Logger service instance
             async_session_factory: Factory for creating database sessions
+            keep_last: Snapshots kept per aggregate (None keeps every version)
+            table_name: Name of the snapshots table
         """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError("keep_last must be at least 1")
         self.logger = logger
         self.async_session_factory = async_session_factory
+        self.keep_last = keep_last
         self.metadata = MetaData()
 
         # Define snapshot table
         self.snapshots_table = Table(
-            "snapshots",
+            table_name,
             self.metadata,
             Column("aggregate_id", String, primary_key=True),
+            Column("version", Integer, primary_key=True),
             Column("aggregate_type", String, nullable=False),
-            Column("created_at", TIMESTAMP, nullable=False),
+            Column("created_at", DateTime(timezone=True), nullable=False),
             Column("data", JSONB, nullable=False),
         )
 
-    async def _ensure_table_exists(self, session: AsyncSession) -> None:
+        # Integrity checkpoints are kept alongside the snapshots
+        self.checkpoints_table = Table(
+            "stream_checkpoints",
+            self.metadata,
+            Column("aggregate_id", String, primary_key=True),
+            Column("version", Integer, nullable=False),
+            Column("merkle_root", String(64), nullable=False),
+            Column("peaks", JSONB, nullable=False),
+            Column("last_event_hash", String, nullable=True),
+            Column("created_at", Float, nullable=False),
+        )
+        self._tables_ready = False
+
+    async def _ensure_tables_exist(self, session: AsyncSession) -> None:
         """
-        Make sure the snapshots table exists.
+        Create the snapshots and checkpoints tables on first use.
+
+        DDL is transactional in PostgreSQL, so the session is committed before
+        the tables are marked ready; reads never commit their session.
 
         Args:
             session: Database session
         """
-        try:
-            # Check if table exists by executing a simple query
-            query = select(self.snapshots_table).limit(1)
-            await session.execute(query)
-        except Exception:
-            # Table doesn't exist, create it
-            await session.execute(
-                """
-            CREATE TABLE IF NOT EXISTS snapshots (
-                aggregate_id VARCHAR(255) PRIMARY KEY,
-                aggregate_type VARCHAR(255) NOT NULL,
-                created_at TIMESTAMP NOT NULL,
-                data JSONB NOT NULL
-            )
-            """
-            )
-            await session.commit()
+        if self._tables_ready:
+            return
+        await session.run_sync(
+            lambda sync_session: self._create_tables(sync_session.connection())
+        )
+        await session.commit()
+        self._tables_ready = True
+
+    def _create_tables(self, connection: Connection) -> None:
+        """Create missing tables, migrating a snapshots table keyed by aggregate only."""
+        table_name = self.snapshots_table.name
+        inspector = inspect(connection)
+        if inspector.has_table(table_name) and "version" not in {
+            column["name"] for column in inspector.get_columns(table_name)
+        }:
+            primary_key = inspector.get_pk_constraint(table_name)["name"]
+            for statement in snapshot_key_migration(table_name, primary_key):
+                connection.execute(text(statement))
+        self.metadata.create_all(connection, checkfirst=True)
 
     async def save_snapshot(self, aggregate: AggregateRoot) -> Result[None, Exception]:
         """
-        Save a snapshot to PostgreSQL.
+        Save a snapshot of the aggregate at its current version to PostgreSQL.
+
+        Saving the same version again replaces it. Older versions beyond
+        ``keep_last`` are pruned in the same transaction.
 
         Args:
             aggregate: The aggregate to snapshot
@@ -563,55 +1104,97 @@ class PostgresSnapshotStore(SnapshotStore):
         Returns:
             Result with None on success, or an error
         """
+        return await self.save_snapshots([aggregate])
+
+    async def save_snapshots(
+        self, aggregates: Sequence[AggregateRoot]
+    ) -> Result[None, Exception]:
+        """
+        Save snapshots of several aggregates in one transaction: one multi-row
+        upsert and one retention delete.
+
+        Args:
+            aggregates: The aggregates to snapshot
+
+        Returns:
+            Result with None on success, or an error
+        """
+        if not aggregates:
+            return Success(None)
         try:
             self.logger.structured_log(
                 "DEBUG",
-                f"Saving snapshot for aggregate {aggregate.id}",
+                f"Saving {len(aggregates)} snapshots",
                 name="uno.events.snapshots",
             )
 
-            # Convert aggregate to dict
-            if not hasattr(aggregate, "to_dict"):
-                return Failure(
-                    ValueError(
-                        f"Aggregate {aggregate.id} does not implement to_dict method"
-                    )
-                )
-
-            aggregate_dict = aggregate.to_dict()
-
-            # Get a session
-            async with self.async_session_factory() as session:
-                await self._ensure_table_exists(session)
-
-                # Prepare the insert
-                current_time = datetime.now(datetime.UTC)
-                data = {
-                    "aggregate_id": aggregate.id,
+            table = self.snapshots_table
+            now = datetime.now(UTC)
+            # One row per (aggregate_id, version); an upsert cannot touch a row twice
+            rows = {
+                (str(aggregate.id), aggregate.version): {
+                    "aggregate_id": str(aggregate.id),
+                    "version": aggregate.version,
                     "aggregate_type": type(aggregate).__name__,
-                    "data": aggregate_dict,
-                    "created_at": current_time.isoformat(),
+                    "created_at": now,
+                    # Canonical dump (as Entity.to_dict), in JSON-compatible types
+                    "data": {
+                        **aggregate.model_dump(
+                            mode="json",
+                            exclude_none=True,
+                            exclude_unset=True,
+                            by_alias=True,
+                        ),
+                        _PRIVATE_STATE_KEY: _private_state(aggregate),
+                    },
                 }
-                stmt = (
-                    insert(self.snapshots_table).values(data)
-                    # If there's an existing snapshot, replace it
-                    .on_conflict_do_update(
-                        index_elements=["aggregate_id"],
-                        set_={
-                            "aggregate_type": aggregate.__class__.__name__,
-                            "created_at": current_time.isoformat(),
-                            "data": aggregate_dict,
-                        },
-                    )
-                )
+                for aggregate in aggregates
+            }
+            stmt = pg_insert(table).values(list(rows.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["aggregate_id", "version"],
+                set_={
+                    key: stmt.excluded[key]
+                    for key in ("aggregate_type", "created_at", "data")
+                },
+            )
 
-                # Execute
+            async with self.async_session_factory() as session:
+                await self._ensure_tables_exist(session)
                 await session.execute(stmt)
+                if self.keep_last is not None:
+                    ranked = (
+                        select(
+                            table.c.aggregate_id,
+                            table.c.version,
+                            func.row_number()
+                            .over(
+                                partition_by=table.c.aggregate_id,
+                                order_by=table.c.version.desc(),
+                            )
+                            .label("rank"),
+                        )
+                        .where(
+                            table.c.aggregate_id.in_(
+                                {aggregate_id for aggregate_id, _ in rows}
+                            )
+                        )
+                        .subquery()
+                    )
+                    await session.execute(
+                        delete(table).where(
+                            tuple_(table.c.aggregate_id, table.c.version).in_(
+                                select(ranked.c.aggregate_id, ranked.c.version).where(
+                                    ranked.c.rank > self.keep_last
+                                )
+                            )
+                        )
+                    )
                 await session.commit()
 
             self.logger.structured_log(
                 "DEBUG",
-                f"Saved snapshot for aggregate {aggregate.id}",
+                f"Saved {len(rows)} snapshots",
                 name="uno.events.snapshots",
             )
             return Success(None)
@@ -619,21 +1202,27 @@ class PostgresSnapshotStore(SnapshotStore):
         except Exception as e:
             self.logger.structured_log(
                 "ERROR",
-                f"Error saving snapshot: {e}",
+                f"Error saving snapshots: {e}",
                 name="uno.events.snapshots",
                 error=e,
             )
             return Failure(e)
 
     async def get_snapshot(
-        self, aggregate_id: str, aggregate_type: type[T]
+        self,
+        aggregate_id: str,
+        aggregate_type: type[T],
+        max_version: int | None = None,
+        max_timestamp: float | None = None,
     ) -> Result[T | None, Exception]:
         """
-        Get a snapshot from PostgreSQL.
+        Get the newest snapshot within the bounds from PostgreSQL.
 
         Args:
             aggregate_id: The ID of the aggregate
             aggregate_type: The type of the aggregate
+            max_version: Highest aggregate version to accept
+            max_timestamp: Latest snapshot time to accept (epoch seconds)
 
         Returns:
             Result with the snapshot if found, None if not found, or an error
@@ -645,50 +1234,52 @@ class PostgresSnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            # Get a session
-            async with self.async_session_factory() as session:
-                await self._ensure_table_exists(session)
-
-                # Query for the snapshot
-                query = (
-                    select(self.snapshots_table)
-                    .where(self.snapshots_table.c.aggregate_id == aggregate_id)
-                    .where(
-                        self.snapshots_table.c.aggregate_type == aggregate_type.__name__
+            # Check if the aggregate type has a from_dict method
+            if not hasattr(aggregate_type, "from_dict"):
+                return Failure(
+                    ValueError(
+                        f"Aggregate type {aggregate_type.__name__} does not implement from_dict method"
                     )
                 )
 
+            table = self.snapshots_table
+            query = select(table.c.version, table.c.data).where(
+                table.c.aggregate_id == aggregate_id,
+                table.c.aggregate_type == aggregate_type.__name__,
+            )
+            if max_version is not None:
+                query = query.where(table.c.version <= max_version)
+            if max_timestamp is not None:
+                query = query.where(
+                    table.c.created_at <= datetime.fromtimestamp(max_timestamp, UTC)
+                )
+            query = query.order_by(table.c.version.desc()).limit(1)
+
+            async with self.async_session_factory() as session:
+                await self._ensure_tables_exist(session)
                 result = await session.execute(query)
                 row = result.fetchone()
 
-                if not row:
-                    self.logger.structured_log(
-                        "DEBUG",
-                        f"No snapshot found for aggregate {aggregate_id}",
-                        name="uno.events.snapshots",
-                    )
-                    return Success(None)
-
-                # Get the data and restore the aggregate
-                aggregate_dict = row.data
-
-                # Check if the aggregate type has a from_dict method
-                if not hasattr(aggregate_type, "from_dict"):
-                    return Failure(
-                        ValueError(
-                            f"Aggregate type {aggregate_type.__name__} does not implement from_dict method"
-                        )
-                    )
-
-                # Restore aggregate
-                aggregate = aggregate_type.from_dict(aggregate_dict)
-
+            if not row:
                 self.logger.structured_log(
                     "DEBUG",
-                    f"Retrieved snapshot for aggregate {aggregate_id}",
+                    f"No snapshot found for aggregate {aggregate_id}",
                     name="uno.events.snapshots",
                 )
-                return Success(aggregate)
+                return Success(None)
+
+            # The version column is authoritative (an unset version is not dumped)
+            data = {**row.data, "version": row.version}
+            private_state = data.pop(_PRIVATE_STATE_KEY, {})
+            aggregate = aggregate_type.from_dict(data)
+            _restore_private_state(aggregate, private_state)
+
+            self.logger.structured_log(
+                "DEBUG",
+                f"Retrieved snapshot for aggregate {aggregate_id} at version {row.version}",
+                name="uno.events.snapshots",
+            )
+            return Success(aggregate)
 
         except Exception as e:
             self.logger.structured_log(
@@ -701,7 +1292,7 @@ class PostgresSnapshotStore(SnapshotStore):
 
     async def delete_snapshot(self, aggregate_id: str) -> Result[None, Exception]:
         """
-        Delete a snapshot from PostgreSQL.
+        Delete every snapshot version of an aggregate from PostgreSQL.
 
         Args:
             aggregate_id: The ID of the aggregate
@@ -716,31 +1307,364 @@ class PostgresSnapshotStore(SnapshotStore):
                 name="uno.events.snapshots",
             )
 
-            # Get a session
             async with self.async_session_factory() as session:
-                await self._ensure_table_exists(session)
-
-                # Delete the snapshot
-                stmt = self.snapshots_table.delete().where(
-                    self.snapshots_table.c.aggregate_id == aggregate_id
+                await self._ensure_tables_exist(session)
+                await session.execute(
+                    delete(self.snapshots_table).where(
+                        self.snapshots_table.c.aggregate_id == aggregate_id
+                    )
                 )
+                await session.commit()
 
-                await session.execute(stmt)
+            self.logger.structured_log(
+                "DEBUG",
+                f"Deleted snapshot for aggregate {aggregate_id}",
+                name="uno.events.snapshots",
+            )
+            return Success(None)
+
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error deleting snapshot: {e}",
+                name="uno.events.snapshots",
+                error=e,
+            )
+            return Failure(e)
+
+    async def save_checkpoint(
+        self, checkpoint: StreamCheckpoint
+    ) -> Result[None, Exception]:
+        """
+        Save an integrity checkpoint to PostgreSQL.
+
+        Args:
+            checkpoint: The checkpoint to save
+
+        Returns:
+            Result with None on success, or an error
+        """
+        try:
+            values = {
+                "aggregate_id": checkpoint.aggregate_id,
+                "version": checkpoint.version,
+                "merkle_root": checkpoint.merkle_root,
+                "peaks": checkpoint.peaks,
+                "last_event_hash": checkpoint.last_event_hash,
+                "created_at": checkpoint.created_at,
+            }
+            async with self.async_session_factory() as session:
+                await self._ensure_tables_exist(session)
+                stmt = pg_insert(self.checkpoints_table).values(values)
+                await session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=["aggregate_id"],
+                        set_={
+                            key: stmt.excluded[key]
+                            for key in values
+                            if key != "aggregate_id"
+                        },
+                    )
+                )
                 await session.commit()
+            return Success(None)
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error saving checkpoint: {e}",
+                name="uno.events.snapshots",
+                error=e,
+            )
+            return Failure(e)
+
+    async def get_checkpoint(
+        self, aggregate_id: str
+    ) -> Result[StreamCheckpoint | None, Exception]:
+        """
+        Get an integrity checkpoint from PostgreSQL.
+
+        Args:
+            aggregate_id: The ID of the aggregate
+
+        Returns:
+            Result with the checkpoint if found, None if not found, or an error
+        """
+        try:
+            async with self.async_session_factory() as session:
+                await self._ensure_tables_exist(session)
+                result = await session.execute(
+                    select(self.checkpoints_table).where(
+                        self.checkpoints_table.c.aggregate_id == aggregate_id
+                    )
+                )
+                row = result.fetchone()
+            if row is None:
+                return Success(None)
+            return Success(StreamCheckpoint.model_validate(row._asdict()))
+        except Exception as e:
+            self.logger.structured_log(
+                "ERROR",
+                f"Error getting checkpoint: {e}",
+                name="uno.events.snapshots",
+                error=e,
+            )
+            return Failure(e)
+
+
+class SnapshotWorkerMetrics(BaseModel):
+    """Counters of a SnapshotWorker."""
+
+    hints_received: int = Field(default=0, description="Hints offered to the worker")
+    hints_coalesced: int = Field(
+        default=0, description="Hints merged into a pending hint for the same aggregate"
+    )
+    hints_dropped: int = Field(
+        default=0, description="Hints rejected because the queue was full"
+    )
+    pending: int = Field(default=0, description="Aggregates waiting for a snapshot")
+    batches_written: int = Field(default=0, description="Batches processed")
+    snapshots_written: int = Field(default=0, description="Snapshots saved")
+    snapshots_skipped: int = Field(
+        default=0, description="Hints already covered by a stored snapshot"
+    )
+    failures: int = Field(default=0, description="Snapshots that failed to load or save")
+    last_batch_duration: float = Field(
+        default=0.0, description="Duration of the last batch in seconds"
+    )
+
+
+class SnapshotWorker:
+    """
+    Writes snapshots in the background, off the command path.
+
+    Repositories ``offer`` hints ("aggregate X reached version V"). Hints are
+    coalesced per aggregate (only the highest version is kept) and queued in
+    a bounded queue; when it is full, new aggregates' hints are dropped and
+    counted, since a later hint will cover them. The worker task rebuilds
+    each hinted aggregate from its latest snapshot plus the events after it
+    and saves the batch with ``SnapshotStore.save_snapshots``.
+
+    Usage:
+        worker = SnapshotWorker(snapshot_store, event_store, logger)
+        worker.start()
+        ...
+        await worker.stop()  # flushes pending hints first
+    """
+
+    def __init__(
+        self,
+        snapshot_store: SnapshotStore,
+        event_store: EventStoreProtocol,
+        logger: LoggerService,
+        max_pending: int = 1024,
+        batch_size: int = 64,
+    ):
+        """
+        Initialize the worker.
 
+        Args:
+            snapshot_store: Store to read and write snapshots
+            event_store: Store to read the events after a snapshot from
+            logger: Logger service instance
+            max_pending: Maximum number of aggregates waiting for a snapshot
+            batch_size: Maximum number of snapshots written at a time
+        """
+        self.snapshot_store = snapshot_store
+        self.event_store = event_store
+        self.logger = logger
+        self.batch_size = batch_size
+        self.metrics = SnapshotWorkerMetrics()
+        self._queue: asyncio.Queue[str] = asyncio.Queue(max_pending)
+        # aggregate_id -> (aggregate type, highest hinted version)
+        self._pending: dict[str, tuple[type[AggregateRoot], int]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker task is running."""
+        return self._task is not None and not self._task.done()
+
+    def offer(
+        self, aggregate_type: type[AggregateRoot], aggregate_id: str, version: int
+    ) -> bool:
+        """
+        Hint that an aggregate reached a version worth snapshotting. Never blocks.
+
+        Args:
+            aggregate_type: The aggregate's type
+            aggregate_id: The ID of the aggregate
+            version: The version the aggregate reached
+
+        Returns:
+            True if the hint was queued or merged, False if it was dropped
+        """
+        self.metrics.hints_received += 1
+        pending = self._pending.get(aggregate_id)
+        if pending is not None:
+            self.metrics.hints_coalesced += 1
+            if version > pending[1]:
+                self._pending[aggregate_id] = (aggregate_type, version)
+            return True
+        try:
+            self._queue.put_nowait(aggregate_id)
+        except asyncio.QueueFull:
+            self.metrics.hints_dropped += 1
+            return False
+        self._pending[aggregate_id] = (aggregate_type, version)
+        self.metrics.pending = len(self._pending)
+        return True
+
+    def start(self) -> None:
+        """Start the worker task on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Wait until every pending hint has been written (inline if not running)."""
+        if self.running:
+            await self._queue.join()
+            return
+        while not self._queue.empty():
+            await self._process(self._take_batch(self._queue.get_nowait()))
+
+    async def stop(self) -> None:
+        """Flush pending hints, then stop the worker task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            batch = self._take_batch(await self._queue.get())
+            try:
+                await self._process(batch)
+            except Exception as e:
                 self.logger.structured_log(
-                    "DEBUG",
-                    f"Deleted snapshot for aggregate {aggregate_id}",
+                    "ERROR",
+                    f"Snapshot batch failed: {e}",
                     name="uno.events.snapshots",
+                    error=e,
                 )
 
-            return Success(None)
-
+    def _take_batch(self, first: str) -> list[tuple[str, type[AggregateRoot], int]]:
+        """Dequeue up to batch_size hints, starting with ``first``."""
+        ids = [first]
+        while len(ids) < self.batch_size and not self._queue.empty():
+            ids.append(self._queue.get_nowait())
+        # Popped now, so hints arriving during the write queue the aggregate again
+        batch = [(aggregate_id, *self._pending.pop(aggregate_id)) for aggregate_id in ids]
+        self.metrics.pending = len(self._pending)
+        return batch
+
+    async def _process(self, batch: list[tuple[str, type[AggregateRoot], int]]) -> None:
+        start = time.perf_counter()
+        try:
+            aggregates = []
+            for aggregate_id, aggregate_type, version in batch:
+                aggregate = await self._rebuild(aggregate_id, aggregate_type, version)
+                if aggregate is not None:
+                    aggregates.append(aggregate)
+
+            result = await self.snapshot_store.save_snapshots(aggregates)
+            if result.is_failure:
+                self.metrics.failures += len(aggregates)
+                self.logger.structured_log(
+                    "ERROR",
+                    f"Error writing {len(aggregates)} snapshots: {result.error}",
+                    name="uno.events.snapshots",
+                    error=result.error,
+                )
+            else:
+                self.metrics.snapshots_written += len(aggregates)
+            self.metrics.batches_written += 1
+            self.metrics.last_batch_duration = time.perf_counter() - start
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    async def _rebuild(
+        self, aggregate_id: str, aggregate_type: type[AggregateRoot], version: int
+    ) -> AggregateRoot | None:
+        """Load an aggregate from its latest snapshot and the events after it."""
+        try:
+            snapshot_result = await self.snapshot_store.get_snapshot(
+                aggregate_id, aggregate_type
+            )
+            snapshot = None if snapshot_result.is_failure else snapshot_result.value
+            if snapshot is not None and snapshot.version >= version:
+                self.metrics.snapshots_skipped += 1
+                return None
+
+            events_result = await self.event_store.get_stream_range(
+                aggregate_id,
+                after_version=snapshot.version if snapshot is not None else 0,
+            )
+            if events_result.is_failure:
+                raise events_result.error
+            events = events_result.value
+            if snapshot is not None:
+                return aggregate_type.from_snapshot(snapshot, events)
+            if not events:
+                return None
+            return aggregate_type.from_events(events, trusted=True)
         except Exception as e:
+            self.metrics.failures += 1
             self.logger.structured_log(
                 "ERROR",
-                f"Error deleting snapshot: {e}",
+                f"Error rebuilding aggregate {aggregate_id} for a snapshot: {e}",
                 name="uno.events.snapshots",
                 error=e,
             )
-            return Failure(e)
+            return None
+
+
+# Key under which file and database snapshots carry the aggregate's private state
+_PRIVATE_STATE_KEY = "_private"
+
+
+def _private_state(aggregate: AggregateRoot) -> dict[str, object]:
+    """The private attributes an aggregate's snapshot must keep (e.g. ``_is_deleted``)."""
+    private = aggregate.__pydantic_private__ or {}
+    return {
+        name: private[name]
+        for name in getattr(type(aggregate), "_snapshot_private_attrs", ())
+        if name in private
+    }
+
+
+def _restore_private_state(aggregate: object, state: dict[str, object]) -> None:
+    """Set the private attributes saved by ``_private_state`` on a loaded snapshot."""
+    names = getattr(type(aggregate), "_snapshot_private_attrs", ())
+    for name, value in state.items():
+        if name in names:
+            aggregate.__pydantic_private__[name] = value
+
+
+# Sorted keys keep snapshot files canonical (as json.dump(sort_keys=True) did)
+_snapshot_encoder = msgspec.json.Encoder(order="sorted")
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist changes to a directory's entries (e.g. a rename into it)."""
+    if os.name == "nt":
+        # Directories cannot be opened for fsync on Windows
+        return
+    fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _decode_snapshot(data: bytes | mmap.mmap) -> dict[str, object]:
+    """Decode a snapshot file, detecting compression from its first bytes."""
+    if data[:4] == _ZSTD_MAGIC:
+        data = decompress("zstd", data)
+    elif data[:1] not in (b"{", b" ", b"\n"):
+        # zlib streams start with 0x78; plain JSON files with "{"
+        data = decompress("zlib", data)
+    return msgspec.json.decode(data)
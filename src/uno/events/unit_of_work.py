@@ -12,6 +12,7 @@ from typing import Any, TypeVar
 
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncTransaction
 
+from uno.errors.result import Failure, Result, Success
 from uno.events.event_store import EventStore
 from uno.logging.logger import LoggerService, LoggingConfig
 
@@ -91,6 +92,23 @@ class InMemoryUnitOfWork(UnitOfWork):
 
         self._committed = False
 
+    async def save_events(
+        self, events: list[Any], expected_version: int | None = None
+    ) -> Result[None, Exception]:
+        """
+        Save a batch of events through the event store as one append.
+
+        Args:
+            events: The events to save, in stream order
+            expected_version: The stream version the aggregate is expected to be at
+
+        Returns:
+            Result with None on success, or an error
+        """
+        return await self.event_store.save_events(
+            events, expected_version=expected_version
+        )
+
     async def commit(self) -> None:
         """
         Commit the current unit of work.
@@ -202,6 +220,29 @@ class PostgresUnitOfWork(UnitOfWork):
         else:
             self.logger = LoggerService(LoggingConfig())
 
+    async def save_events(
+        self, events: list[Any], expected_version: int | None = None
+    ) -> Result[None, Exception]:
+        """
+        Save a batch of events as one append inside this unit of work's transaction.
+
+        Args:
+            events: The events to save, in stream order
+            expected_version: The stream version the aggregate is expected to be at
+
+        Returns:
+            Result with None on success, or an error
+        """
+        from uno.events.postgres_event_store import PostgresEventStore
+
+        if isinstance(self.event_store, PostgresEventStore):
+            return await self.event_store.save_events(
+                events, expected_version=expected_version, session=self.session
+            )
+        return await self.event_store.save_events(
+            events, expected_version=expected_version
+        )
+
     async def commit(self) -> None:
         """
         Commit the current unit of work.
@@ -4,12 +4,41 @@
 
 """SQL emitters for event store operations."""
 
+from typing import Literal
+
+from pydantic import Field
+
 from uno.persistence.sql.emitter import SQLEmitter
 from uno.persistence.sql.statement import SQLStatement, SQLStatementType
 
 
 class CreateDomainEventsTable(SQLEmitter):
-    """Emitter for creating the domain_events table and related objects."""
+    """Emitter for creating the domain_events table and related objects.
+
+    By default domain_events is a single table. Set ``partition_by`` to create
+    it as a declaratively partitioned table instead:
+
+    - ``"month"``: range partitions on ``timestamp``, one per month. Partitions
+      are pre-created ``premake_months`` ahead by
+      ``create_domain_events_partitions()``, which is scheduled monthly when
+      pg_cron is installed; a default partition catches anything outside them,
+      and its rows are moved into a month's partition when that is created.
+    - ``"hash"``: ``hash_partitions`` partitions on ``aggregate_id``, so every
+      stream lives in exactly one partition and stream reads touch only it
+      (aggregate_id becomes part of the primary key and NOT NULL).
+
+    Indexes are declared on the parent and created on every partition. Unique
+    keys must contain the partition key, so with monthly partitions the
+    per-stream version check is left to the check_event_version trigger
+    (emitted by CreateEventProjectionFunction with the same ``partition_by``),
+    which locks the aggregate and reports a duplicate version as a unique
+    violation of ``uq_domain_events_aggregate_version``, like the unique index
+    does.
+    """
+
+    partition_by: Literal["month", "hash"] | None = None
+    hash_partitions: int = Field(16, ge=2)
+    premake_months: int = Field(3, ge=0)
 
     def generate_sql(self) -> list[SQLStatement]:
         """Generate SQL statements for creating the domain_events table.
@@ -26,39 +55,16 @@ class CreateDomainEventsTable(SQLEmitter):
         reader_role = f"{db_name}_reader"
         writer_role = f"{db_name}_writer"
 
-        create_table_sql = f"""
-        SET ROLE {admin_role};
-        
-        -- Create domain events table for event sourcing
-        CREATE TABLE IF NOT EXISTS {schema}.domain_events (
-            event_id VARCHAR(36) PRIMARY KEY,
-            event_type VARCHAR(100) NOT NULL,
-            aggregate_id VARCHAR(36),
-            aggregate_type VARCHAR(100),
-            timestamp TIMESTAMP NOT NULL,
-            version INT DEFAULT 1,
-            data JSONB NOT NULL,
-            metadata JSONB,
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        );
-
-        -- Create indices for efficient querying
-        CREATE INDEX IF NOT EXISTS idx_domain_events_event_type ON {schema}.domain_events(event_type);
-        CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_id ON {schema}.domain_events(aggregate_id);
-        CREATE INDEX IF NOT EXISTS idx_domain_events_timestamp ON {schema}.domain_events(timestamp);
-        CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_version ON {schema}.domain_events(aggregate_id, version);
-        
-        COMMENT ON TABLE {schema}.domain_events IS 'Stores domain events for event sourcing and event-driven architecture';
-        """
-
-        # Add the create table statement to the list
-        statements.append(
-            SQLStatement(
-                name="create_domain_events_table",
-                type=SQLStatementType.TABLE,
-                sql=create_table_sql,
+        if self.partition_by is not None:
+            statements.extend(self._partitioned_table_sql(schema, admin_role))
+        else:
+            statements.append(
+                SQLStatement(
+                    name="create_domain_events_table",
+                    type=SQLStatementType.TABLE,
+                    sql=self._table_sql(schema, admin_role),
+                )
             )
-        )
 
         # Generate the notification function SQL
         notification_function_sql = f"""
@@ -73,6 +79,7 @@ class CreateDomainEventsTable(SQLEmitter):
                 'domain_events',
                 json_build_object(
                     'event_id', NEW.event_id,
+                    'global_position', NEW.global_position,
                     'event_type', NEW.event_type,
                     'aggregate_id', NEW.aggregate_id,
                     'aggregate_type', NEW.aggregate_type,
@@ -135,6 +142,188 @@ class CreateDomainEventsTable(SQLEmitter):
 
         return statements
 
+    def _table_sql(self, schema: str, admin_role: str) -> str:
+        """SQL for the unpartitioned domain_events table and its indexes."""
+        return f"""
+        SET ROLE {admin_role};
+        
+        -- Create domain events table for event sourcing
+        CREATE TABLE IF NOT EXISTS {schema}.domain_events (
+            event_id VARCHAR(36) PRIMARY KEY,
+            global_position BIGINT GENERATED BY DEFAULT AS IDENTITY,
+            event_type VARCHAR(100) NOT NULL,
+            aggregate_id VARCHAR(36),
+            aggregate_type VARCHAR(100),
+            timestamp TIMESTAMP NOT NULL,
+            version INT DEFAULT 1,
+            data JSONB NOT NULL,
+            metadata JSONB,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+
+        -- Add the global position to tables created before it existed
+        ALTER TABLE {schema}.domain_events
+            ADD COLUMN IF NOT EXISTS global_position BIGINT GENERATED BY DEFAULT AS IDENTITY;
+
+        -- Create indices for efficient querying
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_domain_events_global_position ON {schema}.domain_events(global_position);
+        CREATE INDEX IF NOT EXISTS idx_domain_events_event_type ON {schema}.domain_events(event_type);
+        CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_id ON {schema}.domain_events(aggregate_id);
+        CREATE INDEX IF NOT EXISTS idx_domain_events_timestamp ON {schema}.domain_events(timestamp);
+
+        -- One row per stream version: concurrent appends to the same aggregate
+        -- fail with a unique violation instead of interleaving
+        DROP INDEX IF EXISTS {schema}.idx_domain_events_aggregate_version;
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_domain_events_aggregate_version ON {schema}.domain_events(aggregate_id, version);
+        
+        COMMENT ON TABLE {schema}.domain_events IS 'Stores domain events for event sourcing and event-driven architecture';
+        """
+
+    def _partitioned_table_sql(
+        self, schema: str, admin_role: str
+    ) -> list[SQLStatement]:
+        """SQL for the partitioned domain_events table, its partitions and indexes."""
+        key = "timestamp" if self.partition_by == "month" else "aggregate_id"
+        strategy = "RANGE" if self.partition_by == "month" else "HASH"
+
+        create_table_sql = f"""
+        SET ROLE {admin_role};
+        
+        -- Create domain events table for event sourcing, partitioned by {key}
+        CREATE TABLE IF NOT EXISTS {schema}.domain_events (
+            event_id VARCHAR(36) NOT NULL,
+            global_position BIGINT GENERATED BY DEFAULT AS IDENTITY,
+            event_type VARCHAR(100) NOT NULL,
+            aggregate_id VARCHAR(36),
+            aggregate_type VARCHAR(100),
+            timestamp TIMESTAMP NOT NULL,
+            version INT DEFAULT 1,
+            data JSONB NOT NULL,
+            metadata JSONB,
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (event_id, {key})
+        ) PARTITION BY {strategy} ({key});
+
+        -- Indices declared on the parent are created on every partition;
+        -- unique indices must include the partition key
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_domain_events_global_position ON {schema}.domain_events(global_position, {key});
+        CREATE INDEX IF NOT EXISTS idx_domain_events_event_type ON {schema}.domain_events(event_type);
+        CREATE INDEX IF NOT EXISTS idx_domain_events_timestamp ON {schema}.domain_events(timestamp);
+        """
+        if self.partition_by == "hash":
+            create_table_sql += f"""
+        -- One row per stream version (also serves lookups by aggregate_id)
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_domain_events_aggregate_version ON {schema}.domain_events(aggregate_id, version);
+        """
+        else:
+            create_table_sql += f"""
+        -- Stream lookups; version uniqueness is enforced by check_event_version,
+        -- which serialises appends per aggregate
+        CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_version ON {schema}.domain_events(aggregate_id, version);
+        """
+        create_table_sql += f"""
+        COMMENT ON TABLE {schema}.domain_events IS 'Stores domain events for event sourcing and event-driven architecture (partitioned by {key})';
+        """
+
+        statements = [
+            SQLStatement(
+                name="create_domain_events_table",
+                type=SQLStatementType.TABLE,
+                sql=create_table_sql,
+            )
+        ]
+
+        if self.partition_by == "hash":
+            partitions_sql = "\n".join(
+                f"        CREATE TABLE IF NOT EXISTS {schema}.domain_events_p{remainder} "
+                f"PARTITION OF {schema}.domain_events "
+                f"FOR VALUES WITH (MODULUS {self.hash_partitions}, REMAINDER {remainder});"
+                for remainder in range(self.hash_partitions)
+            )
+            statements.append(
+                SQLStatement(
+                    name="create_domain_events_partitions",
+                    type=SQLStatementType.TABLE,
+                    sql=f"""
+        SET ROLE {admin_role};
+        
+{partitions_sql}
+        """,
+                    depends_on=["create_domain_events_table"],
+                )
+            )
+            return statements
+
+        # Monthly partitions are created ahead of time by a function that can
+        # be re-run at any time (it skips partitions that already exist)
+        partition_function_sql = f"""
+        SET ROLE {admin_role};
+        
+        -- Rows outside the pre-created months land here rather than failing
+        CREATE TABLE IF NOT EXISTS {schema}.domain_events_default
+            PARTITION OF {schema}.domain_events DEFAULT;
+
+        -- A month's partition cannot be created while the default partition
+        -- holds rows for that month, so new partitions are built as plain
+        -- tables, those rows are moved into them, and they are then attached
+        CREATE OR REPLACE FUNCTION {schema}.create_domain_events_partitions(
+            months_ahead INT DEFAULT {self.premake_months}
+        )
+        RETURNS VOID AS $$
+        DECLARE
+            month_start DATE;
+            month_end DATE;
+            partition_name TEXT;
+        BEGIN
+            FOR i IN 0..months_ahead LOOP
+                month_start := (date_trunc('month', now()) + make_interval(months => i))::date;
+                month_end := (month_start + INTERVAL '1 month')::date;
+                partition_name := 'domain_events_' || to_char(month_start, 'YYYY_MM');
+                CONTINUE WHEN to_regclass(format('%I.%I', '{schema}', partition_name)) IS NOT NULL;
+
+                EXECUTE format(
+                    'CREATE TABLE %I.%I (LIKE %I.domain_events INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                    '{schema}', partition_name, '{schema}'
+                );
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM %I.domain_events_default '
+                    'WHERE timestamp >= %L AND timestamp < %L RETURNING *) '
+                    'INSERT INTO %I.%I SELECT * FROM moved',
+                    '{schema}', month_start, month_end, '{schema}', partition_name
+                );
+                EXECUTE format(
+                    'ALTER TABLE %I.domain_events ATTACH PARTITION %I.%I FOR VALUES FROM (%L) TO (%L)',
+                    '{schema}', '{schema}', partition_name, month_start, month_end
+                );
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        SELECT {schema}.create_domain_events_partitions();
+
+        -- Keep partitions ahead of time with pg_cron when it is available
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    '{schema}_domain_events_partitions',
+                    '0 0 1 * *',
+                    'SELECT {schema}.create_domain_events_partitions()'
+                );
+            END IF;
+        END;
+        $$;
+        """
+        statements.append(
+            SQLStatement(
+                name="create_domain_events_partitions",
+                type=SQLStatementType.FUNCTION,
+                sql=partition_function_sql,
+                depends_on=["create_domain_events_table"],
+            )
+        )
+        return statements
+
 
 class CreateEventProcessorsTable(SQLEmitter):
     """Emitter for creating the event_processors table for tracking consumers."""
@@ -373,7 +562,16 @@ class CreateEventSnapshotsTable(SQLEmitter):
 
 
 class CreateEventProjectionFunction(SQLEmitter):
-    """Emitter for creating event projection functions."""
+    """Emitter for creating event projection functions.
+
+    Set ``partition_by`` to the value given to CreateDomainEventsTable. With
+    monthly partitions there is no unique (aggregate_id, version) index, so
+    check_event_version takes a transaction-scoped advisory lock on the
+    aggregate before reading its latest version; otherwise the unique index
+    serialises appends and no lock is taken.
+    """
+
+    partition_by: Literal["month", "hash"] | None = None
 
     def generate_sql(self) -> list[SQLStatement]:
         """Generate SQL statements for creating event projection functions.
@@ -485,6 +683,17 @@ class CreateEventProjectionFunction(SQLEmitter):
             )
         )
 
+        # Without a unique stream version index (monthly partitions), appends
+        # to an aggregate are serialised until the transaction ends, so
+        # concurrent writers cannot both see the same latest version
+        lock_aggregate_sql = (
+            """
+            PERFORM pg_advisory_xact_lock(hashtextextended(NEW.aggregate_id, 0));
+"""
+            if self.partition_by == "month"
+            else ""
+        )
+
         # Generate the version check function for optimistic concurrency
         version_check_function_sql = f"""
         SET ROLE {admin_role};
@@ -500,6 +709,7 @@ class CreateEventProjectionFunction(SQLEmitter):
                 RETURN NEW;
             END IF;
             
+{lock_aggregate_sql}
             -- Get the latest version for this aggregate
             SELECT MAX(version) INTO latest_version
             FROM {schema}.domain_events
@@ -512,6 +722,14 @@ class CreateEventProjectionFunction(SQLEmitter):
                     RAISE EXCEPTION 'Invalid version for first event: expected 1, got %', NEW.version;
                 END IF;
             -- Otherwise version should be exactly one more than the latest
+            ELSIF NEW.version <= latest_version THEN
+                -- Reported as the unique index would (partitioned tables cannot
+                -- have one), so clients detect the conflict the same way
+                RAISE EXCEPTION 'duplicate key value violates unique constraint "uq_domain_events_aggregate_version"'
+                    USING ERRCODE = 'unique_violation',
+                          CONSTRAINT = 'uq_domain_events_aggregate_version',
+                          DETAIL = format('Key (aggregate_id, version)=(%s, %s) already exists.',
+                                          NEW.aggregate_id, NEW.version);
             ELSIF NEW.version <> latest_version + 1 THEN
                 RAISE EXCEPTION 'Concurrency conflict: expected version %, got %', 
                               latest_version + 1, NEW.version;
@@ -0,0 +1,74 @@
+"""Benchmarks for time-ordered event ids.
+
+Inserts 200k events keyed by random (uuid4) and time-ordered (ULID, UUIDv7)
+ids into a clustered primary-key index (a ``WITHOUT ROWID`` SQLite table with
+a small page cache) and compares insert throughput. Random keys touch a random
+leaf page per insert; time-ordered keys append to the rightmost one. Run with
+``hatch run test:benchmark``; pytest-benchmark reports the three strategies in
+the ``event-id-inserts`` group.
+"""
+
+from __future__ import annotations
+
+import itertools
+import sqlite3
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from uno.events.ids import new_event_ids
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+COUNT = 200_000
+BATCH = 1_000
+PAYLOAD = b"x" * 200
+
+
+def _empty_table(path: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA cache_size=-2000")
+    connection.execute("PRAGMA journal_mode=OFF")
+    connection.execute("PRAGMA synchronous=OFF")
+    connection.execute(
+        "CREATE TABLE events (event_id TEXT PRIMARY KEY, payload BLOB) WITHOUT ROWID"
+    )
+    return connection
+
+
+def _insert_events(connection: sqlite3.Connection, kind: str) -> None:
+    for _ in range(COUNT // BATCH):
+        connection.executemany(
+            "INSERT INTO events VALUES (?, ?)",
+            [(event_id, PAYLOAD) for event_id in new_event_ids(BATCH, kind)],
+        )
+        connection.commit()
+
+
+@pytest.mark.parametrize("kind", ["uuid7", "ulid"])
+def test_time_ordered_ids_are_sorted(kind: str) -> None:
+    ids = new_event_ids(10_000, kind)
+
+    assert ids == sorted(ids)
+
+
+@pytest.mark.benchmark(group="event-id-inserts")
+@pytest.mark.parametrize("kind", ["uuid4", "ulid", "uuid7"])
+def test_insert_events(benchmark: Any, tmp_path: Path, kind: str) -> None:
+    connections: list[sqlite3.Connection] = []
+    rounds = itertools.count()
+
+    def setup() -> tuple[tuple[sqlite3.Connection, str], dict[str, Any]]:
+        connection = _empty_table(tmp_path / f"{kind}-{next(rounds)}.db")
+        connections.append(connection)
+        return (connection, kind), {}
+
+    try:
+        benchmark.pedantic(_insert_events, setup=setup, rounds=3)
+        (count,) = connections[-1].execute("SELECT count(*) FROM events").fetchone()
+    finally:
+        for connection in connections:
+            connection.close()
+
+    assert count == COUNT
@@ -0,0 +1,71 @@
+"""Benchmarks for cached value object hashing and equality.
+
+Compares set and dict operations over 100k value objects using the cached
+canonical key against the previous behaviour (a fresh ``model_dump`` on every
+``__eq__``/``__hash__`` call). Run with ``hatch run test:benchmark``;
+pytest-benchmark reports both timings in the ``value-object-hashing`` group.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from uno.domain.value_object import ValueObject
+
+COUNT = 100_000
+
+
+class Quantity(ValueObject):
+    amount: int
+    unit: str
+    sku: str
+
+
+class UncachedQuantity(Quantity):
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, ValueObject) and self.model_dump(
+            exclude_none=True, exclude_unset=True, by_alias=True
+        ) == other.model_dump(exclude_none=True, exclude_unset=True, by_alias=True)
+
+    def __hash__(self) -> int:
+        return hash(
+            tuple(
+                sorted(
+                    self.model_dump(
+                        exclude_none=True, exclude_unset=True, by_alias=True
+                    ).items()
+                )
+            )
+        )
+
+
+def _quantities(cls: type[Quantity]) -> list[Quantity]:
+    # Every value appears twice, so half the inserts hit an existing key
+    return [
+        cls(amount=i % (COUNT // 2), unit="each", sku=f"SKU-{i % (COUNT // 2)}")
+        for i in range(COUNT)
+    ]
+
+
+def _set_and_dict_ops(values: list[Quantity]) -> int:
+    unique = set(values)
+    totals: dict[Quantity, int] = {}
+    for value in values:
+        totals[value] = totals.get(value, 0) + 1
+    hits = sum(1 for value in values if value in unique)
+    return len(unique) + len(totals) + hits
+
+
+@pytest.mark.benchmark(group="value-object-hashing")
+@pytest.mark.parametrize(
+    "cls", [UncachedQuantity, Quantity], ids=["uncached", "cached"]
+)
+def test_set_and_dict_operations(benchmark: Any, cls: type[Quantity]) -> None:
+    values = _quantities(cls)
+
+    result = benchmark.pedantic(_set_and_dict_ops, (values,), rounds=3)
+
+    # Half the values are duplicates: COUNT // 2 unique keys, all COUNT hits
+    assert result == COUNT // 2 + COUNT // 2 + COUNT
@@ -0,0 +1,40 @@
+"""Shared fixtures for the Uno test suite."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+
+class RecordingLogger:
+    """
+    Logger double for components that take a logger service: collects
+    structured_log calls and accepts the LoggerProtocol methods.
+    """
+
+    def __init__(self) -> None:
+        self.records: list[tuple[str, str]] = []
+
+    def structured_log(self, level: str, message: str, **kwargs: Any) -> None:
+        self.records.append((level, message))
+
+    def _log(self, level: str, message: str, **kwargs: Any) -> None:
+        self.records.append((level, message))
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        self._log("DEBUG", message)
+
+    def info(self, message: str, **kwargs: Any) -> None:
+        self._log("INFO", message)
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        self._log("WARNING", message)
+
+    def error(self, message: str, **kwargs: Any) -> None:
+        self._log("ERROR", message)
+
+
+@pytest.fixture
+def logger() -> Any:
+    return RecordingLogger()
@@ -0,0 +1,59 @@
+"""Tests for rehydrating aggregates from their events."""
+
+from __future__ import annotations
+
+import pytest
+
+from uno.domain.aggregate import AggregateRoot
+from uno.events.base_event import DomainEvent
+
+
+class Withdrawn(DomainEvent):
+    event_type = "withdrawn"
+    aggregate_id: str
+    amount: int
+
+
+class Deposited(DomainEvent):
+    event_type = "deposited"
+    aggregate_id: str
+    amount: int
+
+
+class Account(AggregateRoot[str]):
+    balance: int = 0
+
+    def apply_withdrawn(self, event: Withdrawn) -> None:
+        self.balance -= event.amount
+
+    def apply_deposited(self, event: Deposited) -> None:
+        self.balance += event.amount
+
+    def enforce_invariants(self) -> None:
+        if self.balance < 0:
+            raise ValueError("balance must not be negative")
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_events_checks_invariants_once_at_the_end(trusted: bool) -> None:
+    # Overdrawn after the first event, consistent after the second
+    events = [
+        Withdrawn(aggregate_id="acc-1", amount=5),
+        Deposited(aggregate_id="acc-1", amount=10),
+    ]
+
+    account = Account.from_events(events, trusted=trusted)
+
+    assert account.balance == 5
+    assert account.version == 2
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_from_events_rejects_an_inconsistent_final_state(trusted: bool) -> None:
+    events = [
+        Deposited(aggregate_id="acc-1", amount=10),
+        Withdrawn(aggregate_id="acc-1", amount=15),
+    ]
+
+    with pytest.raises(Exception, match="balance must not be negative"):
+        Account.from_events(events, trusted=trusted)
@@ -0,0 +1,268 @@
+"""Tests for the event-sourced repository."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from uno.domain.aggregate import AggregateRoot
+from uno.domain.config import DomainConfig
+from uno.domain.event_sourced_repository import EventSourcedRepository
+from uno.errors.result import Failure
+from uno.events.base_event import DomainEvent
+from uno.events.errors import ConcurrencyConflictError
+from uno.events.event_store import InMemoryEventStore
+from uno.events.snapshots import EventCountSnapshotStrategy, InMemorySnapshotStore
+
+
+class Deposited(DomainEvent):
+    event_type = "deposited"
+    aggregate_id: str
+    amount: int
+
+
+class Account(AggregateRoot[str]):
+    balance: int = 0
+
+    def deposit(self, amount: int) -> None:
+        self.add_event(Deposited(aggregate_id=self.id, amount=amount))
+
+    def apply_deposited(self, event: Deposited) -> None:
+        self.balance += event.amount
+
+
+class RangeRecordingEventStore(InMemoryEventStore):
+    """Records the bounds of every ranged stream read."""
+
+    def __init__(self, logger: Any) -> None:
+        super().__init__(logger)
+        self.ranges: list[tuple[int, int | None]] = []
+
+    async def get_stream_range(
+        self,
+        aggregate_id: str,
+        after_version: int = 0,
+        to_version: int | None = None,
+        to_timestamp: float | None = None,
+    ) -> Any:
+        self.ranges.append((after_version, to_version))
+        return await super().get_stream_range(
+            aggregate_id, after_version, to_version, to_timestamp
+        )
+
+
+class UnreadableSnapshotStore(InMemorySnapshotStore):
+    async def get_snapshot(self, *args: Any, **kwargs: Any) -> Any:
+        return Failure(OSError("snapshot storage unavailable"))
+
+
+class RecordingPublisher:
+    def __init__(self) -> None:
+        self.published: list[DomainEvent] = []
+
+    async def publish(self, event: DomainEvent) -> None:
+        self.published.append(event)
+
+
+@pytest.fixture
+def store(logger: Any) -> InMemoryEventStore:
+    return InMemoryEventStore(logger)
+
+
+def _repository(
+    store: InMemoryEventStore, logger: Any, **kwargs: Any
+) -> EventSourcedRepository[Account]:
+    return EventSourcedRepository(
+        Account, store, RecordingPublisher(), logger, DomainConfig(), **kwargs
+    )
+
+
+async def _open_account(
+    repository: EventSourcedRepository[Account], *amounts: int
+) -> None:
+    account = Account(id="acc-1")
+    for amount in amounts:
+        account.deposit(amount)
+    await repository.add(account)
+
+
+@pytest.mark.asyncio
+async def test_add_rejects_a_stale_aggregate(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    repository = _repository(store, logger)
+    await _open_account(repository, 10)
+    first = await repository.get_by_id("acc-1")
+    second = await repository.get_by_id("acc-1")
+
+    first.deposit(5)
+    await repository.add(first)
+    second.deposit(7)
+    with pytest.raises(ConcurrencyConflictError):
+        await repository.add(second)
+
+    reloaded = await repository.get_by_id("acc-1")
+    assert (reloaded.balance, reloaded.version) == (15, 2)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_reapplies_the_command(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    repository = _repository(store, logger)
+    await _open_account(repository, 10)
+    attempts: list[int] = []
+
+    async def deposit(account: Account) -> None:
+        attempts.append(account.version)
+        if len(attempts) == 1:
+            # Another writer gets in between this load and the append
+            rival = await repository.get_by_id("acc-1")
+            rival.deposit(5)
+            await repository.add(rival)
+        account.deposit(1)
+
+    account = await repository.execute_with_retry("acc-1", deposit)
+
+    assert attempts == [1, 2]
+    assert (account.balance, account.version) == (16, 3)
+
+
+@pytest.mark.asyncio
+async def test_execute_with_retry_gives_up_after_max_attempts(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    repository = _repository(store, logger)
+    await _open_account(repository, 10)
+
+    async def always_conflict(account: Account) -> None:
+        rival = await repository.get_by_id("acc-1")
+        rival.deposit(5)
+        await repository.add(rival)
+        account.deposit(1)
+
+    with pytest.raises(ConcurrencyConflictError):
+        await repository.execute_with_retry("acc-1", always_conflict, max_attempts=2)
+
+
+@pytest.mark.asyncio
+async def test_get_many_loads_each_found_aggregate(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    repository = _repository(store, logger)
+    for account_id, amount in (("acc-1", 10), ("acc-2", 20)):
+        account = Account(id=account_id)
+        account.deposit(amount)
+        account.deposit(1)
+        await repository.add(account)
+
+    accounts = await repository.get_many(["acc-1", "acc-2", "missing"])
+
+    assert {
+        account_id: (account.balance, account.version)
+        for account_id, account in accounts.items()
+    } == {"acc-1": (11, 2), "acc-2": (21, 2)}
+
+
+@pytest.mark.asyncio
+async def test_get_as_of_version_starts_from_the_nearest_snapshot(logger: Any) -> None:
+    store = RangeRecordingEventStore(logger)
+    repository = _repository(
+        store,
+        logger,
+        snapshot_store=InMemorySnapshotStore(logger),
+        snapshot_strategy=EventCountSnapshotStrategy(threshold=2),
+    )
+    await _open_account(repository, 1)
+    for amount in (2, 3, 4, 5):
+        account = await repository.get_by_id("acc-1")
+        account.deposit(amount)
+        await repository.add(account)
+    store.ranges.clear()
+
+    as_of_3 = await repository.get_as_of("acc-1", version=3)
+    as_of_1 = await repository.get_as_of("acc-1", version=1)
+
+    assert (as_of_3.balance, as_of_3.version) == (6, 3)
+    assert (as_of_1.balance, as_of_1.version) == (1, 1)
+    # Snapshots were taken at versions 2 and 4
+    assert store.ranges == [(2, 3), (0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_get_as_of_timestamp(store: InMemoryEventStore, logger: Any) -> None:
+    repository = _repository(store, logger)
+    account = Account(id="acc-1")
+    for amount, timestamp in ((1, 1000.0), (2, 2000.0), (3, 3000.0)):
+        account.add_event(
+            Deposited(aggregate_id="acc-1", amount=amount, timestamp=timestamp)
+        )
+    await repository.add(account)
+
+    as_of = await repository.get_as_of("acc-1", timestamp=2500.0)
+
+    assert (as_of.balance, as_of.version) == (3, 2)
+    assert await repository.get_as_of("acc-1", timestamp=500.0) is None
+
+
+@pytest.mark.asyncio
+async def test_add_writes_a_snapshot_when_the_strategy_asks(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    snapshots = InMemorySnapshotStore(logger)
+    repository = _repository(
+        store,
+        logger,
+        snapshot_store=snapshots,
+        snapshot_strategy=EventCountSnapshotStrategy(threshold=2),
+    )
+
+    await _open_account(repository, 10)
+    assert (await snapshots.get_snapshot("acc-1", Account)).value is None
+
+    account = await repository.get_by_id("acc-1")
+    account.deposit(5)
+    await repository.add(account)
+
+    snapshot = (await snapshots.get_snapshot("acc-1", Account)).value
+    assert (snapshot.balance, snapshot.version) == (15, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_replays_only_events_after_the_snapshot(logger: Any) -> None:
+    store = RangeRecordingEventStore(logger)
+    repository = _repository(
+        store,
+        logger,
+        snapshot_store=InMemorySnapshotStore(logger),
+        snapshot_strategy=EventCountSnapshotStrategy(threshold=2),
+    )
+    await _open_account(repository, 10, 5, 1)
+    store.ranges.clear()
+
+    account = await repository.get_by_id("acc-1")
+
+    assert (account.balance, account.version) == (16, 3)
+    # The snapshot was taken at version 3, so nothing is left to replay
+    assert store.ranges == [(3, None)]
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_falls_back_to_a_full_replay(
+    store: InMemoryEventStore, logger: Any
+) -> None:
+    repository = _repository(
+        store,
+        logger,
+        snapshot_store=UnreadableSnapshotStore(logger),
+        snapshot_strategy=EventCountSnapshotStrategy(threshold=1),
+    )
+    await _open_account(repository, 10, 5)
+
+    account = await repository.get_by_id("acc-1")
+
+    assert (account.balance, account.version) == (15, 2)
+    assert ("WARNING", "Failed to load snapshot, replaying from the start") in (
+        logger.records
+    )
@@ -0,0 +1,232 @@
+"""Tests for the cold-stream archive tier of the PostgreSQL event store."""
+
+from __future__ import annotations
+
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.sql.elements import BinaryExpression, CollectionAggregate
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from uno.events.archive import PostgresEventArchive
+from uno.events.base_event import DomainEvent
+from uno.events.postgres_event_store import PostgresEventStore
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+    from sqlalchemy import Connection
+
+
+class NoteAdded(DomainEvent):
+    event_type = "archive_note_added"
+    aggregate_id: str
+    text: str
+
+
+# The events table as PostgresEventStore creates it, with an AUTOINCREMENT
+# key standing in for the identity column: positions are never reused
+EVENTS_DDL = """
+CREATE TABLE events (
+    global_position INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    aggregate_id TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    event_type_id INTEGER,
+    version INTEGER NOT NULL,
+    event_version INTEGER NOT NULL,
+    payload JSON,
+    payload_bin BLOB,
+    codec INTEGER NOT NULL DEFAULT 0,
+    created_at DATETIME NOT NULL,
+    event_hash TEXT NOT NULL,
+    UNIQUE (aggregate_id, version)
+)
+"""
+
+COLD = time.time() - timedelta(days=60).total_seconds()
+
+
+def _any_to_in(element: Any) -> Any:
+    if isinstance(element, BinaryExpression) and isinstance(
+        element.right, CollectionAggregate
+    ):
+        return element.left.in_(element.right.element.value)
+    return None
+
+
+class SQLiteSession:
+    """
+    Stands in for an AsyncSession on SQLite. ``column = ANY(:array)`` is
+    rewritten to ``column IN (...)``; FOR UPDATE is ignored by SQLite, so
+    ``on_lock`` runs once, right after the first locking select, to play a
+    concurrent writer.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self.connection = connection
+        self.on_lock: Callable[[], Awaitable[None]] | None = None
+
+    async def execute(self, stmt: Any) -> Any:
+        result = self.connection.execute(replacement_traverse(stmt, {}, _any_to_in))
+        if result.returns_rows:
+            result = result.freeze()()
+        if getattr(stmt, "_for_update_arg", None) is not None and self.on_lock:
+            on_lock, self.on_lock = self.on_lock, None
+            await on_lock()
+        return result
+
+    async def commit(self) -> None:
+        self.connection.commit()
+
+
+class SQLiteConnectionManager:
+    def __init__(self, session: SQLiteSession) -> None:
+        self.session = session
+
+    @asynccontextmanager
+    async def get_connection(self) -> AsyncIterator[SQLiteSession]:
+        yield self.session
+
+
+@pytest.fixture
+def session() -> Iterator[SQLiteSession]:
+    with create_engine("sqlite://").connect() as connection:
+        connection.execute(text(EVENTS_DDL))
+        yield SQLiteSession(connection)
+
+
+@pytest.fixture
+def store(session: SQLiteSession, logger: Any) -> PostgresEventStore:
+    archive = PostgresEventArchive()
+    archive.metadata.create_all(session.connection)
+    store = PostgresEventStore(
+        None, SQLiteConnectionManager(session), logger, archive=archive
+    )
+    store._tables_ready = True
+    return store
+
+
+async def _append(
+    store: PostgresEventStore, aggregate_id: str, *texts: str, timestamp: float | None
+) -> None:
+    events = [
+        NoteAdded(
+            aggregate_id=aggregate_id,
+            text=note,
+            **({} if timestamp is None else {"timestamp": timestamp}),
+        )
+        for note in texts
+    ]
+    assert (await store.save_events(events)).is_success
+
+
+def _hot_rows(session: SQLiteSession, aggregate_id: str) -> list[tuple[int, int]]:
+    return [
+        (row.version, row.global_position)
+        for row in session.connection.execute(
+            text(
+                "SELECT version, global_position FROM events"
+                " WHERE aggregate_id = :id ORDER BY version"
+            ),
+            {"id": aggregate_id},
+        )
+    ]
+
+
+async def _texts(store: PostgresEventStore, aggregate_id: str) -> list[str]:
+    result = await store.get_events_by_aggregate_id(aggregate_id)
+    assert result.is_success
+    return [event.text for event in result.value]
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_only_cold_streams(
+    store: PostgresEventStore, session: SQLiteSession
+) -> None:
+    await _append(store, "note-1", "a", "b", "c", timestamp=COLD)
+    await _append(store, "note-2", "x", timestamp=None)
+
+    result = await store.archive_cold_streams(inactive_for=timedelta(days=30))
+
+    assert result.is_success
+    assert result.value == 1
+    assert _hot_rows(session, "note-1") == []
+    assert [version for version, _ in _hot_rows(session, "note-2")] == [1]
+    archive = store._archive.table
+    (row,) = session.connection.execute(
+        select(archive.c.aggregate_id, archive.c.event_count, archive.c.last_version)
+    )
+    assert tuple(row) == ("note-1", 3, 3)
+
+
+@pytest.mark.asyncio
+async def test_archived_streams_are_read_through_the_archive(
+    store: PostgresEventStore,
+) -> None:
+    await _append(store, "note-1", "a", "b", "c", timestamp=COLD)
+    await _append(store, "note-2", "x", timestamp=None)
+    before = (await store.get_events_by_aggregate_id("note-1")).value
+    assert (await store.archive_cold_streams(timedelta(days=30))).value == 1
+
+    loaded = (await store.get_events_by_aggregate_id("note-1")).value
+    tail = (await store.get_stream_range("note-1", after_version=1)).value
+    streams = (await store.get_events_for_aggregates(["note-1", "note-2"])).value
+
+    assert [(e.text, e.timestamp, e.global_position) for e in loaded] == [
+        (e.text, e.timestamp, e.global_position) for e in before
+    ]
+    assert [event.text for event in tail] == ["b", "c"]
+    assert {
+        aggregate_id: [e.text for e in events]
+        for aggregate_id, events in streams.items()
+    } == {
+        "note-1": ["a", "b", "c"],
+        "note-2": ["x"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_append_promotes_an_archived_stream_keeping_positions(
+    store: PostgresEventStore, session: SQLiteSession
+) -> None:
+    await _append(store, "note-1", "a", "b", timestamp=COLD)
+    await _append(store, "note-2", "x", timestamp=None)
+    positions = [position for _, position in _hot_rows(session, "note-1")]
+    assert (await store.archive_cold_streams(timedelta(days=30))).value == 1
+
+    await _append(store, "note-1", "c", timestamp=None)
+
+    rows = _hot_rows(session, "note-1")
+    assert [version for version, _ in rows] == [1, 2, 3]
+    assert [position for _, position in rows[:2]] == positions
+    assert rows[2][1] > max(position for _, position in _hot_rows(session, "note-2"))
+    archive = store._archive.table
+    assert session.connection.execute(select(archive.c.aggregate_id)).all() == []
+    assert await _texts(store, "note-1") == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_append_racing_an_archive_run_is_kept(
+    store: PostgresEventStore, session: SQLiteSession
+) -> None:
+    await _append(store, "note-1", "a", "b", timestamp=COLD)
+
+    async def concurrent_append() -> None:
+        # Lands after the archive run has read the stream, before it commits
+        await _append(store, "note-1", "c", timestamp=None)
+
+    session.on_lock = concurrent_append
+    assert (await store.archive_cold_streams(timedelta(days=30))).value == 1
+
+    assert [version for version, _ in _hot_rows(session, "note-1")] == [3]
+    assert await _texts(store, "note-1") == ["a", "b", "c"]
+
+    # The next append promotes the archived part back next to the racing row
+    await _append(store, "note-1", "d", timestamp=None)
+    assert [version for version, _ in _hot_rows(session, "note-1")] == [1, 2, 3, 4]
+    assert await _texts(store, "note-1") == ["a", "b", "c", "d"]
@@ -0,0 +1,87 @@
+"""Tests for bulk event construction."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from uno.events.base_event import DomainEvent
+
+
+class ItemTagged(DomainEvent):
+    event_type = "item_tagged"
+    aggregate_id: str
+    tag: str
+    note: str | None = None
+
+
+def test_build_many_matches_validated_construction() -> None:
+    row: dict[str, Any] = {
+        "aggregate_id": "item-1",
+        "tag": "red",
+        "event_id": "evt_1",
+        "timestamp": 1_700_000_000.0,
+    }
+
+    (built,) = ItemTagged.build_many([row], set_hash=False)
+
+    validated = ItemTagged(**row)
+    assert built.to_dict() == validated.to_dict()
+    assert built.model_fields_set == validated.model_fields_set
+    assert built.metadata == {}
+
+
+def test_build_many_generates_ids_and_shares_one_timestamp() -> None:
+    rows = [{"aggregate_id": "item-1", "tag": str(i)} for i in range(100)]
+
+    events = ItemTagged.build_many(rows, id_kind="ulid", timestamp=1_700_000_000.0)
+
+    ids = [event.event_id for event in events]
+    assert len(set(ids)) == len(rows)
+    assert ids == sorted(ids)
+    assert all(event_id.startswith("evt_") for event_id in ids)
+    assert {event.timestamp for event in events} == {1_700_000_000.0}
+
+
+def test_build_many_keeps_ids_and_timestamps_given_in_rows() -> None:
+    first, second = ItemTagged.build_many(
+        [
+            {"aggregate_id": "item-1", "tag": "a", "event_id": "evt_given"},
+            {"aggregate_id": "item-1", "tag": "b", "timestamp": 5.0},
+        ],
+        timestamp=1.0,
+    )
+
+    assert (first.event_id, first.timestamp) == ("evt_given", 1.0)
+    assert second.event_id != "evt_given"
+    assert second.timestamp == 5.0
+
+
+def test_build_many_reuses_the_layout_without_sharing_defaults() -> None:
+    first, second = ItemTagged.build_many(
+        [{"aggregate_id": "item-1", "tag": "a"}, {"aggregate_id": "item-2", "tag": "b"}]
+    )
+    layout = ItemTagged._build_layout()
+    (third,) = ItemTagged.build_many([{"aggregate_id": "item-3", "tag": "c"}])
+
+    assert ItemTagged._build_layout() is layout
+    assert first.metadata is not second.metadata
+    assert third.metadata is not first.metadata
+    first.metadata["mutated"] = True
+    assert second.metadata == third.metadata == {}
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        {"aggregate_id": "item-1"},
+        {"aggregate_id": "item-1", "tag": "a", "colour": "red"},
+    ],
+    ids=["missing", "unknown"],
+)
+def test_build_many_rejects_rows_that_do_not_fit_the_layout(
+    row: dict[str, Any],
+) -> None:
+    with pytest.raises(ValueError, match="Cannot build ItemTagged"):
+        ItemTagged.build_many([row])
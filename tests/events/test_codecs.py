@@ -0,0 +1,38 @@
+"""Tests for event payload storage codecs."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from uno.events.codecs import EventStorageCodec, PayloadCodec
+
+PAYLOAD = {"aggregate_id": "acc-1", "note": "x" * 64}
+
+
+@pytest.mark.parametrize(
+    ("payload_format", "compression", "codec"),
+    [
+        ("json", None, PayloadCodec.JSON),
+        ("json", "zlib", PayloadCodec.JSON_ZLIB),
+        ("msgpack", None, PayloadCodec.MSGPACK),
+        ("msgpack", "zlib", PayloadCodec.MSGPACK_ZLIB),
+    ],
+)
+def test_encoded_payloads_decode_back(
+    payload_format: str, compression: str | None, codec: PayloadCodec
+) -> None:
+    encoded = EventStorageCodec(
+        format=payload_format, compression=compression, compress_threshold=0
+    ).encode(PAYLOAD)
+
+    decoded = EventStorageCodec.decode(encoded.codec, encoded.json, encoded.binary)
+
+    assert encoded.codec == codec
+    assert (json.loads(decoded) if isinstance(decoded, bytes) else decoded) == PAYLOAD
+
+
+def test_unknown_codec_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown payload codec"):
+        EventStorageCodec.decode(99, None, b"")
@@ -0,0 +1,88 @@
+"""Tests for event hashing and hash format versions."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from uno.events.base_event import (
+    HASH_VERSION,
+    DomainEvent,
+    compute_canonical_hash,
+    uno_json_encoder,
+)
+from uno.events.integrity import verify_since_checkpoint
+
+
+class ItemCreated(DomainEvent):
+    event_type = "item_created"
+    aggregate_id: str
+    name: str
+
+
+def _legacy_stored_event(name: str, previous_hash: str | None = None) -> dict:
+    """An event as stored before hash formats were versioned."""
+    data = ItemCreated(
+        aggregate_id="item-1", name=name, previous_hash=previous_hash
+    ).model_dump(exclude_none=True, exclude_unset=True, by_alias=True)
+    event_hash = hashlib.sha256(
+        json.dumps(data, default=uno_json_encoder).encode()
+    ).hexdigest()
+    return {**data, "event_hash": event_hash}
+
+
+def test_set_event_hash_records_the_hash_version() -> None:
+    event = ItemCreated(aggregate_id="item-1", name="a")
+    expected = event.compute_event_hash()
+
+    event.set_event_hash()
+
+    assert event.hash_version == HASH_VERSION
+    assert event.event_hash == expected
+    assert event.compute_event_hash() == event.event_hash
+    assert compute_canonical_hash(event.canonical_dict()) == event.event_hash
+
+
+def test_hash_survives_a_storage_round_trip() -> None:
+    event = ItemCreated(aggregate_id="item-1", name="a")
+    event.set_event_hash()
+
+    loaded = ItemCreated.model_validate(event.to_dict())
+
+    assert loaded.hash_version == HASH_VERSION
+    assert loaded.compute_event_hash() == event.event_hash
+
+
+def test_build_many_hashes_in_the_current_format() -> None:
+    (event,) = ItemCreated.build_many([{"aggregate_id": "item-1", "name": "a"}])
+
+    assert event.hash_version == HASH_VERSION
+    assert compute_canonical_hash(event.canonical_dict()) == event.event_hash
+
+
+def test_legacy_hashes_still_verify() -> None:
+    first = ItemCreated.model_validate(_legacy_stored_event("a"))
+    second = ItemCreated.model_validate(
+        _legacy_stored_event("b", previous_hash=first.event_hash)
+    )
+
+    assert first.hash_version is None
+    assert first.compute_event_hash() == first.event_hash
+    result = verify_since_checkpoint("item-1", [first, second])
+    assert result.is_success
+    assert result.value.version == 2
+
+
+def test_tampered_legacy_event_fails_verification() -> None:
+    stored = _legacy_stored_event("a")
+    stored["name"] = "tampered"
+
+    result = verify_since_checkpoint("item-1", [ItemCreated.model_validate(stored)])
+
+    assert result.is_failure
+
+
+def test_events_with_dict_fields_are_hashable() -> None:
+    event = ItemCreated(aggregate_id="item-1", name="a", metadata={"source": "api"})
+
+    assert {event, event.model_copy()} == {event}
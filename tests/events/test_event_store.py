@@ -0,0 +1,260 @@
+"""Tests for the in-memory event store."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from uno.events.base_event import DomainEvent
+from uno.events.errors import ConcurrencyConflictError
+from uno.events.event_store import InMemoryEventStore
+
+
+class TaskOpened(DomainEvent):
+    event_type = "task_opened"
+    aggregate_id: str
+    title: str
+
+
+class TaskClosed(DomainEvent):
+    event_type = "task_closed"
+    aggregate_id: str
+
+
+class Heartbeat(DomainEvent):
+    event_type = "heartbeat"
+
+
+@pytest.mark.asyncio
+async def test_save_events_appends_the_batch_in_order(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    batch = [
+        TaskOpened(aggregate_id="task-1", title="a"),
+        TaskOpened(aggregate_id="task-2", title="b"),
+        TaskClosed(aggregate_id="task-1"),
+    ]
+
+    assert (await store.save_events(batch)).is_success
+
+    stored = (await store.get_events()).value
+    assert [event.event_id for event in stored] == [event.event_id for event in batch]
+    assert [event.global_position for event in stored] == [1, 2, 3]
+    task_1 = (await store.get_events_by_aggregate_id("task-1")).value
+    assert [event.event_type for event in task_1] == ["task_opened", "task_closed"]
+
+
+@pytest.mark.asyncio
+async def test_save_events_stores_nothing_if_any_event_is_invalid(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    batch = [TaskOpened(aggregate_id="task-1", title="a"), Heartbeat()]
+
+    result = await store.save_events(batch)
+
+    assert result.is_failure
+    assert (await store.get_events()).value == []
+
+
+@pytest.mark.asyncio
+async def test_stream_envelopes_carries_stream_versions(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    for event in (
+        TaskOpened(aggregate_id="task-1", title="a"),
+        TaskOpened(aggregate_id="task-2", title="b"),
+        TaskClosed(aggregate_id="task-1"),
+    ):
+        assert (await store.save_event(event)).is_success
+
+    envelopes = [
+        envelope async for envelope in store.stream_envelopes(aggregate_id="task-1")
+    ]
+
+    assert [(e.position, e.version, e.event_type) for e in envelopes] == [
+        (1, 1, "task_opened"),
+        (3, 2, "task_closed"),
+    ]
+    assert envelopes[0].materialize().title == "a"
+
+
+@pytest.mark.asyncio
+async def test_envelopes_keep_the_event_hash_verifiable(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    event = TaskOpened(aggregate_id="task-1", title="a")
+    event.set_event_hash()
+    assert (await store.save_event(event)).is_success
+
+    (envelope,) = [envelope async for envelope in store.stream_envelopes()]
+    materialized = envelope.materialize()
+
+    assert materialized.event_hash == event.event_hash
+    assert materialized.compute_event_hash() == event.event_hash
+
+
+@pytest.mark.asyncio
+async def test_save_events_rejects_a_stale_expected_version(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    opened = TaskOpened(aggregate_id="task-1", title="a")
+    assert (await store.save_events([opened], expected_version=0)).is_success
+
+    result = await store.save_events(
+        [TaskClosed(aggregate_id="task-1")], expected_version=0
+    )
+
+    assert result.is_failure
+    assert isinstance(result.error, ConcurrencyConflictError)
+    stored = await store.get_events_by_aggregate_id("task-1")
+    assert [event.event_type for event in stored.value] == ["task_opened"]
+
+
+@pytest.mark.asyncio
+async def test_get_events_for_aggregates_groups_streams(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    assert (
+        await store.save_events(
+            [
+                TaskOpened(aggregate_id="task-1", title="a"),
+                TaskOpened(aggregate_id="task-2", title="b"),
+                TaskClosed(aggregate_id="task-1"),
+            ]
+        )
+    ).is_success
+
+    result = await store.get_events_for_aggregates(["task-1", "task-2", "task-3"])
+
+    assert result.is_success
+    streams = {
+        aggregate_id: [event.event_type for event in events]
+        for aggregate_id, events in result.value.items()
+    }
+    assert streams == {
+        "task-1": ["task_opened", "task_closed"],
+        "task-2": ["task_opened"],
+    }
+
+
+async def _stored(store: InMemoryEventStore) -> list[DomainEvent]:
+    batch = [
+        TaskOpened(aggregate_id="task-1", title="a"),
+        TaskOpened(aggregate_id="task-2", title="b"),
+        TaskClosed(aggregate_id="task-1"),
+        TaskClosed(aggregate_id="task-2"),
+        TaskOpened(aggregate_id="task-3", title="c"),
+    ]
+    assert (await store.save_events(batch)).is_success
+    return batch
+
+
+@pytest.mark.asyncio
+async def test_stream_events_resumes_after_a_position(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    batch = await _stored(store)
+
+    streamed = [event async for event in store.stream_events(from_position=2)]
+
+    assert [event.event_id for event in streamed] == [e.event_id for e in batch[2:]]
+    assert [event.global_position for event in streamed] == [3, 4, 5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "positions"),
+    [
+        ({"aggregate_id": "task-2"}, [2, 4]),
+        ({"event_type": "task_closed"}, [3, 4]),
+        ({"event_type": "TaskOpened"}, [1, 2, 5]),
+        ({"aggregate_id": "task-1", "event_type": "task_closed"}, [3]),
+        ({"aggregate_id": "task-2", "from_position": 2}, [4]),
+        ({"event_type": "task_opened", "from_position": 5}, []),
+    ],
+)
+async def test_stream_events_filters(
+    logger: Any, filters: dict[str, Any], positions: list[int]
+) -> None:
+    store = InMemoryEventStore(logger)
+    await _stored(store)
+
+    streamed = [event async for event in store.stream_events(batch_size=1, **filters)]
+
+    assert [event.global_position for event in streamed] == positions
+
+
+@pytest.mark.asyncio
+async def test_stream_envelopes_filters_and_resumes(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    await _stored(store)
+
+    envelopes = [
+        envelope
+        async for envelope in store.stream_envelopes(
+            from_position=1, event_type="task_opened"
+        )
+    ]
+
+    assert [(e.position, e.aggregate_id, e.version) for e in envelopes] == [
+        (2, "task-2", 1),
+        (5, "task-3", 1),
+    ]
+    assert [e.materialize().title for e in envelopes] == ["b", "c"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("filters", "positions"),
+    [
+        ({"aggregate_id": "task-1"}, [1, 3]),
+        ({"aggregate_id": "task-1", "since_version": 2}, [3]),
+        ({"aggregate_id": "task-1", "since_version": 3}, []),
+        ({"aggregate_id": "task-2", "event_type": "task_closed"}, [4]),
+        ({"event_type": "task_closed"}, [3, 4]),
+        ({"event_type": "TaskOpened"}, [1, 2, 5]),
+        ({"event_type": "task_opened", "since_version": 2}, []),
+        ({"since_version": 2}, [3, 4]),
+        ({"aggregate_id": "task-1", "limit": 1}, [1]),
+        ({"aggregate_id": "task-4"}, []),
+    ],
+)
+async def test_get_events_filters_through_the_indexes(
+    logger: Any, filters: dict[str, Any], positions: list[int]
+) -> None:
+    store = InMemoryEventStore(logger)
+    await _stored(store)
+
+    result = await store.get_events(**filters)
+
+    assert result.is_success
+    assert [event.global_position for event in result.value] == positions
+
+
+@pytest.mark.asyncio
+async def test_get_events_walks_the_type_index_when_it_is_narrower(
+    logger: Any,
+) -> None:
+    store = InMemoryEventStore(logger)
+    await _stored(store)
+    closed = [TaskClosed(aggregate_id="task-3") for _ in range(3)]
+    assert (await store.save_events(closed)).is_success
+
+    opened = await store.get_events(aggregate_id="task-3", event_type="task_opened")
+    reopened = await store.get_events(
+        aggregate_id="task-3", event_type="task_opened", since_version=2
+    )
+    later_closes = await store.get_events(
+        aggregate_id="task-3", event_type="task_closed", since_version=3
+    )
+
+    assert [event.global_position for event in opened.value] == [5]
+    assert reopened.value == []
+    assert [event.global_position for event in later_closes.value] == [7, 8]
+
+
+@pytest.mark.asyncio
+async def test_frozen_events_get_their_global_position_when_saved(
+    logger: Any,
+) -> None:
+    store = InMemoryEventStore(logger)
+    batch = await _stored(store)
+
+    stored = (await store.get_events()).value
+
+    assert [event.global_position for event in batch] == [1, 2, 3, 4, 5]
+    assert all(s is event for s, event in zip(stored, batch, strict=True))
@@ -0,0 +1,199 @@
+"""Tests for checkpointed event stream integrity verification."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import pytest
+
+from uno.errors.result import Success
+from uno.events.base_event import DomainEvent
+from uno.events.errors import EventIntegrityError
+from uno.events.event_store import InMemoryEventStore
+from uno.events.integrity import (
+    BulkStreamVerifier,
+    create_checkpoint,
+    merkle_root,
+    verify_checkpoint,
+    verify_since_checkpoint,
+)
+
+
+class NoteAdded(DomainEvent):
+    event_type = "note_added"
+    aggregate_id: str
+    text: str
+
+
+class Sha512HashService:
+    """A non-default hash service (module level, so worker processes can unpickle it)."""
+
+    def compute_hash(self, payload: str) -> str:
+        return hashlib.sha512(payload.encode("utf-8")).hexdigest()
+
+
+class ArchivedEventStore(InMemoryEventStore):
+    """In-memory store whose streams are all archived: hot-table reads see nothing."""
+
+    async def get_events(self, *args: Any, **kwargs: Any) -> Any:
+        return Success([])
+
+
+def _stream(
+    aggregate_id: str, texts: list[str], hash_service: Any = None
+) -> list[NoteAdded]:
+    events = []
+    previous_hash = None
+    for text in texts:
+        event = NoteAdded(
+            aggregate_id=aggregate_id, text=text, previous_hash=previous_hash
+        )
+        event.set_event_hash(hash_service)
+        previous_hash = event.event_hash
+        events.append(event)
+    return events
+
+
+def _tampered(event: NoteAdded, text: str) -> NoteAdded:
+    """A copy of ``event`` with new content but its original hash."""
+    return NoteAdded.model_validate({**event.to_dict(), "text": text})
+
+
+def test_verify_without_checkpoint_covers_whole_stream() -> None:
+    events = _stream("note-1", ["a", "b", "c"])
+
+    result = verify_since_checkpoint("note-1", events)
+
+    assert result.is_success
+    checkpoint = result.value
+    assert checkpoint.version == 3
+    assert checkpoint.last_event_hash == events[-1].event_hash
+    assert checkpoint.merkle_root == merkle_root([e.event_hash for e in events])
+    assert verify_checkpoint(events, checkpoint)
+
+
+def test_verify_since_checkpoint_extends_it() -> None:
+    events = _stream("note-1", ["a", "b", "c", "d", "e"])
+    checkpoint = create_checkpoint("note-1", events[:3])
+
+    result = verify_since_checkpoint("note-1", events[3:], checkpoint)
+
+    assert result.is_success
+    full = create_checkpoint("note-1", events)
+    assert result.value.version == 5
+    assert result.value.peaks == full.peaks
+    assert result.value.merkle_root == full.merkle_root
+    assert result.value.merkle_root == merkle_root([e.event_hash for e in events])
+
+
+def test_tampered_event_is_detected() -> None:
+    events = _stream("note-1", ["a", "b", "c"])
+    events[1] = _tampered(events[1], "changed")
+
+    result = verify_since_checkpoint("note-1", events)
+
+    assert result.is_failure
+    assert isinstance(result.error, EventIntegrityError)
+
+
+def test_broken_chain_is_detected() -> None:
+    events = _stream("note-1", ["a", "b"])
+    checkpoint = create_checkpoint("note-1", events)
+    # Validly hashed, but chained to a different predecessor
+    stray = NoteAdded(
+        aggregate_id="note-1", text="c", previous_hash=events[0].event_hash
+    )
+    stray.set_event_hash()
+
+    result = verify_since_checkpoint("note-1", [stray], checkpoint)
+
+    assert result.is_failure
+
+
+def test_verify_checkpoint_detects_rewritten_prefix() -> None:
+    events = _stream("note-1", ["a", "b", "c"])
+    checkpoint = create_checkpoint("note-1", events)
+    rewritten = _stream("note-1", ["a", "x", "c"])
+
+    assert verify_checkpoint(events, checkpoint)
+    assert not verify_checkpoint(rewritten, checkpoint)
+    assert not verify_checkpoint(events[:2], checkpoint)
+
+
+def test_custom_hash_service() -> None:
+    hash_service = Sha512HashService()
+    events = _stream("note-1", ["a", "b"], hash_service)
+
+    assert verify_since_checkpoint("note-1", events).is_failure
+    assert verify_since_checkpoint(
+        "note-1", events, hash_service=hash_service
+    ).is_success
+
+
+@pytest.mark.asyncio
+async def test_bulk_verifier_checks_only_events_after_checkpoints(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    first = _stream("note-1", ["a", "b", "c"])
+    second = _stream("note-2", ["x", "y"])
+    for events in (first, second):
+        assert (await store.save_events(events)).is_success
+    checkpoints = {"note-1": create_checkpoint("note-1", first[:2])}
+
+    report = await BulkStreamVerifier(store, max_workers=1).verify(
+        ["note-1", "note-2"], checkpoints
+    )
+
+    assert report.failures == {}
+    assert report.streams == 2
+    assert report.events == 3  # one after the checkpoint, two for note-2
+    assert report.checkpoints["note-1"].version == 3
+    assert report.checkpoints["note-1"].last_event_hash == first[-1].event_hash
+    assert report.checkpoints["note-2"].version == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_verifier_reads_archived_streams(logger: Any) -> None:
+    store = ArchivedEventStore(logger)
+    events = _stream("note-1", ["a", "b", "c"])
+    events[2] = _tampered(events[2], "changed")
+    assert (await store.save_events(events)).is_success
+    checkpoints = {"note-1": create_checkpoint("note-1", events[:1])}
+
+    report = await BulkStreamVerifier(store, max_workers=1).verify(
+        ["note-1"], checkpoints
+    )
+
+    assert report.events == 2
+    assert set(report.failures) == {"note-1"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_verifier_reports_tampered_streams(logger: Any) -> None:
+    store = InMemoryEventStore(logger)
+    good = _stream("note-1", ["a", "b"])
+    bad = _stream("note-2", ["x", "y"])
+    bad[1] = _tampered(bad[1], "z")
+    for events in (good, bad):
+        assert (await store.save_events(events)).is_success
+
+    report = await BulkStreamVerifier(store, max_workers=1).verify(["note-1", "note-2"])
+
+    assert set(report.checkpoints) == {"note-1"}
+    assert set(report.failures) == {"note-2"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_verifier_with_custom_hash_service(logger: Any) -> None:
+    hash_service = Sha512HashService()
+    store = InMemoryEventStore(logger)
+    assert (
+        await store.save_events(_stream("note-1", ["a", "b"], hash_service))
+    ).is_success
+
+    report = await BulkStreamVerifier(
+        store, max_workers=1, hash_service=hash_service
+    ).verify(["note-1"])
+
+    assert report.failures == {}
+    assert report.checkpoints["note-1"].version == 2
@@ -0,0 +1,63 @@
+"""Tests for lazily decoded events."""
+
+from __future__ import annotations
+
+from uno.events.base_event import DomainEvent
+from uno.events.decoding import EventDecoder, LazyEvent
+
+
+class ParcelShipped(DomainEvent):
+    event_type = "parcel_shipped"
+    aggregate_id: str
+    carrier: str
+
+
+def _lazy(decoder: EventDecoder, decoded: list[int]) -> LazyEvent:
+    payload = ParcelShipped(aggregate_id="parcel-1", carrier="ups").model_dump_json()
+
+    def decode_payload() -> str:
+        decoded.append(1)
+        return payload
+
+    return LazyEvent(
+        decoder.get("parcel_shipped", 1),
+        decode_payload,
+        event_type="parcel_shipped",
+        aggregate_id="parcel-1",
+        stream_version=3,
+        global_position=42,
+    )
+
+
+def test_header_is_available_without_decoding() -> None:
+    decoded: list[int] = []
+    event = _lazy(EventDecoder(), decoded)
+
+    assert event.event_type == "parcel_shipped"
+    assert event.aggregate_id == "parcel-1"
+    assert event.stream_version == 3
+    assert event.event_class is ParcelShipped
+    assert not event.is_materialized
+    assert decoded == []
+
+
+def test_lazy_event_does_not_pose_as_a_domain_event() -> None:
+    event = _lazy(EventDecoder(), [])
+
+    assert type(event) is LazyEvent
+    assert not isinstance(event, DomainEvent)
+    assert not event.is_materialized
+
+
+def test_materialize_decodes_once() -> None:
+    decoded: list[int] = []
+    event = _lazy(EventDecoder(), decoded)
+
+    materialized = event.materialize()
+
+    assert type(materialized) is ParcelShipped
+    assert materialized.carrier == "ups"
+    assert materialized.global_position == 42
+    assert event.carrier == "ups"
+    assert event.materialize() is materialized
+    assert decoded == [1]
@@ -0,0 +1,65 @@
+"""Tests for the PostgreSQL event store's table layout."""
+
+from __future__ import annotations
+
+from sqlalchemy import MetaData, Table
+
+from uno.events.postgres_event_store import (
+    EVENTS_TABLE_MIGRATIONS,
+    STREAM_VERSION_CONSTRAINT,
+    PostgresEventStore,
+)
+
+# Columns of the events table before global positions, codecs and schema ids
+ORIGINAL_COLUMNS = {
+    "id",
+    "aggregate_id",
+    "event_type",
+    "version",
+    "payload",
+    "created_at",
+    "event_hash",
+}
+
+
+def _events_table() -> Table:
+    store = PostgresEventStore.__new__(PostgresEventStore)
+    store._metadata = MetaData()
+    return store._create_event_table()
+
+
+def _statement_index(fragment: str) -> int:
+    (index,) = [
+        i
+        for i, statement in enumerate(EVENTS_TABLE_MIGRATIONS)
+        if fragment in statement
+    ]
+    return index
+
+
+def test_migrations_add_every_column_added_to_the_layout() -> None:
+    migrations = " ".join(
+        " ".join(statement.split()) for statement in EVENTS_TABLE_MIGRATIONS
+    )
+
+    for column in set(_events_table().c.keys()) - ORIGINAL_COLUMNS:
+        assert f"ADD COLUMN IF NOT EXISTS {column} " in migrations or (
+            f"ADD COLUMN {column} " in migrations
+        ), column
+
+
+def test_global_position_is_an_identity_column() -> None:
+    position = _events_table().c.global_position
+
+    assert position.identity is not None
+    assert position.unique
+    assert not position.nullable
+
+
+def test_streams_are_renumbered_before_versions_are_made_unique() -> None:
+    backfill = _statement_index("UPDATE events SET event_version = version")
+
+    assert backfill < _statement_index(
+        f"INDEX IF NOT EXISTS {STREAM_VERSION_CONSTRAINT}"
+    )
+    assert _statement_index("ADD COLUMN IF NOT EXISTS global_position") < backfill
@@ -0,0 +1,228 @@
+"""Tests for the event schema registry and its PostgreSQL store."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from uno.events.base_event import DomainEvent
+from uno.events.schema_registry import (
+    EventSchemaRegistry,
+    PostgresEventSchemaStore,
+    compact_length,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class ItemAdded(DomainEvent):
+    event_type = "schema_item_added"
+    aggregate_id: str
+    sku: str
+
+
+class ItemAddedWithQuantity(DomainEvent):
+    """ItemAdded after a field was added without a version bump."""
+
+    event_type = "schema_item_added"
+    aggregate_id: str
+    sku: str
+    quantity: int = 1
+
+
+class ItemRemoved(DomainEvent):
+    event_type = "schema_item_removed"
+    aggregate_id: str
+
+
+SCHEMAS_DDL = """
+CREATE TABLE event_schemas (
+    type_id SMALLINT NOT NULL,
+    version INTEGER NOT NULL,
+    event_type TEXT NOT NULL,
+    fields JSON NOT NULL,
+    PRIMARY KEY (type_id, version),
+    UNIQUE (event_type, version)
+)
+"""
+
+
+class SQLiteSession:
+    """Stands in for an AsyncSession over a sync SQLite Session."""
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+        self.info = session.info
+
+    async def execute(self, stmt: Any) -> Any:
+        return self.sync_session.execute(stmt)
+
+    async def commit(self) -> None:
+        self.sync_session.commit()
+
+    async def rollback(self) -> None:
+        self.sync_session.rollback()
+
+
+@pytest.fixture(autouse=True)
+def registry() -> Iterator[None]:
+    EventSchemaRegistry.clear()
+    yield
+    EventSchemaRegistry.clear()
+
+
+@pytest.fixture
+def engine() -> Any:
+    engine = create_engine("sqlite://")
+    with engine.begin() as connection:
+        connection.execute(text(SCHEMAS_DDL))
+    return engine
+
+
+@pytest.fixture
+def session(engine: Any) -> Iterator[SQLiteSession]:
+    with Session(engine) as session:
+        yield SQLiteSession(session)
+
+
+def _stored(engine: Any) -> list[tuple[int, int, str]]:
+    with engine.connect() as connection:
+        return [
+            tuple(row)
+            for row in connection.execute(
+                text("SELECT type_id, version, event_type FROM event_schemas")
+            )
+        ]
+
+
+def test_compact_payloads_round_trip() -> None:
+    schema = EventSchemaRegistry.register(ItemAdded)
+    event = ItemAdded(aggregate_id="cart-1", sku="A-1")
+
+    data = EventSchemaRegistry.encode(schema, event.canonical_dict())
+
+    assert data is not None
+    assert compact_length(data) == len(schema.fields)
+    assert (
+        EventSchemaRegistry.decode(schema.type_id, schema.version, data)
+        == event.canonical_dict()
+    )
+
+
+def test_encode_falls_back_for_keys_outside_the_layout() -> None:
+    schema = EventSchemaRegistry.register(ItemAdded)
+
+    assert EventSchemaRegistry.encode(schema, {"sku": "A-1", "unknown": 1}) is None
+
+
+def test_decode_rejects_payloads_longer_than_the_layout() -> None:
+    extended = EventSchemaRegistry.register(ItemAddedWithQuantity)
+    data = EventSchemaRegistry.encode(
+        extended, {"aggregate_id": "cart-1", "sku": "A-1", "quantity": 2}
+    )
+    # The layout as cached before another process appended "quantity"
+    EventSchemaRegistry.add(
+        extended.model_copy(update={"fields": extended.fields[:-1]})
+    )
+
+    assert not EventSchemaRegistry.covers(extended.type_id, 1, data)
+    with pytest.raises(ValueError, match="values but the layout"):
+        EventSchemaRegistry.decode(extended.type_id, 1, data)
+
+
+def test_extended_layouts_still_decode_shorter_rows() -> None:
+    schema = EventSchemaRegistry.register(ItemAdded)
+    event = ItemAdded(aggregate_id="cart-1", sku="A-1")
+    data = EventSchemaRegistry.encode(schema, event.canonical_dict())
+
+    extended = EventSchemaRegistry.register(ItemAddedWithQuantity)
+
+    assert extended.type_id == schema.type_id
+    assert extended.fields == (*schema.fields, "quantity")
+    assert (
+        EventSchemaRegistry.decode(schema.type_id, schema.version, data)
+        == event.canonical_dict()
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_registers_ids_once_committed(
+    engine: Any, session: SQLiteSession
+) -> None:
+    store = PostgresEventSchemaStore()
+
+    added = await store.ensure(session, ItemAdded, 1)
+    removed = await store.ensure(session, ItemRemoved, 1)
+
+    assert (added.type_id, removed.type_id) == (1, 2)
+    assert await store.ensure(session, ItemAdded, 1) == added
+    assert EventSchemaRegistry.lookup("schema_item_added", 1) is None
+
+    await session.commit()
+
+    assert EventSchemaRegistry.lookup("schema_item_added", 1) == added
+    assert EventSchemaRegistry.get(2, 1) == removed
+    assert sorted(_stored(engine)) == [
+        (1, 1, "schema_item_added"),
+        (2, 1, "schema_item_removed"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ensure_extends_a_stored_layout(session: SQLiteSession) -> None:
+    store = PostgresEventSchemaStore()
+    schema = await store.ensure(session, ItemAdded, 1)
+    await session.commit()
+
+    extended = await store.ensure(session, ItemAddedWithQuantity, 1)
+    await session.commit()
+
+    assert extended.type_id == schema.type_id
+    assert extended.fields == (*schema.fields, "quantity")
+    assert EventSchemaRegistry.get(schema.type_id, 1) == extended
+
+
+@pytest.mark.asyncio
+async def test_a_rolled_back_registration_is_not_cached(
+    engine: Any, session: SQLiteSession
+) -> None:
+    store = PostgresEventSchemaStore()
+    schema = await store.ensure(session, ItemAdded, 1)
+    await session.commit()
+
+    await store.ensure(session, ItemRemoved, 1)
+    await store.ensure(session, ItemAddedWithQuantity, 1)
+    await session.rollback()
+
+    assert EventSchemaRegistry.type_id("schema_item_removed") is None
+    assert EventSchemaRegistry.get(schema.type_id, 1) == schema
+    assert _stored(engine) == [(1, 1, "schema_item_added")]
+    # The next transaction registers afresh
+    removed = await store.ensure(session, ItemRemoved, 1)
+    await session.commit()
+    assert EventSchemaRegistry.get(removed.type_id, 1) == removed
+
+
+@pytest.mark.asyncio
+async def test_ensure_loaded_reloads_layouts_extended_elsewhere(
+    engine: Any, session: SQLiteSession
+) -> None:
+    store = PostgresEventSchemaStore()
+    schema = await store.ensure(session, ItemAdded, 1)
+    await session.commit()
+    # Another process extends the layout and writes a longer row
+    with Session(engine) as other:
+        extended = await store.ensure(SQLiteSession(other), ItemAddedWithQuantity, 1)
+        other.commit()
+    EventSchemaRegistry.add(schema)
+    data = EventSchemaRegistry.encode(
+        extended, {"aggregate_id": "cart-1", "sku": "A-1", "quantity": 2}
+    )
+
+    await store.ensure_loaded(session, [(schema.type_id, 1, data)])
+
+    assert EventSchemaRegistry.decode(schema.type_id, 1, data)["quantity"] == 2
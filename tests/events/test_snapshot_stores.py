@@ -0,0 +1,307 @@
+"""Tests for the snapshot stores."""
+
+from __future__ import annotations
+
+import json
+import os
+import stat
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert
+
+from uno.domain.aggregate import AggregateRoot
+from uno.events.deleted_event import DeletedEvent
+from uno.events.snapshots import (
+    FileSystemSnapshotStore,
+    InMemorySnapshotStore,
+    PostgresSnapshotStore,
+    SnapshotStore,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from sqlalchemy import Connection
+
+
+class Account(AggregateRoot[str]):
+    balance: int = 0
+
+
+class SQLiteSnapshotSession:
+    """
+    Stands in for an AsyncSession on an in-memory SQLite database. Snapshot
+    upserts are replayed from their bound parameters (ON CONFLICT ... DO
+    UPDATE is PostgreSQL syntax); selects, the retention delete and the
+    store's DDL run as compiled, so ordering, bounds and pruning are the real
+    statements. Like a session, it discards what it did not commit on exit.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        self._connection = connection
+
+    async def __aenter__(self) -> SQLiteSnapshotSession:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self._connection.rollback()
+
+    def connection(self) -> Connection:
+        return self._connection
+
+    async def run_sync(self, fn: Any) -> Any:
+        # Doubles as the sync session: fn only needs connection()
+        return fn(self)
+
+    async def commit(self) -> None:
+        self._connection.commit()
+
+    async def execute(self, stmt: Any) -> Any:
+        if not isinstance(stmt, Insert):
+            return self._connection.execute(stmt)
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        rows: dict[str, dict[str, Any]] = {}
+        for key, value in params.items():
+            column, _, row = key.rpartition("_m")
+            rows.setdefault(row, {})[column] = value
+        for row in rows.values():
+            self._connection.execute(
+                text(
+                    "INSERT OR REPLACE INTO snapshots VALUES "
+                    "(:aggregate_id, :version, :aggregate_type, :created_at, :data)"
+                ),
+                {
+                    **row,
+                    "created_at": row["created_at"].isoformat(" "),
+                    "data": json.dumps(row["data"]),
+                },
+            )
+        return None
+
+
+@pytest.fixture
+def sqlite_connection() -> Iterator[Connection]:
+    engine = create_engine("sqlite://")
+
+    # pysqlite commits before DDL on its own; take over transactions so that
+    # CREATE TABLE rolls back as it does in PostgreSQL
+    @event.listens_for(engine, "connect")
+    def _connect(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    with engine.connect() as connection:
+        yield connection
+
+
+def _postgres_store(
+    logger: Any, connection: Connection, **kwargs: Any
+) -> PostgresSnapshotStore:
+    return PostgresSnapshotStore(
+        logger, lambda: SQLiteSnapshotSession(connection), **kwargs
+    )
+
+
+@pytest.fixture(params=["memory", "filesystem", "postgres"])
+def store(
+    request: pytest.FixtureRequest,
+    logger: Any,
+    tmp_path: Path,
+    sqlite_connection: Connection,
+) -> SnapshotStore:
+    if request.param == "memory":
+        return InMemorySnapshotStore(logger)
+    if request.param == "filesystem":
+        return FileSystemSnapshotStore(logger, snapshot_dir=str(tmp_path))
+    return _postgres_store(logger, sqlite_connection)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(store: SnapshotStore) -> None:
+    account = Account(id="acc-1", balance=5)
+    account.version = 3
+
+    assert (await store.save_snapshot(account)).is_success
+    result = await store.get_snapshot("acc-1", Account)
+
+    assert result.is_success
+    assert result.value is not None
+    assert result.value.balance == 5
+    assert result.value.version == 3
+    assert not result.value.is_deleted
+
+
+@pytest.mark.asyncio
+async def test_snapshot_keeps_deleted_flag(store: SnapshotStore) -> None:
+    account = Account(id="acc-1", balance=5)
+    account.add_event(DeletedEvent(aggregate_id="acc-1"))
+    assert account.is_deleted
+
+    assert (await store.save_snapshot(account)).is_success
+    result = await store.get_snapshot("acc-1", Account)
+
+    assert result.is_success
+    assert result.value is not None
+    assert result.value.is_deleted
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_keeps_tables_created_by_a_read(
+    logger: Any, sqlite_connection: Connection
+) -> None:
+    store = _postgres_store(logger, sqlite_connection)
+
+    # Reads never commit: the tables must outlive their session anyway
+    assert (await store.get_snapshot("acc-1", Account)).value is None
+    assert (await store.get_checkpoint("acc-1")).value is None
+    await _save_versions(store, "acc-1", range(1, 3))
+
+    assert _stored_versions(sqlite_connection) == {"acc-1": [1, 2]}
+
+
+async def _save_versions(
+    store: PostgresSnapshotStore, aggregate_id: str, versions: range
+) -> None:
+    for version in versions:
+        account = Account(id=aggregate_id, balance=version)
+        account.version = version
+        assert (await store.save_snapshot(account)).is_success
+
+
+def _stored_versions(connection: Connection) -> dict[str, list[int]]:
+    versions: dict[str, list[int]] = {}
+    for aggregate_id, version in connection.execute(
+        text("SELECT aggregate_id, version FROM snapshots ORDER BY 1, 2")
+    ):
+        versions.setdefault(aggregate_id, []).append(version)
+    return versions
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_keeps_the_newest_snapshots_per_aggregate(
+    logger: Any, sqlite_connection: Connection
+) -> None:
+    store = _postgres_store(logger, sqlite_connection, keep_last=2)
+    await _save_versions(store, "acc-1", range(1, 6))
+    await _save_versions(store, "acc-2", range(1, 3))
+
+    assert _stored_versions(sqlite_connection) == {
+        "acc-1": [4, 5],
+        "acc-2": [1, 2],
+    }
+    pruned = await store.get_snapshot("acc-1", Account, max_version=3)
+    assert pruned.is_success
+    assert pruned.value is None
+    kept = await store.get_snapshot("acc-1", Account, max_version=4)
+    assert kept.value.balance == 4
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_prunes_each_aggregate_in_a_batch(
+    logger: Any, sqlite_connection: Connection
+) -> None:
+    store = _postgres_store(logger, sqlite_connection, keep_last=1)
+    await _save_versions(store, "acc-1", range(1, 3))
+    batch = []
+    for aggregate_id in ("acc-1", "acc-2"):
+        account = Account(id=aggregate_id)
+        account.version = 3
+        batch.append(account)
+
+    assert (await store.save_snapshots(batch)).is_success
+
+    assert _stored_versions(sqlite_connection) == {"acc-1": [3], "acc-2": [3]}
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_without_retention_keeps_every_version(
+    logger: Any, sqlite_connection: Connection
+) -> None:
+    store = _postgres_store(logger, sqlite_connection, keep_last=None)
+    await _save_versions(store, "acc-1", range(1, 6))
+
+    assert _stored_versions(sqlite_connection) == {"acc-1": [1, 2, 3, 4, 5]}
+
+
+def test_postgres_store_rejects_an_empty_retention(logger: Any) -> None:
+    with pytest.raises(ValueError, match="keep_last"):
+        PostgresSnapshotStore(logger, lambda: None, keep_last=0)
+
+
+@pytest.fixture
+def fs_store(logger: Any, tmp_path: Path) -> FileSystemSnapshotStore:
+    return FileSystemSnapshotStore(logger, snapshot_dir=str(tmp_path / "snapshots"))
+
+
+@pytest.mark.asyncio
+async def test_fs_snapshot_files_use_the_umask_mode(
+    fs_store: FileSystemSnapshotStore,
+) -> None:
+    assert (await fs_store.save_snapshot(Account(id="acc-1"))).is_success
+
+    path = fs_store._get_snapshot_path("acc-1")
+    assert stat.S_IMODE(path.stat().st_mode) == fs_store.file_mode
+    umask = os.umask(0)
+    os.umask(umask)
+    assert fs_store.file_mode == 0o666 & ~umask
+
+
+@pytest.mark.asyncio
+async def test_fs_snapshot_writes_leave_no_temporary_files(
+    fs_store: FileSystemSnapshotStore,
+) -> None:
+    for balance in range(3):
+        account = Account(id="acc-1", balance=balance)
+        assert (await fs_store.save_snapshot(account)).is_success
+
+    files = [p for p in fs_store.snapshot_dir.rglob("*") if p.is_file()]
+    assert files == [fs_store._get_snapshot_path("acc-1")]
+    result = await fs_store.get_snapshot("acc-1", Account)
+    assert result.value.balance == 2
+
+
+@pytest.mark.asyncio
+async def test_fs_failed_write_keeps_the_previous_snapshot(
+    fs_store: FileSystemSnapshotStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert (await fs_store.save_snapshot(Account(id="acc-1", balance=1))).is_success
+
+    def fail_replace(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    result = await fs_store.save_snapshot(Account(id="acc-1", balance=2))
+    monkeypatch.undo()
+
+    assert result.is_failure
+    loaded = await fs_store.get_snapshot("acc-1", Account)
+    assert loaded.value.balance == 1
+    path = fs_store._get_snapshot_path("acc-1")
+    assert list(path.parent.iterdir()) == [path]
+
+
+@pytest.mark.asyncio
+async def test_fs_snapshot_write_syncs_file_and_directory(
+    fs_store: FileSystemSnapshotStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    synced: list[bool] = []
+    fsync = os.fsync
+
+    def recording_fsync(fd: int) -> None:
+        synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+        fsync(fd)
+
+    # The first write also creates (and syncs) the shard directories
+    assert (await fs_store.save_snapshot(Account(id="acc-1"))).is_success
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    assert (await fs_store.save_snapshot(Account(id="acc-1"))).is_success
+
+    # The file before the rename, then the directory holding it
+    assert synced == [False, True]
@@ -0,0 +1,78 @@
+"""Tests for the snapshot strategies."""
+
+from __future__ import annotations
+
+import pytest
+
+from uno.events.snapshots import (
+    AdaptiveSnapshotStrategy,
+    CompositeSnapshotStrategy,
+    EventCountSnapshotStrategy,
+)
+
+
+@pytest.mark.asyncio
+async def test_event_count_strategy() -> None:
+    strategy = EventCountSnapshotStrategy(threshold=10)
+
+    assert not await strategy.should_snapshot("acc-1", 9)
+    assert await strategy.should_snapshot("acc-1", 10)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_strategy_snapshots_expensive_aggregates() -> None:
+    strategy = AdaptiveSnapshotStrategy(latency_budget=0.05, fallback_threshold=None)
+    # 1ms per event: 50 events fit the budget, 60 do not
+    strategy.record_replay("acc-1", "Account", 100, 0.1)
+
+    assert strategy.expected_replay_time("acc-1", 60) == pytest.approx(0.06)
+    assert not await strategy.should_snapshot("acc-1", 50)
+    assert await strategy.should_snapshot("acc-1", 60)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_strategy_uses_the_moving_average_per_type() -> None:
+    strategy = AdaptiveSnapshotStrategy(latency_budget=1.0, smoothing=0.5)
+    strategy.record_replay("acc-1", "Account", 10, 0.01)
+    strategy.record_replay("acc-2", "Account", 10, 0.03)
+
+    # Average of 1ms and 3ms per event, shared by every Account
+    assert strategy.expected_replay_time("acc-1", 100) == pytest.approx(0.2)
+    assert strategy.expected_replay_time("acc-2", 100) == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_strategy_falls_back_for_unmeasured_aggregates() -> None:
+    strategy = AdaptiveSnapshotStrategy(fallback_threshold=20)
+
+    assert strategy.expected_replay_time("new", 50) is None
+    assert not await strategy.should_snapshot("new", 19)
+    assert await strategy.should_snapshot("new", 20)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_strategy_falls_back_for_evicted_aggregates() -> None:
+    strategy = AdaptiveSnapshotStrategy(
+        latency_budget=10.0, max_tracked=1, fallback_threshold=20
+    )
+    strategy.record_replay("acc-1", "Account", 10, 0.001)
+    strategy.record_replay("acc-2", "Account", 10, 0.001)
+
+    # acc-1 was evicted; cheap acc-2 stays within the budget
+    assert strategy.expected_replay_time("acc-1", 20) is None
+    assert await strategy.should_snapshot("acc-1", 20)
+    assert not await strategy.should_snapshot("acc-2", 20)
+
+
+@pytest.mark.asyncio
+async def test_composite_strategy_forwards_replay_measurements() -> None:
+    adaptive = AdaptiveSnapshotStrategy(latency_budget=0.05, fallback_threshold=None)
+    strategy = CompositeSnapshotStrategy(
+        [EventCountSnapshotStrategy(threshold=1000), adaptive]
+    )
+
+    strategy.record_replay("acc-1", "Account", 10, 0.01)
+
+    assert adaptive.expected_replay_time("acc-1", 10) == pytest.approx(0.01)
+    assert await strategy.should_snapshot("acc-1", 100)
+    assert not await strategy.should_snapshot("acc-1", 5)
@@ -0,0 +1,127 @@
+"""Tests for the background snapshot worker."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from uno.domain.aggregate import AggregateRoot
+from uno.events.base_event import DomainEvent
+from uno.events.event_store import InMemoryEventStore
+from uno.events.snapshots import InMemorySnapshotStore, SnapshotWorker
+
+
+class Deposited(DomainEvent):
+    event_type = "worker_deposited"
+    aggregate_id: str
+    amount: int
+
+
+class Account(AggregateRoot[str]):
+    balance: int = 0
+
+    def apply_worker_deposited(self, event: Deposited) -> None:
+        self.balance += event.amount
+
+
+@pytest.fixture
+def event_store(logger: Any) -> InMemoryEventStore:
+    return InMemoryEventStore(logger)
+
+
+@pytest.fixture
+def snapshot_store(logger: Any) -> InMemorySnapshotStore:
+    return InMemorySnapshotStore(logger)
+
+
+async def _deposit(store: InMemoryEventStore, aggregate_id: str, *amounts: int) -> None:
+    events = [Deposited(aggregate_id=aggregate_id, amount=amount) for amount in amounts]
+    assert (await store.save_events(events)).is_success
+
+
+async def _snapshot(store: InMemorySnapshotStore, aggregate_id: str) -> Account | None:
+    result = await store.get_snapshot(aggregate_id, Account)
+    assert result.is_success
+    return result.value
+
+
+@pytest.mark.asyncio
+async def test_offers_for_one_aggregate_coalesce_into_one_snapshot(
+    event_store: InMemoryEventStore, snapshot_store: InMemorySnapshotStore, logger: Any
+) -> None:
+    worker = SnapshotWorker(snapshot_store, event_store, logger)
+    await _deposit(event_store, "acc-1", 1, 2, 4)
+
+    assert worker.offer(Account, "acc-1", 1)
+    assert worker.offer(Account, "acc-1", 3)
+    assert worker.offer(Account, "acc-1", 2)
+    assert (worker.metrics.hints_coalesced, worker.metrics.pending) == (2, 1)
+
+    await worker.flush()
+
+    snapshot = await _snapshot(snapshot_store, "acc-1")
+    assert (snapshot.balance, snapshot.version) == (7, 3)
+    assert worker.metrics.snapshots_written == 1
+    assert worker.metrics.batches_written == 1
+    assert worker.metrics.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_hints_covered_by_a_stored_snapshot_are_skipped(
+    event_store: InMemoryEventStore, snapshot_store: InMemorySnapshotStore, logger: Any
+) -> None:
+    worker = SnapshotWorker(snapshot_store, event_store, logger)
+    await _deposit(event_store, "acc-1", 1, 2)
+    worker.offer(Account, "acc-1", 2)
+    await worker.flush()
+
+    worker.offer(Account, "acc-1", 2)
+    await worker.flush()
+
+    assert worker.metrics.snapshots_written == 1
+    assert worker.metrics.snapshots_skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_a_full_queue_drops_hints_for_new_aggregates(
+    event_store: InMemoryEventStore, snapshot_store: InMemorySnapshotStore, logger: Any
+) -> None:
+    worker = SnapshotWorker(snapshot_store, event_store, logger, max_pending=1)
+    await _deposit(event_store, "acc-1", 1)
+    await _deposit(event_store, "acc-2", 1)
+
+    assert worker.offer(Account, "acc-1", 1)
+    assert not worker.offer(Account, "acc-2", 1)
+    # A hint for an aggregate already queued is merged, not dropped
+    assert worker.offer(Account, "acc-1", 1)
+    assert worker.metrics.hints_received == 3
+    assert worker.metrics.hints_dropped == 1
+
+    await worker.flush()
+
+    assert await _snapshot(snapshot_store, "acc-1") is not None
+    assert await _snapshot(snapshot_store, "acc-2") is None
+    assert worker.offer(Account, "acc-2", 1)
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_hints_in_batches(
+    event_store: InMemoryEventStore, snapshot_store: InMemorySnapshotStore, logger: Any
+) -> None:
+    worker = SnapshotWorker(snapshot_store, event_store, logger, batch_size=2)
+    aggregate_ids = ["acc-1", "acc-2", "acc-3"]
+    for aggregate_id in aggregate_ids:
+        await _deposit(event_store, aggregate_id, 5)
+
+    worker.start()
+    assert worker.running
+    for aggregate_id in aggregate_ids:
+        worker.offer(Account, aggregate_id, 1)
+    await worker.stop()
+
+    assert not worker.running
+    for aggregate_id in aggregate_ids:
+        assert (await _snapshot(snapshot_store, aggregate_id)).balance == 5
+    assert worker.metrics.snapshots_written == 3
+    assert worker.metrics.batches_written == 2